@@ -1,13 +1,21 @@
 """
 Toolkit Generation API
 """
+import asyncio
+import json
 import logging
-from typing import Optional, List
-from fastapi import APIRouter, HTTPException, Query
+from typing import Any, AsyncIterator, Optional
+from fastapi import APIRouter, Header, HTTPException, Query
+from fastapi.responses import Response, StreamingResponse
 from pydantic import BaseModel, Field
 
 from app.services.toolkit_generator import toolkit_generator
 from app.services.gemini_service import gemini_service
+from app.services.tool_suggester import tool_suggester
+from app.database.toolkit_store import StoredToolkit, etag_matches, toolkit_store
+from app.models import ToolkitResponse
+from app.config import settings
+from app.data.taxonomy import PROFESSIONS, HOBBIES
 
 logger = logging.getLogger(__name__)
 router = APIRouter()
@@ -22,52 +30,6 @@ class GenerateRequest(BaseModel):
     use_ai: bool = Field(True, description="Whether to use AI generation")
 
 
-class WorkTool(BaseModel):
-    """Work mode tool"""
-    name: str
-    logo: str
-    logoUrl: Optional[str] = None  # Actual logo image URL
-    rating: float
-    description: str
-    ctaText: str
-    category: str
-    price: float
-    url: Optional[str] = None  # Tool website URL for redirection
-
-
-class LifeTool(BaseModel):
-    """Life mode tool"""
-    name: str
-    description: str
-    backgroundImage: str
-    url: Optional[str] = None  # Tool website URL for redirection
-
-
-class ToolkitSpecs(BaseModel):
-    """Toolkit specifications"""
-    totalTools: int
-    monthlyCost: float
-    primaryGoal: str
-    freeTools: int
-    paidTools: int
-
-
-class ToolkitResponse(BaseModel):
-    """Complete toolkit response"""
-    id: str
-    slug: str
-    userName: str
-    profession: str
-    professionSlug: str
-    lifeContext: str
-    workTools: List[WorkTool]
-    lifeTools: List[LifeTool]
-    specs: ToolkitSpecs
-    description: str
-    longDescription: str
-    createdAt: str
-
-
 class ToolSuggestion(BaseModel):
     """Tool suggestion"""
     name: str
@@ -76,6 +38,7 @@ class ToolSuggestion(BaseModel):
     url: Optional[str] = None
     pricing: str
     relevanceScore: float
+    source: str = "catalog"  # "catalog" or "llm" (not in our catalog)
 
 
 # API Endpoints
@@ -98,10 +61,11 @@ async def generate_toolkit(request: GenerateRequest):
             name=request.name,
             use_ai=request.use_ai
         )
+        stored = toolkit_store.put(toolkit, request.hobby)
         
         logger.info(f"✅ Toolkit generated: {toolkit.get('slug')}")
-        return toolkit
-        
+        return _toolkit_response(stored)
+    
     except Exception as e:
         logger.error(f"❌ Generation failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -120,6 +84,7 @@ class ParseResponse(BaseModel):
     hobbyLabel: str
     name: Optional[str] = None
     confidence: float
+    source: Optional[str] = None  # "local", "llm" or "fallback"
 
 
 @router.post("/parse", response_model=ParseResponse)
@@ -141,7 +106,7 @@ async def parse_input(request: ParseRequest):
         
         logger.info(f"✅ Parsed: {parsed.get('profession')} + {parsed.get('hobby')}")
         return parsed
-        
+    
     except Exception as e:
         logger.error(f"❌ Parse failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -156,30 +121,116 @@ async def smart_generate(request: ParseRequest):
     1. AI parses the input to extract profession + hobby
     2. Generates personalized toolkit based on parsed intent
     
+    A plausible local guess of the pair is assembled while the AI parses
+    and used when the parse agrees (see ToolkitGenerator.generate_from_input).
+    
     Example input: "I am a Product Manager who loves hiking"
     """
     try:
         logger.info(f"🚀 Smart generate: {request.input[:50]}...")
         
-        # Step 1: Parse intent
-        parsed = await gemini_service.parse_intent(request.input)
-        
-        # Step 2: Generate toolkit
-        toolkit = await toolkit_generator.generate(
-            profession=parsed.get("profession", "product-manager"),
-            hobby=parsed.get("hobby", "general"),
-            name=parsed.get("name"),
-            use_ai=True
-        )
+        parsed, toolkit = await toolkit_generator.generate_from_input(request.input)
+        stored = toolkit_store.put(toolkit, parsed.get("hobby", "general"))
         
         logger.info(f"✅ Smart generated: {toolkit.get('slug')}")
-        return toolkit
-        
+        return _toolkit_response(stored)
+    
     except Exception as e:
         logger.error(f"❌ Smart generation failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
 
 
+def _toolkit_response(stored: StoredToolkit) -> Response:
+    """A stored toolkit's canonical body, the bytes GET /api/toolkit/{slug} serves, with its ETag"""
+    return Response(content=stored.body, media_type="application/json", headers={"ETag": stored.etag})
+
+
+def _sse_event(event: str, data: Any) -> str:
+    """Encode a single server-sent event (bytes are taken as encoded JSON)"""
+    payload = data.decode("utf-8") if isinstance(data, bytes) else json.dumps(data, ensure_ascii=False)
+    return f"event: {event}\ndata: {payload}\n\n"
+
+
+@router.post("/smart-generate/stream")
+async def smart_generate_stream(request: ParseRequest):
+    """
+    Streaming version of smart-generate (Server-Sent Events)
+    
+    Pushes each stage as soon as it finishes:
+    1. `intent_delta` - raw LLM text chunks while the intent is being parsed
+    2. `intent` - the parsed profession + hobby
+    3. `work_tools` - work mode tools for the profession
+    4. `life_tools` - life mode tools for the hobby
+    5. `toolkit` - the complete toolkit (same shape as /smart-generate)
+    
+    On failure a single `error` event is sent and the stream ends.
+    """
+    logger.info(f"🚀 Smart generate (stream): {request.input[:50]}...")
+    
+    async def event_stream() -> AsyncIterator[str]:
+        try:
+            # Step 1: Parse intent, forwarding chunks as they arrive
+            parsed = {}
+            async for event, payload in gemini_service.stream_parse_intent(request.input):
+                if event == "delta":
+                    yield _sse_event("intent_delta", {"text": payload})
+                else:
+                    parsed = payload
+                    yield _sse_event("intent", parsed)
+            
+            profession = parsed.get("profession", "product-manager")
+            hobby = parsed.get("hobby", "general")
+            
+            # Steps 2 + 3: work and life tools are fetched concurrently but
+            # emitted in order
+            failed = set()
+            life_task = asyncio.ensure_future(toolkit_generator.get_life_tools(hobby, failed))
+            try:
+                work_tools = await toolkit_generator.get_work_tools(profession, failed)
+                yield _sse_event("work_tools", {"workTools": work_tools})
+                
+                life_tools = await life_task
+                yield _sse_event("life_tools", {"lifeTools": life_tools})
+            finally:
+                life_task.cancel()
+            
+            # Step 4: Complete toolkit
+            toolkit = toolkit_generator.build_toolkit(
+                profession, hobby, parsed.get("name"), work_tools, life_tools, fallback=bool(failed)
+            )
+            stored = toolkit_store.put(toolkit, hobby)
+            logger.info(f"✅ Smart generated (stream): {toolkit.get('slug')}")
+            yield _sse_event("toolkit", stored.body)
+        
+        except Exception as e:
+            logger.error(f"❌ Smart generation stream failed: {e}")
+            yield _sse_event("error", {"detail": str(e)})
+    
+    return StreamingResponse(
+        event_stream(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
+@router.get("/toolkit/{slug}", response_model=ToolkitResponse)
+async def get_toolkit(slug: str, if_none_match: Optional[str] = Header(None)):
+    """
+    Get a previously generated toolkit by its slug
+    
+    Served from the toolkit store, without generating again. Responses carry
+    a strong ETag; a matching If-None-Match gets 304 Not Modified.
+    """
+    stored = await toolkit_store.get(slug)
+    if stored is None:
+        raise HTTPException(status_code=404, detail=f"Toolkit '{slug}' not found")
+    
+    headers = {"ETag": stored.etag, "Cache-Control": settings.TOOLKIT_CACHE_CONTROL}
+    if etag_matches(if_none_match, stored.etag):
+        return Response(status_code=304, headers=headers)
+    return Response(content=stored.body, media_type="application/json", headers=headers)
+
+
 @router.get("/suggest")
 async def suggest_tools(
     query: str = Query(..., description="Search query or use case"),
@@ -189,18 +240,21 @@ async def suggest_tools(
     """
     Get AI tool suggestions based on a query
     
+    Answered from the tool catalog; Gemini only fills in when too few
+    catalog tools are relevant.
+    
     - **query**: Description of what you need (e.g., "AI for writing blog posts")
     - **category**: Optional category filter
     - **limit**: Maximum number of suggestions (1-20)
     """
     try:
-        suggestions = await gemini_service.suggest_tools(
+        suggestions = await tool_suggester.suggest(
             query=query,
             category=category,
             limit=limit
         )
         return {"suggestions": suggestions}
-        
+    
     except Exception as e:
         logger.error(f"❌ Suggestion failed: {e}")
         raise HTTPException(status_code=500, detail=str(e))
@@ -211,21 +265,7 @@ async def list_professions():
     """
     Get list of supported professions
     """
-    professions = [
-        {"id": "product-manager", "label": "Product Manager", "icon": "inventory_2", "toolCount": 24},
-        {"id": "developer", "label": "Software Developer", "icon": "code", "toolCount": 32},
-        {"id": "designer", "label": "UX Designer", "icon": "palette", "toolCount": 28},
-        {"id": "marketer", "label": "Marketing Manager", "icon": "campaign", "toolCount": 26},
-        {"id": "writer", "label": "Content Writer", "icon": "edit_note", "toolCount": 22},
-        {"id": "student", "label": "Student", "icon": "school", "toolCount": 24},
-        {"id": "entrepreneur", "label": "Entrepreneur", "icon": "rocket_launch", "toolCount": 30},
-        {"id": "data-scientist", "label": "Data Scientist", "icon": "analytics", "toolCount": 18},
-        {"id": "sales", "label": "Sales Representative", "icon": "handshake", "toolCount": 20},
-        {"id": "hr-manager", "label": "HR Manager", "icon": "groups", "toolCount": 16},
-        {"id": "finance", "label": "Financial Analyst", "icon": "trending_up", "toolCount": 12},
-        {"id": "customer-support", "label": "Customer Support", "icon": "support_agent", "toolCount": 14},
-    ]
-    return {"professions": professions}
+    return {"professions": PROFESSIONS}
 
 
 @router.get("/hobbies")
@@ -233,17 +273,5 @@ async def list_hobbies():
     """
     Get list of supported hobbies
     """
-    hobbies = [
-        {"id": "hiking", "label": "Hiking", "emoji": "🥾"},
-        {"id": "gaming", "label": "Gaming", "emoji": "🎮"},
-        {"id": "cooking", "label": "Cooking", "emoji": "🍳"},
-        {"id": "reading", "label": "Reading", "emoji": "📚"},
-        {"id": "fitness", "label": "Fitness", "emoji": "💪"},
-        {"id": "traveling", "label": "Traveling", "emoji": "✈️"},
-        {"id": "coding", "label": "Coding", "emoji": "💻"},
-        {"id": "photography", "label": "Photography", "emoji": "📸"},
-        {"id": "music", "label": "Music", "emoji": "🎵"},
-        {"id": "art", "label": "Art & Design", "emoji": "🎨"},
-    ]
-    return {"hobbies": hobbies}
+    return {"hobbies": HOBBIES}
 
@@ -3,6 +3,11 @@ Health Check API
 """
 from fastapi import APIRouter
 from app.config import settings
+from app.services.gemini_service import gemini_service
+from app.database.tools_repository import tools_repository
+from app.database.toolkit_store import toolkit_store
+from app.services.toolkit_generator import toolkit_generator
+from app.services.tool_suggester import tool_suggester
 
 router = APIRouter()
 
@@ -24,13 +29,29 @@ async def readiness_check():
     """
     Readiness check - verifies all dependencies are available
     """
-    # TODO: Add database and external service checks
+    # TODO: Add database checks
+    breaker = gemini_service.breaker.stats
+    gemini_ok = breaker["state"] != "open"
     return {
-        "status": "ready",
+        "status": "ready" if gemini_ok else "degraded",
         "gemini_model": settings.GEMINI_MODEL,
         "services": {
             "api": True,
-            "gemini": True,  # Will be checked in generate service
-        }
+            "gemini": gemini_ok,
+        },
+        "circuit_breaker": breaker,
     }
 
+
+@router.get("/health/metrics")
+async def metrics():
+    """
+    Runtime metrics (per worker process)
+    """
+    return {
+        "gemini": gemini_service.stats,
+        "database": tools_repository.stats,
+        "toolkit_store": toolkit_store.stats,
+        "toolkit": toolkit_generator.stats,
+        "suggest": tool_suggester.stats,
+    }
@@ -31,7 +31,79 @@ class Settings(BaseSettings):
     
     # API Settings
     API_TIMEOUT: int = 60  # Increased timeout for AI generation
-    MAX_RETRIES: int = 3
+    MAX_RETRIES: int = 3  # Retries for transient Gemini errors (429, 5xx, resets, timeouts)
+    RETRY_BASE_DELAY: float = 0.5  # seconds, doubled per retry (full jitter)
+    RETRY_MAX_DELAY: float = 8.0  # seconds
+    RETRY_BUDGET: float = 60.0  # Total seconds for all attempts of one call, incl. backoff
+    
+    # Circuit breaker around Gemini (instant local fallback while open)
+    GEMINI_BREAKER_FAILURE_RATE: float = 0.5  # Open when >= 50% of recent calls fail
+    GEMINI_BREAKER_WINDOW: int = 20  # Sliding window of recent calls
+    GEMINI_BREAKER_MIN_CALLS: int = 5  # Calls needed before the rate is evaluated
+    GEMINI_BREAKER_OPEN_SECONDS: float = 30.0  # How long to stay open before probing
+    GEMINI_BREAKER_HALF_OPEN_CALLS: int = 1  # Concurrent probe calls while half-open
+    
+    # Gemini HTTP connection pool (one shared session per worker)
+    GEMINI_POOL_SIZE: int = 100  # Max open connections in total
+    GEMINI_POOL_PER_HOST: int = 20  # Max open connections per host
+    GEMINI_KEEPALIVE_TIMEOUT: float = 30.0  # Seconds an idle connection is kept open
+    GEMINI_DNS_CACHE_TTL: int = 300  # Seconds resolved addresses are cached
+    
+    # LLM response cache (in-process, per worker)
+    LLM_CACHE_ENABLED: bool = True
+    LLM_CACHE_TTL: int = 3600  # seconds
+    LLM_CACHE_MAX_ENTRIES: int = 2048
+    LLM_CACHE_MAX_BYTES: int = 8 * 1024 * 1024  # 8 MB of response text
+    LLM_CACHE_DETERMINISTIC_ONLY: bool = True  # Only cache temperature 0.0 calls by default
+    LLM_SINGLE_FLIGHT_ENABLED: bool = True  # Coalesce concurrent identical prompts
+    
+    # Adaptive concurrency limit for outbound Gemini calls (AIMD)
+    GEMINI_CONCURRENCY_INITIAL: int = 10
+    GEMINI_CONCURRENCY_MIN: int = 1
+    GEMINI_CONCURRENCY_MAX: int = 64
+    GEMINI_CONCURRENCY_BACKOFF: float = 0.5  # Multiplicative decrease on 429/5xx/timeouts
+    GEMINI_LATENCY_TOLERANCE: float = 2.0  # Back off when latency > N x smoothed baseline
+    GEMINI_QUEUE_TIMEOUT: float = 10.0  # Max seconds a call waits for a free slot
+    
+    # Local intent parser (skips the LLM for confident matches)
+    LOCAL_PARSE_ENABLED: bool = True
+    LOCAL_PARSE_MIN_CONFIDENCE: float = 0.85
+    
+    # /api/smart-generate: assemble the locally guessed pair while Gemini parses
+    SPECULATIVE_GENERATE_ENABLED: bool = True
+    # intent_parser confidences: 0.95 exact and 0.85 fuzzy (answered locally),
+    # 0.5 ambiguous, 0.4 one slot found (the other defaulted)
+    SPECULATIVE_MIN_CONFIDENCE: float = 0.4  # Local parse confidence needed to speculate
+    
+    # /api/suggest: local catalog first, Gemini only for the missing suggestions
+    SUGGEST_MIN_RELEVANCE: float = 0.5  # Share of query words a catalog tool must match
+    SUGGEST_LLM_ENABLED: bool = True
+    
+    # Toolkit generation: per-stage timeouts (seconds) for concurrent lookups
+    TOOLKIT_WORK_TOOLS_TIMEOUT: float = 3.0
+    TOOLKIT_LIFE_TOOLS_TIMEOUT: float = 3.0
+    TOOLKIT_BACKGROUNDS_TIMEOUT: float = 2.0
+    
+    # Materialized toolkits: bodies precomputed per taxonomy profession x hobby pair
+    TOOLKIT_MATERIALIZE_ENABLED: bool = True
+    
+    # Toolkit body cache for other pairs, keyed on (profession, hobby, catalog digest)
+    TOOLKIT_CACHE_ENABLED: bool = True
+    TOOLKIT_CACHE_TTL: int = 600  # seconds (bounds staleness when the catalog is queried live)
+    TOOLKIT_CACHE_MAX_ENTRIES: int = 1000
+    TOOLKIT_CACHE_MAX_BYTES: int = 8 * 1024 * 1024  # 8 MB of serialized bodies
+    
+    # Deterministic toolkits: id hashed from (profession, hobby, name, catalog digest),
+    # createdAt = catalog update time (needs a snapshot or the fallback catalog)
+    TOOLKIT_DETERMINISTIC: bool = False
+    
+    # Generated toolkits, persisted and served by slug (GET /api/toolkit/{slug})
+    TOOLKIT_STORE: str = "auto"  # "supabase", "sqlite", or "auto" (Supabase when configured)
+    TOOLKIT_SQLITE_PATH: str = "data/toolkits.db"
+    TOOLKIT_STORE_CACHE_TTL: int = 3600  # seconds
+    TOOLKIT_STORE_CACHE_MAX_ENTRIES: int = 4096
+    TOOLKIT_STORE_CACHE_MAX_BYTES: int = 16 * 1024 * 1024  # 16 MB of toolkit JSON
+    TOOLKIT_CACHE_CONTROL: str = "public, max-age=300"
     
     # Rate Limiting
     RATE_LIMIT_REQUESTS: int = 100
@@ -44,6 +116,15 @@ class Settings(BaseSettings):
     # Supabase Configuration
     SUPABASE_URL: str = "https://yyqksparqhxtzememxat.supabase.co"
     SUPABASE_ANON_KEY: str = ""  # Set in .env file (public anon key)
+    SUPABASE_MAX_WORKERS: int = 16  # Threads running blocking supabase-py queries
+    SUPABASE_PROFESSION_RPC: bool = True  # get_profession_tools() (database/migrations/001); table queries if missing
+    SUPABASE_SPECULATIVE_BACKFILL: bool = False  # Without the RPC: query the LLM backfill up front
+    SUPABASE_SEARCH_RPC: bool = True  # search_tools() (database/migrations/002); name ilike query if missing
+    
+    # Catalog snapshot (ai_tools + hobby_backgrounds held in memory)
+    CATALOG_SNAPSHOT_ENABLED: bool = True
+    CATALOG_REFRESH_INTERVAL: float = 300.0  # seconds
+    CATALOG_PAGE_SIZE: int = 1000  # rows per request (PostgREST max-rows)
     
     class Config:
         env_file = ".env"
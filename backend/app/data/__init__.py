@@ -2,6 +2,7 @@
 Data layer for MaxMate
 """
 from app.data.ai_tools_database import ai_tools_service, AITool, AIToolsService
+from app.data.taxonomy import PROFESSIONS, HOBBIES
 
-__all__ = ["ai_tools_service", "AITool", "AIToolsService"]
+__all__ = ["ai_tools_service", "AITool", "AIToolsService", "PROFESSIONS", "HOBBIES"]
 
@@ -10,10 +10,13 @@ Future integration modes:
 4. Paid API - premium integrations
 """
 
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 from dataclasses import dataclass, asdict
 from enum import Enum
 
+from app.data.keyword_matcher import KeywordMatcher
+from app.data.catalog_index import CatalogIndex, TOOL_FIELDS, tool_rank, tool_rating_rank
+
 
 class ToolCategory(str, Enum):
     LLM = "LLM"  # General language models (limit 1-2 per toolkit)
@@ -106,7 +109,7 @@ class AITool:
 # =============================================================================
 
 AI_TOOLS_DATABASE: List[AITool] = [
-    
+
     # =========================================================================
     # GENERAL LLMs (Limit 1-2 per toolkit)
     # =========================================================================
@@ -1057,17 +1060,49 @@ HOBBY_BACKGROUNDS: Dict[str, List[str]] = {
 }
 
 
+# Role keywords, in priority order, that pick the specialised LLM and the
+# universal tools for professions with no direct catalog match
+ROLE_KEYWORDS = {
+    "coding": ["engineer", "developer", "programmer", "coder", "software", "agent", "blockchain", "web3"],
+    "design": ["designer", "creative", "artist", "ui", "ux"],
+    "marketing": ["marketing", "marketer", "content", "growth"],
+}
+
+UNIVERSAL_TOOL_IDS = {
+    "coding": ["cursor", "github-copilot", "linear", "raycast"],
+    "design": ["figma", "midjourney", "notion", "linear"],
+    "marketing": ["notion", "canva", "jasper", "linear"],
+    None: ["notion", "linear", "raycast", "figma"],  # General productivity
+}
+
+_ROLE_PRIORITY = {role: i for i, role in enumerate(ROLE_KEYWORDS)}
+_role_matcher = KeywordMatcher(
+    (keyword, role) for role, keywords in ROLE_KEYWORDS.items() for keyword in keywords
+)
+
+
+def _role_for(keywords: List[str]) -> Optional[str]:
+    """Highest-priority role whose keyword is one of `keywords`"""
+    roles = _role_matcher.values_in(" ".join(keywords), whole_words=True)
+    return min(roles, key=_ROLE_PRIORITY.__getitem__) if roles else None
+
+
 class AIToolsService:
     """
     Service for querying and filtering AI tools
     Strategy: 1 LLM + 3-4 vertical tools per profession
     """
     
-    def __init__(self):
-        self.tools = AI_TOOLS_DATABASE
+    def __init__(self, tools: List[AITool] = AI_TOOLS_DATABASE):
+        self.tools = tools
         self._index_by_id = {tool.id: tool for tool in self.tools}
         self._llms = [t for t in self.tools if t.category == ToolCategory.LLM]
         self._vertical_tools = [t for t in self.tools if t.category != ToolCategory.LLM]
+        self._vertical_index = CatalogIndex(self._vertical_tools, TOOL_FIELDS, tool_rank)
+        self._vertical_ranks = {tool.id: rank for rank, tool in enumerate(self._vertical_index.ranked)}
+        # Hobby matches and the fill of short profession results rank by rating
+        # alone, catalog order on ties (vertical profession matches are cheapest first)
+        self._rating_index = CatalogIndex(self._vertical_tools, TOOL_FIELDS, tool_rating_rank)
     
     def get_tools_for_profession(self, profession: str, limit: int = 5) -> List[AITool]:
         """
@@ -1082,19 +1117,13 @@ class AIToolsService:
         # Get 1-2 LLMs (ChatGPT + one specialized)
         llms = self._get_llms_for(profession_keywords)
         
-        # Get vertical tools
-        vertical = [
-            tool for tool in self._vertical_tools
-            if any(p in profession_lower for p in tool.professions) or
-               any(p in profession_keywords for prof in tool.professions for p in prof.split("-"))
-        ]
+        # Get vertical tools, best first
+        vertical = self._vertical_index.top(*self._profession_terms(profession_lower), limit=limit)
         
         # If no matching vertical tools, get universal productivity tools
         if not vertical:
             vertical = self._get_universal_tools(profession_keywords)
         
-        vertical.sort(key=lambda t: (-t.rating, t.price_monthly))
-        
         # Combine: 1-2 LLMs + 2-3 vertical tools
         result = llms[:2]  # Max 2 LLMs
         remaining = limit - len(result)
@@ -1102,59 +1131,57 @@ class AIToolsService:
         
         # Ensure we have at least 4 tools
         if len(result) < 4:
-            all_tools = sorted(self._vertical_tools, key=lambda t: -t.rating)
-            for tool in all_tools:
-                if tool not in result:
+            chosen = {tool.id for tool in result}
+            for tool in self._rating_index.ranked:
+                if tool.id not in chosen:
                     result.append(tool)
                     if len(result) >= 4:
                         break
         
         return result[:limit]
     
+    def _profession_terms(self, profession: str) -> List[Tuple[str, str]]:
+        """Index terms for a normalized profession: a tool profession occurs in it, or shares a word with it"""
+        index = self._vertical_index
+        return [
+            *index.terms_in(profession, "professions"),
+            *index.terms_in(profession.replace("-", " "), "profession_tokens", whole_words=True),
+        ]
+    
     def _get_llms_for(self, keywords: List[str]) -> List[AITool]:
         """Get 1-2 best LLMs for a profession"""
         result = []
         
         # Always include ChatGPT as primary
-        chatgpt = next((l for l in self._llms if l.id == "chatgpt"), None)
+        chatgpt = self._llm("chatgpt")
         if chatgpt:
             result.append(chatgpt)
         
         # Add specialized LLM based on keywords
-        coding_keywords = ["engineer", "developer", "programmer", "coder", "software", "agent", "blockchain", "web3"]
-        design_keywords = ["designer", "creative", "artist", "ui", "ux"]
+        role = _role_for(keywords)
         
-        if any(k in keywords for k in coding_keywords):
-            claude = next((l for l in self._llms if l.id == "claude"), None)
-            if claude and claude not in result:
+        if role == "coding":
+            claude = self._llm("claude")
+            if claude:
                 result.append(claude)
-        elif any(k in keywords for k in design_keywords):
-            gemini = next((l for l in self._llms if l.id == "gemini"), None)
-            if gemini and gemini not in result:
+        elif role == "design":
+            gemini = self._llm("gemini")
+            if gemini:
                 result.append(gemini)
         
         # If only 1 LLM, just return it
         return result[:2]
     
+    def _llm(self, tool_id: str) -> Optional[AITool]:
+        tool = self._index_by_id.get(tool_id)
+        return tool if tool is not None and tool.category == ToolCategory.LLM else None
+    
     def _get_universal_tools(self, keywords: List[str]) -> List[AITool]:
-        """Get universal productivity tools when no specific match"""
-        universal_ids = []
+        """Get universal productivity tools when no specific match (best first)"""
+        universal_ids = UNIVERSAL_TOOL_IDS.get(_role_for(keywords), UNIVERSAL_TOOL_IDS[None])
         
-        # Check for coding/engineering keywords
-        coding_keywords = ["engineer", "developer", "programmer", "coder", "software", "agent", "blockchain", "web3"]
-        if any(k in keywords for k in coding_keywords):
-            universal_ids = ["cursor", "github-copilot", "linear", "raycast"]
-        # Check for design keywords
-        elif any(k in keywords for k in ["designer", "creative", "artist", "ui", "ux"]):
-            universal_ids = ["figma", "midjourney", "notion", "linear"]
-        # Check for marketing keywords
-        elif any(k in keywords for k in ["marketing", "marketer", "content", "growth"]):
-            universal_ids = ["notion", "canva", "jasper", "linear"]
-        # Default: general productivity
-        else:
-            universal_ids = ["notion", "linear", "raycast", "figma"]
-        
-        return [t for t in self._vertical_tools if t.id in universal_ids]
+        ranks = (self._vertical_ranks.get(tool_id) for tool_id in universal_ids)
+        return [self._vertical_index.ranked[r] for r in sorted(r for r in ranks if r is not None)]
     
     def _get_best_llm_for(self, profession: str) -> Optional[AITool]:
         """Get the best LLM for a profession"""
@@ -1165,12 +1192,7 @@ class AIToolsService:
     
     def get_tools_for_hobby(self, hobby: str, limit: int = 2) -> List[AITool]:
         """Get tools relevant to a specific hobby (no LLMs)"""
-        relevant = [
-            tool for tool in self._vertical_tools
-            if hobby in tool.hobbies or any(h in hobby for h in tool.hobbies)
-        ]
-        relevant.sort(key=lambda t: t.rating, reverse=True)
-        return relevant[:limit]
+        return self._rating_index.match(hobby, "hobbies", limit=limit)
     
     def get_background_for_hobby(self, hobby: str, index: int = 0) -> str:
         """Get a background image for a hobby"""
@@ -0,0 +1,215 @@
+"""
+Catalog Index
+Inverted indexes over a tool catalog with posting lists pre-sorted by rank
+"""
+import heapq
+from collections import defaultdict
+from typing import (
+    Any, Callable, Dict, Generic, Iterable, List, Mapping, Optional, Sequence, Tuple, TypeVar
+)
+
+from app.data.keyword_matcher import KeywordMatcher
+
+try:
+    import numpy as np
+    NUMPY_AVAILABLE = True
+except ImportError:  # Optional: unions fall back to heapq.merge
+    np = None
+    NUMPY_AVAILABLE = False
+
+T = TypeVar("T")
+
+FieldGetter = Callable[[Any], Iterable[str]]
+
+# Field getters and rank for Supabase / fallback rows (dicts)
+ROW_FIELDS: Dict[str, FieldGetter] = {
+    "professions": lambda t: t.get("professions") or (),
+    "hobbies": lambda t: t.get("hobbies") or (),
+    "tags": lambda t: t.get("tags") or (),
+    "category": lambda t: (t.get("category_id") or "",),
+}
+
+
+def row_rank(tool: Mapping[str, Any]) -> Tuple[float, float]:
+    """Best first: highest rating, then cheapest"""
+    return (-(tool.get("rating") or 0), tool.get("price_monthly") or 0)
+
+
+# Field getters and rank for AITool dataclasses
+TOOL_FIELDS: Dict[str, FieldGetter] = {
+    "professions": lambda t: t.professions,
+    "hobbies": lambda t: t.hobbies,
+    "tags": lambda t: t.tags,
+    "category": lambda t: (t.category.value,),
+}
+
+
+def tool_rank(tool: Any) -> Tuple[float, float]:
+    """Best first: highest rating, then cheapest"""
+    return (-tool.rating, tool.price_monthly)
+
+
+def tool_rating_rank(tool: Any) -> Tuple[float]:
+    """Best first: highest rating only (ties keep catalog order)"""
+    return (-tool.rating,)
+
+
+class InvertedIndex(Generic[T]):
+    """
+    field -> key -> posting list of tools, best first
+    
+    Tools are ranked once by `rank_key` (ties keep catalog order) and every
+    posting list stores ranks in ascending order. The top k tools for a key
+    are a slice; a query over several keys is a k-way merge of already
+    sorted lists. Build a new index when the catalog changes.
+    
+    With NumPy, long posting lists are also kept as rank vectors: the tools
+    x keys incidence matrix by column. A query reaching deep into its lists
+    (no limit, or a limit large next to the lists) is then answered as a
+    boolean product of that matrix with the query's keys, whose nonzero
+    positions come out already in rank order, instead of a k-way merge.
+    """
+    
+    VECTOR_MIN_POSTINGS = 256  # Shorter lists are indexed from their tuples
+    # Cost of the product, in units of one heapq.merge step (the merge reads
+    # about `limit` postings): each posting scattered into the boolean mask
+    # costs 1/90 of a step, and each tool of the mask (zeroing it, then
+    # flatnonzero) 1/450. Both are fitted to the merge/product crossover
+    # measured by scripts/bench_catalog_scoring.py (CPython 3.11, NumPy 2).
+    PRODUCT_COST_PER_POSTING = 1 / 90
+    PRODUCT_COST_PER_TOOL = 1 / 450
+    
+    def __init__(
+        self,
+        tools: Sequence[T],
+        fields: Mapping[str, FieldGetter],
+        rank_key: Callable[[T], Any]
+    ):
+        order = sorted(range(len(tools)), key=lambda i: (rank_key(tools[i]), i))
+        self.ranked: Tuple[T, ...] = tuple(tools[i] for i in order)
+        
+        postings: Dict[str, Dict[str, List[int]]] = {field: defaultdict(list) for field in fields}
+        for rank, tool in enumerate(self.ranked):
+            for field, get in fields.items():
+                for key in dict.fromkeys(get(tool) or ()):
+                    postings[field][key].append(rank)
+        self._postings: Dict[str, Dict[str, Tuple[int, ...]]] = {
+            field: {key: tuple(ranks) for key, ranks in by_key.items()}
+            for field, by_key in postings.items()
+        }
+        self._vectors: Dict[Tuple[str, str], Any] = {}
+        if NUMPY_AVAILABLE:
+            self._vectors = {
+                (field, key): np.array(ranks, dtype=np.int32)
+                for field, by_key in self._postings.items()
+                for key, ranks in by_key.items()
+                if len(ranks) >= self.VECTOR_MIN_POSTINGS
+            }
+    
+    def __len__(self) -> int:
+        return len(self.ranked)
+    
+    def keys(self, field: str) -> Iterable[str]:
+        return self._postings[field].keys()
+    
+    def count(self, field: str, key: str) -> int:
+        return len(self._postings[field].get(key, ()))
+    
+    def top(self, *terms: Tuple[str, str], limit: Optional[int] = None) -> List[T]:
+        """
+        Best tools matching any of the (field, key) terms
+        
+        Args:
+            terms: (field, key) pairs; unknown keys match nothing
+            limit: Max tools to return (all when None)
+        """
+        terms = [t for t in dict.fromkeys(terms) if self._postings[t[0]].get(t[1])]
+        if not terms:
+            return []
+        lists = [self._postings[field][key] for field, key in terms]
+        if len(lists) == 1:
+            ranks: Iterable[int] = lists[0][:limit]
+        elif self._vectors and self._product_is_cheaper(lists, limit):
+            ranks = self._product(terms, limit)
+        else:
+            ranks = self._merge(lists, limit)
+        return [self.ranked[r] for r in ranks]
+    
+    def _product_is_cheaper(self, lists: List[Tuple[int, ...]], limit: Optional[int]) -> bool:
+        """Whether the matrix product beats merging (which reads about `limit` postings)"""
+        if limit is None:
+            return True
+        total = sum(map(len, lists))
+        return limit > total * self.PRODUCT_COST_PER_POSTING + len(self.ranked) * self.PRODUCT_COST_PER_TOOL
+    
+    def _product(self, terms: List[Tuple[str, str]], limit: Optional[int]) -> List[int]:
+        """Ranks of the tools matching any term: incidence matrix x query keys"""
+        matched = np.zeros(len(self.ranked), dtype=bool)
+        for term in terms:
+            column = self._vectors.get(term)
+            matched[column if column is not None else list(self._postings[term[0]][term[1]])] = True
+        return np.flatnonzero(matched)[:limit].tolist()
+    
+    @staticmethod
+    def _merge(lists: List[Tuple[int, ...]], limit: Optional[int]) -> List[int]:
+        """Union of sorted posting lists, deduplicated, up to `limit`"""
+        merged: List[int] = []
+        last = -1
+        for rank in heapq.merge(*lists):
+            if rank != last:
+                merged.append(rank)
+                last = rank
+                if limit is not None and len(merged) >= limit:
+                    break
+        return merged
+
+
+class CatalogIndex(InvertedIndex[T]):
+    """
+    Inverted index plus a keyword automaton over its free-text fields
+    
+    Profession, hobby and tag keys are lower-cased, and profession slugs are
+    also indexed per word under "profession_tokens" ("product-manager" ->
+    "product", "manager"). terms_in() finds, in one pass over a string,
+    every indexed key it contains; top() then merges their posting lists.
+    """
+    
+    TEXT_FIELDS = ("professions", "hobbies", "tags", "profession_tokens")
+    
+    def __init__(
+        self,
+        tools: Sequence[T],
+        fields: Mapping[str, FieldGetter],
+        rank_key: Callable[[T], Any]
+    ):
+        def lowered(get: FieldGetter) -> FieldGetter:
+            return lambda t: [key.lower() for key in get(t) or ()]
+        
+        get_professions = fields["professions"]
+        indexed = {
+            "professions": lowered(get_professions),
+            "hobbies": lowered(fields["hobbies"]),
+            "tags": lowered(fields["tags"]),
+            "profession_tokens": lambda t: [
+                token for p in get_professions(t) or () for token in p.lower().split("-")
+            ],
+            "category": fields["category"],
+        }
+        super().__init__(tools, indexed, rank_key)
+        
+        self._matcher: KeywordMatcher[str] = KeywordMatcher(
+            (key, field) for field in self.TEXT_FIELDS for key in self.keys(field)
+        )
+    
+    def terms_in(self, text: str, *fields: str, whole_words: bool = False) -> List[Tuple[str, str]]:
+        """(field, key) for every indexed key of `fields` occurring in `text`"""
+        return [
+            (field, key)
+            for key in self._matcher.keywords_in(text, whole_words)
+            for field in self._matcher.values_for(key)
+            if field in fields
+        ]
+    
+    def match(self, text: str, *fields: str, whole_words: bool = False, limit: Optional[int] = None) -> List[T]:
+        """Best tools with a `fields` key occurring in `text`"""
+        return self.top(*self.terms_in(text, *fields, whole_words=whole_words), limit=limit)
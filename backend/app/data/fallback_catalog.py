@@ -0,0 +1,347 @@
+"""
+Fallback catalog
+Built-in tools and backgrounds served when Supabase is not available
+
+Everything here is built once at import and frozen (mappings become
+read-only proxies, lists become tuples), so the same objects are shared by
+every request. Copy a value before putting it in a response that is
+mutated afterwards.
+"""
+from datetime import datetime, timezone
+from types import MappingProxyType
+from typing import Any, Mapping, Tuple
+
+
+def _freeze(value: Any) -> Any:
+    """Deep read-only copy: dict -> MappingProxyType, list -> tuple"""
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+# Minimal set of Supabase `ai_tools` rows
+FALLBACK_TOOLS: Tuple[Mapping[str, Any], ...] = _freeze([
+    # LLMs
+    {
+        "id": "chatgpt",
+        "name": "ChatGPT",
+        "description": "OpenAI's versatile AI assistant for writing, coding, and analysis.",
+        "category_id": "llm",
+        "logo_color": "#10A37F",
+        "logo_url": "https://upload.wikimedia.org/wikipedia/commons/0/04/ChatGPT_logo.svg",
+        "website_url": "https://chat.openai.com",
+        "pricing_type": "freemium",
+        "price_monthly": 20,
+        "rating": 4.9,
+        "tags": ["ai", "writing", "coding"],
+        "professions": ["developer", "designer", "marketer", "writer", "data-scientist", "product-manager"],
+        "hobbies": ["coding", "writing"],
+        "cta_text": "Try Free",
+        "features": ["GPT-4", "Code interpreter", "Plugins"],
+        "integration_mode": "paid_api",
+        "api_available": True,
+        "has_free_tier": True,
+    },
+    {
+        "id": "claude",
+        "name": "Claude",
+        "description": "Anthropic's AI for nuanced analysis and long-form content.",
+        "category_id": "llm",
+        "logo_color": "#D4A574",
+        "logo_url": None,
+        "website_url": "https://claude.ai",
+        "pricing_type": "freemium",
+        "price_monthly": 20,
+        "rating": 4.8,
+        "tags": ["ai", "analysis", "writing"],
+        "professions": ["developer", "writer", "researcher", "consultant"],
+        "hobbies": ["writing", "reading"],
+        "cta_text": "Try Free",
+        "features": ["200K context", "Artifacts"],
+        "integration_mode": "paid_api",
+        "api_available": True,
+        "has_free_tier": True,
+    },
+    # Code tools
+    {
+        "id": "github-copilot",
+        "name": "GitHub Copilot",
+        "description": "AI pair programmer that suggests code in real-time.",
+        "category_id": "code_assistant",
+        "logo_color": "#000000",
+        "logo_url": "https://github.githubassets.com/images/modules/logos_page/GitHub-Mark.png",
+        "website_url": "https://github.com/features/copilot",
+        "pricing_type": "paid",
+        "price_monthly": 10,
+        "rating": 4.9,
+        "tags": ["coding", "ai", "autocomplete"],
+        "professions": ["developer", "software-engineer", "blockchain-engineer"],
+        "hobbies": ["coding"],
+        "cta_text": "Try Free",
+        "features": ["Code suggestions", "Multi-language", "IDE integration"],
+        "integration_mode": "paid_api",
+        "api_available": False,
+        "has_free_tier": False,
+    },
+    {
+        "id": "linear",
+        "name": "Linear",
+        "description": "Streamlined issue tracking built for modern product teams.",
+        "category_id": "project_mgmt",
+        "logo_color": "#5E6AD2",
+        "logo_url": "https://asset.brandfetch.io/idaeNz7NsW/id-dQuXyBh.svg",
+        "website_url": "https://linear.app",
+        "pricing_type": "freemium",
+        "price_monthly": 8,
+        "rating": 4.9,
+        "tags": ["project", "issues", "agile"],
+        "professions": ["product-manager", "developer", "designer"],
+        "hobbies": [],
+        "cta_text": "Start Free",
+        "features": ["Cycles", "Roadmaps", "GitHub sync"],
+        "integration_mode": "free_api",
+        "api_available": True,
+        "has_free_tier": True,
+    },
+    {
+        "id": "raycast",
+        "name": "Raycast",
+        "description": "Productivity launcher with AI commands, snippets, and integrations.",
+        "category_id": "automation",
+        "logo_color": "#FF6363",
+        "logo_url": "https://asset.brandfetch.io/idwCAv24ti/id3LDGCDoT.svg",
+        "website_url": "https://raycast.com",
+        "pricing_type": "freemium",
+        "price_monthly": 8,
+        "rating": 4.9,
+        "tags": ["productivity", "launcher", "automation"],
+        "professions": ["developer", "designer", "product-manager"],
+        "hobbies": ["coding"],
+        "cta_text": "Download Free",
+        "features": ["AI commands", "Snippets", "Extensions"],
+        "integration_mode": "free_api",
+        "api_available": True,
+        "has_free_tier": True,
+    },
+    {
+        "id": "figma",
+        "name": "Figma",
+        "description": "Collaborative design tool for UI/UX with AI-powered features.",
+        "category_id": "design",
+        "logo_color": "#F24E1E",
+        "logo_url": "https://upload.wikimedia.org/wikipedia/commons/3/33/Figma-logo.svg",
+        "website_url": "https://figma.com",
+        "pricing_type": "freemium",
+        "price_monthly": 15,
+        "rating": 4.9,
+        "tags": ["design", "ui", "prototyping"],
+        "professions": ["designer", "product-manager"],
+        "hobbies": ["art"],
+        "cta_text": "Try Free",
+        "features": ["Dev mode", "Prototyping", "Components"],
+        "integration_mode": "free_api",
+        "api_available": True,
+        "has_free_tier": True,
+    },
+    # Gaming tools
+    {
+        "id": "discord",
+        "name": "Discord",
+        "description": "Voice, video, and text chat platform for gamers and communities.",
+        "category_id": "communication",
+        "logo_color": "#5865F2",
+        "logo_url": "https://asset.brandfetch.io/idaSYDn1qQ/id5VXzVct_.svg",
+        "website_url": "https://discord.com",
+        "pricing_type": "freemium",
+        "price_monthly": 0,
+        "rating": 4.8,
+        "tags": ["gaming", "voice", "community"],
+        "professions": ["game-designer"],
+        "hobbies": ["gaming"],
+        "cta_text": "Join Free",
+        "features": ["Voice channels", "Screen share", "Bots"],
+        "integration_mode": "free_api",
+        "api_available": True,
+        "has_free_tier": True,
+    },
+    {
+        "id": "obs-studio",
+        "name": "OBS Studio",
+        "description": "Free streaming and recording software for gamers and creators.",
+        "category_id": "video",
+        "logo_color": "#302E31",
+        "logo_url": None,
+        "website_url": "https://obsproject.com",
+        "pricing_type": "free",
+        "price_monthly": 0,
+        "rating": 4.9,
+        "tags": ["streaming", "recording", "gaming"],
+        "professions": ["game-designer"],
+        "hobbies": ["gaming"],
+        "cta_text": "Download Free",
+        "features": ["Live streaming", "Recording", "Scenes"],
+        "integration_mode": "redirect",
+        "api_available": False,
+        "has_free_tier": True,
+    },
+    # Fitness/Lifestyle tools
+    {
+        "id": "strava",
+        "name": "Strava",
+        "description": "Track runs and rides with AI performance insights.",
+        "category_id": "fitness",
+        "logo_color": "#FC4C02",
+        "logo_url": "https://asset.brandfetch.io/idLhmxXoW9/idMi_Zd03L.svg",
+        "website_url": "https://strava.com",
+        "pricing_type": "freemium",
+        "price_monthly": 12,
+        "rating": 4.7,
+        "tags": ["running", "cycling", "fitness"],
+        "professions": [],
+        "hobbies": ["running", "fitness", "hiking"],
+        "cta_text": "Join Free",
+        "features": ["GPS tracking", "Segments", "Clubs"],
+        "integration_mode": "free_api",
+        "api_available": True,
+        "has_free_tier": True,
+    },
+    {
+        "id": "alltrails",
+        "name": "AllTrails",
+        "description": "Discover hiking trails with AI recommendations and offline maps.",
+        "category_id": "lifestyle",
+        "logo_color": "#428813",
+        "logo_url": "https://asset.brandfetch.io/idFXnIWKeB/idvL-YIW-S.svg",
+        "website_url": "https://alltrails.com",
+        "pricing_type": "freemium",
+        "price_monthly": 3,
+        "rating": 4.8,
+        "tags": ["hiking", "trails", "outdoors"],
+        "professions": [],
+        "hobbies": ["hiking", "running", "fitness"],
+        "cta_text": "Explore Free",
+        "features": ["Trail maps", "Reviews", "Offline"],
+        "integration_mode": "free_api",
+        "api_available": True,
+        "has_free_tier": True,
+    },
+])
+
+# hobby -> background image URLs
+FALLBACK_BACKGROUNDS: Mapping[str, Tuple[str, ...]] = _freeze({
+    "hiking": [
+        "https://images.unsplash.com/photo-1551632811-561732d1e306?w=800&q=80",
+        "https://images.unsplash.com/photo-1464822759023-fed622ff2c3b?w=800&q=80",
+    ],
+    "gaming": [
+        "https://images.unsplash.com/photo-1542751371-adc38448a05e?w=800&q=80",
+        "https://images.unsplash.com/photo-1538481199705-c710c4e965fc?w=800&q=80",
+    ],
+    "fitness": [
+        "https://images.unsplash.com/photo-1571019613454-1cb2f99b2d8b?w=800&q=80",
+        "https://images.unsplash.com/photo-1534368959878-b5cd06801e27?w=800&q=80",
+    ],
+    "running": [
+        "https://images.unsplash.com/photo-1571008887538-b36bb32f4571?w=800&q=80",
+        "https://images.unsplash.com/photo-1476480862126-209bfaa8edc8?w=800&q=80",
+    ],
+    "traveling": [
+        "https://images.unsplash.com/photo-1488646953014-85cb44e25828?w=800&q=80",
+        "https://images.unsplash.com/photo-1436491865332-7a61a109cc05?w=800&q=80",
+    ],
+    "cooking": [
+        "https://images.unsplash.com/photo-1556909114-f6e7ad7d3136?w=800&q=80",
+        "https://images.unsplash.com/photo-1490645935967-10de6ba17061?w=800&q=80",
+    ],
+    "photography": [
+        "https://images.unsplash.com/photo-1502920917128-1aa500764cbd?w=800&q=80",
+        "https://images.unsplash.com/photo-1542038784456-1ea8e935640e?w=800&q=80",
+    ],
+})
+
+# Last revision of the rows above (the catalog date of fallback toolkits),
+# recorded with their catalog_digest then. The date is only used while the
+# digest still matches: after editing the rows, update both.
+FALLBACK_REVISION: Tuple[str, datetime] = ("8d090feb3020568b", datetime(2026, 10, 17, tzinfo=timezone.utc))
+
+# Work tools (already in response format) used to fill a toolkit up to 4
+DEFAULT_WORK_TOOLS: Tuple[Mapping[str, Any], ...] = _freeze([
+    {
+        "name": "ChatGPT",
+        "logo": "#10A37F",
+        "logoUrl": "https://upload.wikimedia.org/wikipedia/commons/0/04/ChatGPT_logo.svg",
+        "rating": 4.9,
+        "description": "OpenAI's versatile AI assistant for writing, coding, and analysis.",
+        "ctaText": "Try Free",
+        "category": "LLM",
+        "price": 20,
+        "url": "https://chat.openai.com",
+        "integrationMode": "paid_api",
+        "apiAvailable": True,
+    },
+    {
+        "name": "Linear",
+        "logo": "#5E6AD2",
+        "logoUrl": "https://asset.brandfetch.io/idaeNz7NsW/id-dQuXyBh.svg",
+        "rating": 4.9,
+        "description": "Streamlined issue tracking built for modern product teams.",
+        "ctaText": "Start Free",
+        "category": "Project Management",
+        "price": 8,
+        "url": "https://linear.app",
+        "integrationMode": "free_api",
+        "apiAvailable": True,
+    },
+    {
+        "name": "Raycast",
+        "logo": "#FF6363",
+        "logoUrl": "https://asset.brandfetch.io/idwCAv24ti/id3LDGCDoT.svg",
+        "rating": 4.9,
+        "description": "Productivity launcher with AI commands and integrations.",
+        "ctaText": "Download Free",
+        "category": "Automation",
+        "price": 8,
+        "url": "https://raycast.com",
+        "integrationMode": "free_api",
+        "apiAvailable": True,
+    },
+    {
+        "name": "Notion",
+        "logo": "#000000",
+        "logoUrl": "https://upload.wikimedia.org/wikipedia/commons/e/e9/Notion-logo.svg",
+        "rating": 4.8,
+        "description": "All-in-one workspace for notes, docs, and project management.",
+        "ctaText": "Start Free",
+        "category": "Writing",
+        "price": 10,
+        "url": "https://notion.so",
+        "integrationMode": "free_api",
+        "apiAvailable": True,
+    },
+])
+
+# Backgrounds used when hobby backgrounds cannot be fetched
+DEFAULT_BACKGROUNDS: Tuple[str, ...] = (
+    "https://images.unsplash.com/photo-1488646953014-85cb44e25828?w=800&q=80",
+    "https://images.unsplash.com/photo-1436491865332-7a61a109cc05?w=800&q=80",
+)
+
+# Display names for profession slugs
+PROFESSION_DISPLAY_NAMES: Mapping[str, str] = MappingProxyType({
+    "product-manager": "Product Manager",
+    "developer": "Developer",
+    "designer": "Designer",
+    "marketer": "Marketer",
+    "data-scientist": "Data Scientist",
+    "writer": "Writer",
+    "entrepreneur": "Entrepreneur",
+    "hr-manager": "HR Manager",
+    "consultant": "Consultant",
+    "student": "Student",
+    "game-designer": "Game Designer",
+    "software-engineer": "Software Engineer",
+    "blockchain-engineer": "Blockchain Engineer",
+    "agent-engineer": "AI Agent Engineer",
+})
@@ -0,0 +1,135 @@
+"""
+Keyword Matcher
+Aho-Corasick automaton for finding many keywords in one pass over a string
+"""
+from collections import deque
+from typing import Dict, Generic, Hashable, Iterable, Iterator, List, Set, Tuple, TypeVar
+
+V = TypeVar("V", bound=Hashable)
+
+
+class KeywordMatcher(Generic[V]):
+    """
+    Multi-pattern substring matcher
+    
+    Every keyword carries one or more payload values. The automaton is built
+    lazily on the first search after keywords were added, so a search costs
+    O(len(text) + matches) regardless of how many keywords are loaded.
+    
+    Matching is case-sensitive; callers normalise (lower-case) both the
+    keywords and the text.
+    """
+    
+    def __init__(self, entries: Iterable[Tuple[str, V]] = ()):
+        self._keywords: Dict[str, List[V]] = {}
+        self._goto: List[Dict[str, int]] = []
+        self._fail: List[int] = []
+        self._output: List[Tuple[str, ...]] = []
+        self._built = False
+        
+        for keyword, value in entries:
+            self.add(keyword, value)
+    
+    def add(self, keyword: str, value: V) -> None:
+        """Register `value` under `keyword` (empty keywords are ignored)"""
+        if not keyword:
+            return
+        values = self._keywords.setdefault(keyword, [])
+        if value not in values:
+            values.append(value)
+        self._built = False
+    
+    def __len__(self) -> int:
+        return len(self._keywords)
+    
+    def __contains__(self, keyword: str) -> bool:
+        return keyword in self._keywords
+    
+    def _build(self) -> None:
+        goto: List[Dict[str, int]] = [{}]
+        output: List[List[str]] = [[]]
+        
+        # Trie of all keywords
+        for keyword in self._keywords:
+            state = 0
+            for ch in keyword:
+                nxt = goto[state].get(ch)
+                if nxt is None:
+                    nxt = len(goto)
+                    goto[state][ch] = nxt
+                    goto.append({})
+                    output.append([])
+                state = nxt
+            output[state].append(keyword)
+        
+        # Failure links (BFS), merging the outputs of each suffix state
+        fail = [0] * len(goto)
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for ch, nxt in goto[state].items():
+                queue.append(nxt)
+                f = fail[state]
+                while f and ch not in goto[f]:
+                    f = fail[f]
+                fail[nxt] = goto[f].get(ch, 0)
+                output[nxt].extend(output[fail[nxt]])
+        
+        self._goto = goto
+        self._fail = fail
+        self._output = [tuple(o) for o in output]
+        self._built = True
+    
+    def iter_matches(self, text: str, whole_words: bool = False) -> Iterator[Tuple[int, int, str]]:
+        """
+        Yield (start, end, keyword) for every occurrence in `text`
+        
+        With `whole_words`, only occurrences not touching another
+        alphanumeric character on either side are reported.
+        """
+        if not self._built:
+            self._build()
+        goto, fail, output = self._goto, self._fail, self._output
+        
+        state = 0
+        for i, ch in enumerate(text):
+            while state and ch not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(ch, 0)
+            if not output[state]:
+                continue
+            end = i + 1
+            for keyword in output[state]:
+                start = end - len(keyword)
+                if whole_words and (
+                    (start > 0 and text[start - 1].isalnum())
+                    or (end < len(text) and text[end].isalnum())
+                ):
+                    continue
+                yield start, end, keyword
+    
+    def keywords_in(self, text: str, whole_words: bool = False) -> Set[str]:
+        """Distinct keywords occurring in `text`"""
+        return {keyword for _, _, keyword in self.iter_matches(text, whole_words)}
+    
+    def values_in(self, text: str, whole_words: bool = False) -> List[V]:
+        """Distinct payload values of every keyword in `text`, in first-seen order"""
+        seen: Dict[V, None] = {}
+        for _, _, keyword in self.iter_matches(text, whole_words):
+            for value in self._keywords[keyword]:
+                seen[value] = None
+        return list(seen)
+    
+    def longest_matches(self, text: str, whole_words: bool = False) -> List[Tuple[int, int, str]]:
+        """Leftmost-longest, non-overlapping matches in text order"""
+        spans = sorted(self.iter_matches(text, whole_words), key=lambda m: (m[0], -m[1]))
+        result: List[Tuple[int, int, str]] = []
+        last_end = 0
+        for start, end, keyword in spans:
+            if start >= last_end:
+                result.append((start, end, keyword))
+                last_end = end
+        return result
+    
+    def values_for(self, keyword: str) -> List[V]:
+        return self._keywords.get(keyword, [])
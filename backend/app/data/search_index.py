@@ -0,0 +1,315 @@
+"""
+Search Index
+Full-text search over a tool catalog: BM25 ranking with prefix and trigram
+fuzzy matching of query terms
+"""
+import heapq
+import itertools
+import math
+import re
+from array import array
+from bisect import bisect_left
+from collections import Counter, defaultdict
+from typing import (
+    Any, Callable, Dict, FrozenSet, Generic, Iterator, List, Mapping, Sequence, Set, Tuple, TypeVar
+)
+
+T = TypeVar("T")
+
+TextGetter = Callable[[Any], str]
+
+# field -> (text getter, weight) for Supabase / fallback rows (dicts). The
+# weights follow the A/B/C/D weights of the Postgres search vector
+# (database/migrations/002_search_tools.sql).
+ROW_TEXT_FIELDS: Dict[str, Tuple[TextGetter, float]] = {
+    "name": (lambda t: t.get("name") or "", 3.0),
+    "tags": (lambda t: " ".join(t.get("tags") or ()), 2.0),
+    "description": (lambda t: t.get("description") or "", 1.0),
+    "features": (lambda t: " ".join(t.get("features") or ()), 0.5),
+}
+
+# The same fields for AITool dataclasses
+TOOL_TEXT_FIELDS: Dict[str, Tuple[TextGetter, float]] = {
+    "name": (lambda t: t.name, 3.0),
+    "tags": (lambda t: " ".join(t.tags), 2.0),
+    "description": (lambda t: t.description, 1.0),
+    "features": (lambda t: " ".join(t.features), 0.5),
+}
+
+STOPWORDS: FrozenSet[str] = frozenset(
+    "a an and are as at be by for from how in is it of on or that the this to with you your".split()
+)
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+# A posting list: doc ids and term scores, best score first
+Postings = Tuple["array[int]", "array[float]"]
+
+
+def tokenize(text: str) -> List[str]:
+    """Lower-cased alphanumeric words"""
+    return _TOKEN_RE.findall(text.lower())
+
+
+def trigrams(term: str) -> FrozenSet[str]:
+    """Trigrams of a word, padded like pg_trgm ("  w", " wo", ..., "rd ")"""
+    padded = f"  {term} "
+    return frozenset(padded[i:i + 3] for i in range(len(padded) - 2))
+
+
+class SearchIndex(Generic[T]):
+    """
+    BM25 over weighted text fields, answered top-k from impact-ordered postings
+    
+    A term's BM25 contribution to a document does not depend on the query,
+    so it is computed once per (term, document) at build time. Each posting
+    list is sorted by that score, so a query reads lists best first and
+    stops as soon as the k-th best score beats anything the unread entries
+    could add up to (see _top_k).
+    
+    Query words that are not in the vocabulary are matched by prefix (the
+    last word, as typed so far) or by trigram similarity (typos), with the
+    score discounted accordingly. Build a new index when the catalog changes.
+    """
+    
+    K1 = 1.2
+    B = 0.75
+    
+    PREFIX_MIN_LENGTH = 3
+    PREFIX_WEIGHT = 0.9
+    FUZZY_MIN_LENGTH = 4
+    FUZZY_THRESHOLD = 0.3  # pg_trgm's default similarity threshold
+    MAX_EXPANSIONS = 8
+    
+    def __init__(
+        self,
+        tools: Sequence[T],
+        fields: Mapping[str, Tuple[TextGetter, float]],
+        rank_key: Callable[[T], Any]
+    ):
+        # Ties in score keep rank order (e.g. best rated first)
+        order = sorted(range(len(tools)), key=lambda i: (rank_key(tools[i]), i))
+        self.ranked: Tuple[T, ...] = tuple(tools[i] for i in order)
+        
+        doc_terms: List[Dict[str, float]] = []
+        lengths: List[float] = []
+        for tool in self.ranked:
+            tf: Dict[str, float] = defaultdict(float)
+            length = 0.0
+            for get, weight in fields.values():
+                words = tokenize(get(tool))
+                length += weight * len(words)
+                for word in words:
+                    if word not in STOPWORDS:
+                        tf[word] += weight
+            doc_terms.append(tf)
+            lengths.append(length)
+        
+        df = Counter(term for tf in doc_terms for term in tf)
+        self._terms: List[str] = sorted(df)
+        self._term_ids: Dict[str, int] = {term: i for i, term in enumerate(self._terms)}
+        
+        n = len(self.ranked)
+        avg_length = (sum(lengths) / n) if n else 0.0
+        idf = [math.log(1 + (n - df[term] + 0.5) / (df[term] + 0.5)) for term in self._terms]
+        
+        postings: List[List[Tuple[float, int]]] = [[] for _ in self._terms]
+        self._forward: List[Postings] = []
+        for doc, (tf, length) in enumerate(zip(doc_terms, lengths)):
+            norm = self.K1 * (1 - self.B + self.B * length / avg_length) if avg_length else self.K1
+            entries = sorted(
+                (self._term_ids[term], idf[self._term_ids[term]] * f * (self.K1 + 1) / (f + norm))
+                for term, f in tf.items()
+            )
+            self._forward.append((array("i", [t for t, _ in entries]), array("f", [s for _, s in entries])))
+            for term_id, score in entries:
+                postings[term_id].append((-score, doc))
+        
+        self._postings: List[Postings] = []
+        for entries in postings:
+            entries.sort()
+            self._postings.append((array("i", [d for _, d in entries]), array("f", [-s for s, _ in entries])))
+        self._best = array("f", [scores[0] for _, scores in self._postings])
+        
+        by_trigram: Dict[str, List[int]] = defaultdict(list)
+        gram_counts = []
+        for term_id, term in enumerate(self._terms):
+            grams = trigrams(term)
+            gram_counts.append(len(grams))
+            for gram in grams:
+                by_trigram[gram].append(term_id)
+        self._gram_counts = array("H", gram_counts)
+        self._trigram_terms: Dict[str, "array[int]"] = {g: array("i", ids) for g, ids in by_trigram.items()}
+    
+    def __len__(self) -> int:
+        return len(self.ranked)
+    
+    @property
+    def vocabulary_size(self) -> int:
+        return len(self._terms)
+    
+    def search(self, query: str, limit: int = 10) -> List[Tuple[T, float]]:
+        """
+        Best tools for a free-text query
+        
+        Returns:
+            (tool, score) pairs, highest score first
+        """
+        groups = self._expand(query)
+        if not groups or limit <= 0:
+            return []
+        if len(groups) == 1 and len(groups[0]) == 1:
+            # One posting list: its head is the answer
+            term_id, weight = groups[0][0]
+            docs, scores = self._postings[term_id]
+            return [(self.ranked[d], weight * s) for d, s in zip(docs[:limit], scores[:limit])]
+        
+        hits = self._top_k(groups, limit)
+        return [(self.ranked[doc], score) for score, doc in hits]
+    
+    def _expand(self, query: str) -> List[List[Tuple[int, float]]]:
+        """Per query word, the (term id, weight) it matches in the vocabulary"""
+        words = list(dict.fromkeys(w for w in tokenize(query) if w not in STOPWORDS))
+        groups = []
+        for i, word in enumerate(words):
+            group = []
+            exact = self._term_ids.get(word)
+            if exact is not None:
+                group.append((exact, 1.0))
+            if i == len(words) - 1 and len(word) >= self.PREFIX_MIN_LENGTH:
+                group.extend((t, self.PREFIX_WEIGHT) for t in self._prefixed(word) if t != exact)
+            if not group and len(word) >= self.FUZZY_MIN_LENGTH:
+                group = self._similar(word)
+            if group:
+                groups.append(group)
+        return groups
+    
+    def _prefixed(self, prefix: str) -> List[int]:
+        """Vocabulary terms starting with `prefix` (best scoring when many)"""
+        lo = bisect_left(self._terms, prefix)
+        hi = bisect_left(self._terms, prefix[:-1] + chr(ord(prefix[-1]) + 1), lo)
+        if hi - lo <= self.MAX_EXPANSIONS:
+            return list(range(lo, hi))
+        return heapq.nlargest(self.MAX_EXPANSIONS, range(lo, hi), key=self._best.__getitem__)
+    
+    def _similar(self, word: str) -> List[Tuple[int, float]]:
+        """Vocabulary terms within FUZZY_THRESHOLD trigram similarity, weighted by it"""
+        grams = trigrams(word)
+        shared: Counter = Counter()
+        for gram in grams:
+            ids = self._trigram_terms.get(gram)
+            if ids:
+                shared.update(ids)
+        
+        # Jaccard similarity needs at least threshold * |grams| shared trigrams
+        min_shared = math.ceil(self.FUZZY_THRESHOLD * len(grams))
+        similar = []
+        for term_id, count in shared.most_common():
+            if count < min_shared:
+                break
+            similarity = count / (len(grams) + self._gram_counts[term_id] - count)
+            if similarity >= self.FUZZY_THRESHOLD:
+                similar.append((term_id, similarity))
+        return heapq.nlargest(self.MAX_EXPANSIONS, similar, key=lambda e: e[1])
+    
+    def _score(self, doc: int, groups: List[List[Tuple[int, float]]]) -> float:
+        """Full score of a document: per query word, its best matching term"""
+        terms, scores = self._forward[doc]
+        total = 0.0
+        for group in groups:
+            best = 0.0
+            for term_id, weight in group:
+                i = bisect_left(terms, term_id)
+                if i < len(terms) and terms[i] == term_id and weight * scores[i] > best:
+                    best = weight * scores[i]
+            total += best
+        return total
+    
+    def _stream(self, term_id: int, weight: float) -> Iterator[Tuple[float, int]]:
+        """(-weighted score, doc) of a posting list, best first"""
+        docs, scores = self._postings[term_id]
+        return zip(map((-weight).__mul__, scores), docs)
+    
+    def _top_k(self, groups: List[List[Tuple[int, float]]], limit: int) -> List[Tuple[float, int]]:
+        """
+        Exact top-k with max-score pruning
+        
+        Words are read in order of their best possible contribution (rare
+        words first), each as one stream of its expansions' postings merged
+        best first. Every posting read adds to a document's partial score,
+        and the k-th best partial score is a lower bound on the answer. Once
+        a posting, plus the most the words still unread could add, falls
+        below it, no new document can make the top k: the rest of the
+        postings only complete the scores of documents already seen, either
+        by finishing the stream or, for long ones, by looking the candidates
+        up in their forward entries.
+        """
+        bounds = [max(weight * self._best[term_id] for term_id, weight in group) for group in groups]
+        order = sorted(range(len(groups)), key=lambda g: -bounds[g])
+        
+        partial: Dict[int, float] = {}
+        theta = 0.0  # k-th best partial score
+        rest = sum(bounds)  # Most the words not read yet can add
+        missed = 0.0  # Most the words left incomplete can add
+        incomplete: List[Tuple[List[Tuple[int, float]], Set[int]]] = []
+        admitting = True
+        for g in order:
+            group = groups[g]
+            rest -= bounds[g]
+            if admitting and len(partial) >= limit:
+                theta = max(theta, heapq.nlargest(limit, partial.values())[-1])
+                admitting = bounds[g] + rest + missed >= theta
+            
+            streams = [self._stream(term_id, weight) for term_id, weight in group]
+            merged = heapq.merge(*streams) if len(streams) > 1 else streams[0]
+            seen: Set[int] = set()  # Credited with their best expansion (the first one seen)
+            
+            if admitting:
+                # Documents first seen in this word are distinct, so the k-th
+                # best of their partial scores is a lower bound as well
+                floor: List[float] = []
+                for neg_score, doc in merged:
+                    if -neg_score + rest + missed < theta:
+                        admitting = False
+                        merged = itertools.chain([(neg_score, doc)], merged)
+                        break
+                    if doc in seen:
+                        continue
+                    seen.add(doc)
+                    value = partial[doc] = partial.get(doc, 0.0) - neg_score
+                    if len(floor) < limit:
+                        heapq.heappush(floor, value)
+                    elif value > floor[0]:
+                        heapq.heapreplace(floor, value)
+                    else:
+                        continue
+                    if len(floor) == limit and floor[0] > theta:
+                        theta = floor[0]
+                else:
+                    continue
+            
+            if sum(len(self._postings[term_id][0]) for term_id, _ in group) <= len(partial):
+                # Finishing the stream is cheaper than per-candidate lookups
+                for neg_score, doc in merged:
+                    if doc in partial and doc not in seen:
+                        seen.add(doc)
+                        partial[doc] -= neg_score
+            else:
+                missed += bounds[g]
+                incomplete.append((group, seen))
+        
+        if not incomplete:
+            top = heapq.nlargest(limit, ((score, -doc) for doc, score in partial.items()))
+            return [(score, -neg_doc) for score, neg_doc in top]
+        
+        heap: List[Tuple[float, int]] = []  # (score, -doc): worst of the best k on top
+        for doc, score in sorted(partial.items(), key=lambda e: -e[1]):
+            if len(heap) == limit and score + missed < heap[0][0]:
+                break
+            score += self._score(doc, [group for group, seen in incomplete if doc not in seen])
+            item = (score, -doc)
+            if len(heap) < limit:
+                heapq.heappush(heap, item)
+            elif item > heap[0]:
+                heapq.heapreplace(heap, item)
+        return [(score, -neg_doc) for score, neg_doc in sorted(heap, reverse=True)]
@@ -0,0 +1,189 @@
+"""
+Supported professions and hobbies
+Served by /api/professions and /api/hobbies and used for local intent matching
+"""
+from typing import Dict, List, Any
+
+PROFESSIONS: List[Dict[str, Any]] = [
+    {"id": "product-manager", "label": "Product Manager", "icon": "inventory_2", "toolCount": 24},
+    {"id": "developer", "label": "Software Developer", "icon": "code", "toolCount": 32},
+    {"id": "designer", "label": "UX Designer", "icon": "palette", "toolCount": 28},
+    {"id": "marketer", "label": "Marketing Manager", "icon": "campaign", "toolCount": 26},
+    {"id": "writer", "label": "Content Writer", "icon": "edit_note", "toolCount": 22},
+    {"id": "student", "label": "Student", "icon": "school", "toolCount": 24},
+    {"id": "entrepreneur", "label": "Entrepreneur", "icon": "rocket_launch", "toolCount": 30},
+    {"id": "data-scientist", "label": "Data Scientist", "icon": "analytics", "toolCount": 18},
+    {"id": "sales", "label": "Sales Representative", "icon": "handshake", "toolCount": 20},
+    {"id": "hr-manager", "label": "HR Manager", "icon": "groups", "toolCount": 16},
+    {"id": "finance", "label": "Financial Analyst", "icon": "trending_up", "toolCount": 12},
+    {"id": "customer-support", "label": "Customer Support", "icon": "support_agent", "toolCount": 14},
+]
+
+HOBBIES: List[Dict[str, Any]] = [
+    {"id": "hiking", "label": "Hiking", "emoji": "🥾"},
+    {"id": "gaming", "label": "Gaming", "emoji": "🎮"},
+    {"id": "cooking", "label": "Cooking", "emoji": "🍳"},
+    {"id": "reading", "label": "Reading", "emoji": "📚"},
+    {"id": "fitness", "label": "Fitness", "emoji": "💪"},
+    {"id": "traveling", "label": "Traveling", "emoji": "✈️"},
+    {"id": "coding", "label": "Coding", "emoji": "💻"},
+    {"id": "photography", "label": "Photography", "emoji": "📸"},
+    {"id": "music", "label": "Music", "emoji": "🎵"},
+    {"id": "art", "label": "Art & Design", "emoji": "🎨"},
+]
+
+PROFESSION_LABELS: Dict[str, str] = {p["id"]: p["label"] for p in PROFESSIONS}
+HOBBY_LABELS: Dict[str, str] = {h["id"]: h["label"] for h in HOBBIES}
+
+# Common ways people refer to each profession (lowercase phrases -> slug)
+PROFESSION_ALIASES: Dict[str, str] = {
+    # Product
+    "product manager": "product-manager",
+    "product management": "product-manager",
+    "product owner": "product-manager",
+    # Bare "pm" is also a time of day ("until 5 pm"): only in role phrases
+    "a pm": "product-manager",
+    "as pm": "product-manager",
+    "senior pm": "product-manager",
+    "lead pm": "product-manager",
+    "technical pm": "product-manager",
+    "tpm": "product-manager",
+    "apm": "product-manager",
+    # Engineering
+    "developer": "developer",
+    "software developer": "developer",
+    "software engineer": "developer",
+    "software engineering": "developer",
+    "web developer": "developer",
+    "frontend developer": "developer",
+    "backend developer": "developer",
+    "full stack developer": "developer",
+    "fullstack developer": "developer",
+    "programmer": "developer",
+    "coder": "developer",
+    "swe": "developer",
+    "sde": "developer",
+    "dev": "developer",
+    # Design
+    "designer": "designer",
+    "ux designer": "designer",
+    "ui designer": "designer",
+    "ui ux designer": "designer",
+    "product designer": "designer",
+    "graphic designer": "designer",
+    "ux": "designer",
+    "ui": "designer",
+    "game designer": "game-designer",
+    "game developer": "game-designer",
+    # Marketing
+    "marketer": "marketer",
+    "marketing manager": "marketer",
+    "marketing": "marketer",
+    "growth marketer": "marketer",
+    "content marketer": "marketer",
+    "seo specialist": "marketer",
+    # Writing
+    "writer": "writer",
+    "content writer": "writer",
+    "copywriter": "writer",
+    "blogger": "writer",
+    "journalist": "writer",
+    "author": "writer",
+    "editor": "writer",
+    # Students
+    "student": "student",
+    "college student": "student",
+    "grad student": "student",
+    "undergrad": "student",
+    "phd student": "student",
+    # Founders
+    "entrepreneur": "entrepreneur",
+    "founder": "entrepreneur",
+    "co founder": "entrepreneur",
+    "cofounder": "entrepreneur",
+    "startup founder": "entrepreneur",
+    "business owner": "entrepreneur",
+    # Data
+    "data scientist": "data-scientist",
+    "data science": "data-scientist",
+    "data analyst": "data-scientist",
+    "ml engineer": "data-scientist",
+    "machine learning engineer": "data-scientist",
+    "ds": "data-scientist",
+    # Sales
+    "sales": "sales",
+    "salesperson": "sales",
+    "sales rep": "sales",
+    "sales representative": "sales",
+    "account executive": "sales",
+    "sdr": "sales",
+    "bdr": "sales",
+    # HR
+    "hr manager": "hr-manager",
+    "hr": "hr-manager",
+    "human resources": "hr-manager",
+    "recruiter": "hr-manager",
+    "talent acquisition": "hr-manager",
+    "people ops": "hr-manager",
+    # Finance
+    "finance": "finance",
+    "financial analyst": "finance",
+    "accountant": "finance",
+    "investment banker": "finance",
+    # Support
+    "customer support": "customer-support",
+    "customer service": "customer-support",
+    "support agent": "customer-support",
+    "support specialist": "customer-support",
+    "customer success": "customer-support",
+}
+
+# Common ways people refer to each hobby (lowercase phrases -> slug)
+HOBBY_ALIASES: Dict[str, str] = {
+    "hiking": "hiking",
+    "hike": "hiking",
+    "hikes": "hiking",
+    "hiker": "hiking",
+    "trekking": "hiking",
+    "backpacking": "hiking",
+    "trails": "hiking",
+    "gaming": "gaming",
+    "games": "gaming",
+    "gamer": "gaming",
+    "video games": "gaming",
+    "esports": "gaming",
+    "cooking": "cooking",
+    "cook": "cooking",
+    "baking": "cooking",
+    "recipes": "cooking",
+    "reading": "reading",
+    "books": "reading",
+    "reader": "reading",
+    "fitness": "fitness",
+    "gym": "fitness",
+    "workout": "fitness",
+    "workouts": "fitness",
+    "working out": "fitness",
+    "exercise": "fitness",
+    "running": "fitness",
+    "yoga": "fitness",
+    "traveling": "traveling",
+    "travelling": "traveling",
+    "travel": "traveling",
+    "traveler": "traveling",
+    "coding": "coding",
+    "programming": "coding",
+    "side projects": "coding",
+    "photography": "photography",
+    "photos": "photography",
+    "photographer": "photography",
+    "music": "music",
+    "guitar": "music",
+    "piano": "music",
+    "singing": "music",
+    "musician": "music",
+    "art": "art",
+    "drawing": "art",
+    "painting": "art",
+    "sketching": "art",
+}
@@ -0,0 +1,102 @@
+"""
+Catalog Snapshot
+Immutable in-process copy of the tool catalog, served without database round trips
+"""
+import hashlib
+import json
+import time
+from collections import defaultdict
+from datetime import datetime, timezone
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Tuple
+
+from app.data.catalog_index import InvertedIndex, ROW_FIELDS, row_rank
+from app.data.search_index import ROW_TEXT_FIELDS, SearchIndex
+
+Tool = Dict[str, Any]
+
+
+def catalog_digest(*parts: Any) -> str:
+    """Content hash of catalog data (rows, backgrounds): equal catalogs, equal digests"""
+    data = json.dumps(parts, sort_keys=True, separators=(",", ":"), default=dict)
+    return hashlib.sha256(data.encode("utf-8")).hexdigest()[:16]
+
+
+def latest_update(tools: Iterable[Mapping[str, Any]]) -> Optional[datetime]:
+    """Most recent `updated_at` among the rows (None if no row has one)"""
+    stamps = [datetime.fromisoformat(t["updated_at"]) for t in tools if t.get("updated_at")]
+    stamps = [s if s.tzinfo else s.replace(tzinfo=timezone.utc) for s in stamps]
+    return max(stamps, default=None)
+
+
+class CatalogSnapshot:
+    """
+    Read-only view of the active `ai_tools` and `hobby_backgrounds` rows
+    
+    All indexes are built in the constructor and never mutated afterwards,
+    so a snapshot can be shared by concurrent readers and replaced by
+    rebinding a single reference. Lookups mirror the PostgREST queries in
+    AIToolsRepository (exact array membership, rating order, ties broken
+    by price).
+    """
+    
+    def __init__(self, tools: Iterable[Tool], backgrounds: Iterable[Mapping[str, Any]]):
+        self.tools: Tuple[Tool, ...] = tuple(t for t in tools if t.get("is_active", True))
+        backgrounds = list(backgrounds)
+        self.loaded_at = time.time()
+        self.digest = catalog_digest(self.tools, backgrounds)
+        self.updated_at = latest_update(self.tools) or datetime.fromtimestamp(self.loaded_at, timezone.utc)
+        
+        self.index = InvertedIndex(self.tools, ROW_FIELDS, row_rank)
+        self.search_index = SearchIndex(self.tools, ROW_TEXT_FIELDS, row_rank)
+        
+        grouped: Dict[str, List[Tuple[int, str]]] = defaultdict(list)
+        for row in backgrounds:
+            grouped[row["hobby"]].append((row.get("priority") or 0, row["image_url"]))
+        self._backgrounds = {
+            hobby: tuple(url for _, url in sorted(rows, key=lambda r: r[0]))
+            for hobby, rows in grouped.items()
+        }
+    
+    @staticmethod
+    def digest_of(tools: Iterable[Tool], backgrounds: Iterable[Mapping[str, Any]]) -> str:
+        """The digest a snapshot of these rows would have, without building its indexes"""
+        return catalog_digest(tuple(t for t in tools if t.get("is_active", True)), list(backgrounds))
+    
+    def __len__(self) -> int:
+        return len(self.tools)
+    
+    @property
+    def age(self) -> float:
+        """Seconds since the snapshot was loaded"""
+        return time.time() - self.loaded_at
+    
+    def tools_by_profession(self, profession: str, limit: int) -> List[Tool]:
+        """Top tools for a profession, LLMs first when the match is short"""
+        tools = self.index.top(("professions", profession), limit=limit)
+        if len(tools) < limit:
+            llms = self.index.top(("category", "llm"), limit=2)
+            tools = llms + [t for t in tools if t.get("category_id") != "llm"]
+        return tools[:limit]
+    
+    def tools_by_hobby(self, hobby: str, limit: int) -> List[Tool]:
+        return self.index.top(("hobbies", hobby), limit=limit)
+    
+    def hobby_backgrounds(self, hobby: str) -> List[str]:
+        return list(self._backgrounds.get(hobby, ()))
+    
+    def search(self, query: str, limit: int) -> List[Tuple[Tool, float]]:
+        """Ranked full-text search: (tool, score), best first"""
+        return self.search_index.search(query, limit)
+    
+    @property
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "tools": len(self.tools),
+            "professions": len(self.index.keys("professions")),
+            "hobbies": len(self.index.keys("hobbies")),
+            "search_terms": self.search_index.vocabulary_size,
+            "background_hobbies": len(self._backgrounds),
+            "age_seconds": round(self.age, 1),
+            "digest": self.digest,
+            "updated_at": self.updated_at.isoformat(),
+        }
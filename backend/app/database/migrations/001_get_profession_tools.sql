@@ -0,0 +1,44 @@
+-- ============================================================================
+-- get_profession_tools: profession lookup with LLM backfill in one round trip
+-- ============================================================================
+-- Returns the best active tools for a profession. When fewer than p_limit
+-- tools match, the two best LLMs come first, followed by the matching
+-- non-LLM tools (the same result AIToolsRepository used to assemble from
+-- two queries). Tools are ranked by rating, then price, then id.
+--
+-- Called through PostgREST: POST /rest/v1/rpc/get_profession_tools
+-- ============================================================================
+CREATE OR REPLACE FUNCTION get_profession_tools(p_profession TEXT, p_limit INTEGER DEFAULT 5)
+RETURNS SETOF ai_tools
+LANGUAGE sql
+STABLE
+AS $$
+    WITH matched AS (
+        SELECT t AS tool,
+               row_number() OVER (ORDER BY t.rating DESC, t.price_monthly, t.id) AS rank
+        FROM ai_tools t
+        WHERE t.is_active AND t.professions @> ARRAY[p_profession]
+        ORDER BY rank
+        LIMIT p_limit
+    ),
+    short AS (
+        SELECT count(*) < p_limit AS is_short FROM matched
+    ),
+    llms AS (
+        SELECT t AS tool,
+               row_number() OVER (ORDER BY t.rating DESC, t.price_monthly, t.id) AS rank
+        FROM ai_tools t, short
+        WHERE short.is_short AND t.is_active AND t.category_id = 'llm'
+        ORDER BY rank
+        LIMIT 2
+    )
+    SELECT (ordered.tool).*
+    FROM (
+        SELECT tool, 0 AS grp, rank FROM llms
+        UNION ALL
+        SELECT tool, 1 AS grp, rank FROM matched, short
+        WHERE NOT short.is_short OR (tool).category_id IS DISTINCT FROM 'llm'
+    ) ordered
+    ORDER BY ordered.grp, ordered.rank
+    LIMIT p_limit;
+$$;
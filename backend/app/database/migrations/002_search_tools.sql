@@ -0,0 +1,97 @@
+-- ============================================================================
+-- search_tools: ranked full-text and fuzzy search over ai_tools
+-- ============================================================================
+-- The database counterpart of the in-process SearchIndex (app/data):
+--   * full text over name (A), tags (B), description (C) and features (D),
+--     matching any query word as a prefix, ranked with ts_rank
+--   * name substring and trigram similarity (pg_trgm) for partial words
+--     and typos
+-- Both predicates are served by GIN indexes. Results come best first with
+-- their score; ties go to the better rated tool.
+--
+-- Called through PostgREST: POST /rest/v1/rpc/search_tools
+-- ============================================================================
+CREATE EXTENSION IF NOT EXISTS pg_trgm;
+
+-- Weighted search document of a tool (IMMUTABLE so it can be indexed)
+CREATE OR REPLACE FUNCTION ai_tools_search_vector(
+    p_name TEXT,
+    p_tags TEXT[],
+    p_description TEXT,
+    p_features TEXT[]
+)
+RETURNS tsvector
+LANGUAGE sql
+IMMUTABLE
+AS $$
+    SELECT setweight(to_tsvector('english'::regconfig, coalesce(p_name, '')), 'A')
+        || setweight(to_tsvector('english'::regconfig, coalesce(array_to_string(p_tags, ' '), '')), 'B')
+        || setweight(to_tsvector('english'::regconfig, coalesce(p_description, '')), 'C')
+        || setweight(to_tsvector('english'::regconfig, coalesce(array_to_string(p_features, ' '), '')), 'D');
+$$;
+
+CREATE INDEX IF NOT EXISTS idx_ai_tools_search
+    ON ai_tools USING GIN(ai_tools_search_vector(name, tags, description, features));
+CREATE INDEX IF NOT EXISTS idx_ai_tools_name_trgm
+    ON ai_tools USING GIN(name gin_trgm_ops);
+
+CREATE OR REPLACE FUNCTION search_tools(p_query TEXT, p_limit INTEGER DEFAULT 10)
+RETURNS TABLE (
+    id TEXT,
+    name TEXT,
+    description TEXT,
+    category_id TEXT,
+    logo_color TEXT,
+    logo_url TEXT,
+    website_url TEXT,
+    pricing_type TEXT,
+    price_monthly DECIMAL(10,2),
+    rating DECIMAL(2,1),
+    tags TEXT[],
+    professions TEXT[],
+    hobbies TEXT[],
+    cta_text TEXT,
+    features TEXT[],
+    integration_mode TEXT,
+    api_available BOOLEAN,
+    has_free_tier BOOLEAN,
+    is_active BOOLEAN,
+    priority INTEGER,
+    created_at TIMESTAMPTZ,
+    updated_at TIMESTAMPTZ,
+    score REAL
+)
+LANGUAGE sql
+STABLE
+AS $$
+    WITH q AS (
+        -- Any query word (stemmed), as a prefix: BM25-style OR semantics
+        SELECT (
+                   SELECT to_tsquery('simple'::regconfig, string_agg(quote_literal(lexeme) || ':*', ' | '))
+                   FROM unnest(tsvector_to_array(to_tsvector('english'::regconfig, p_query))) AS lexeme
+               ) AS tsq,
+               '%' || replace(replace(replace(p_query, '\', '\\'), '%', '\%'), '_', '\_') || '%' AS pattern
+    ),
+    hits AS (
+        SELECT t.*,
+               (
+                   coalesce(ts_rank(ai_tools_search_vector(t.name, t.tags, t.description, t.features), q.tsq), 0)
+                   + similarity(t.name, p_query)
+               )::REAL AS score
+        FROM ai_tools t, q
+        WHERE t.is_active
+          AND (
+              ai_tools_search_vector(t.name, t.tags, t.description, t.features) @@ q.tsq
+              OR t.name ILIKE q.pattern
+              OR t.name % p_query
+          )
+    )
+    SELECT h.id, h.name, h.description, h.category_id, h.logo_color, h.logo_url,
+           h.website_url, h.pricing_type, h.price_monthly, h.rating, h.tags,
+           h.professions, h.hobbies, h.cta_text, h.features, h.integration_mode,
+           h.api_available, h.has_free_tier, h.is_active, h.priority,
+           h.created_at, h.updated_at, h.score
+    FROM hits h
+    ORDER BY h.score DESC, h.rating DESC, h.id
+    LIMIT p_limit;
+$$;
@@ -0,0 +1,8 @@
+-- ============================================================================
+-- user_toolkits.payload: the complete toolkit response, served by slug
+-- ============================================================================
+-- Generated toolkits are persisted at generation time (ToolkitStore) and
+-- returned unchanged by GET /api/toolkit/{slug}. work_tools / life_tools
+-- keep being filled for queries on the tool lists.
+-- ============================================================================
+ALTER TABLE user_toolkits ADD COLUMN IF NOT EXISTS payload JSONB;
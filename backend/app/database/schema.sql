@@ -184,6 +184,8 @@ CREATE POLICY "Public read access for hobby_backgrounds" ON hobby_backgrounds
 -- ============================================================================
 -- FUNCTIONS
 -- ============================================================================
+-- Query functions called through PostgREST (/rpc) live in migrations/ and
+-- are applied, in file order, after this schema.
 
 -- Function to update updated_at timestamp
 CREATE OR REPLACE FUNCTION update_updated_at_column()
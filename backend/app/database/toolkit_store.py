@@ -0,0 +1,245 @@
+"""
+Toolkit Store
+Persists generated toolkits and serves them back by slug
+"""
+import asyncio
+import hashlib
+import json
+import logging
+import sqlite3
+from concurrent.futures import ThreadPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict, NamedTuple, Optional, Set, TypeVar
+
+from app.config import settings
+from app.database.tools_repository import tools_repository
+from app.models import ToolkitResponse
+from app.services.cache import TTLCache
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+SUPABASE = "supabase"
+SQLITE = "sqlite"
+
+
+class StoredToolkit(NamedTuple):
+    """A toolkit as served: canonical JSON bytes and their strong ETag"""
+    body: bytes
+    etag: str
+
+
+def canonical_toolkit(toolkit: Dict[str, Any]) -> Dict[str, Any]:
+    """The toolkit as ToolkitResponse serializes it: unknown fields dropped, numbers coerced"""
+    return ToolkitResponse.model_validate(toolkit).model_dump(mode="json")
+
+
+def encode_toolkit(toolkit: Dict[str, Any]) -> StoredToolkit:
+    """Canonical JSON (sorted keys, compact) so equal toolkits get equal ETags"""
+    body = json.dumps(toolkit, sort_keys=True, separators=(",", ":"), ensure_ascii=False).encode("utf-8")
+    return StoredToolkit(body, _etag(body))
+
+
+def _etag(body: bytes) -> str:
+    return f'"{hashlib.sha256(body).hexdigest()[:32]}"'
+
+
+def etag_matches(if_none_match: Optional[str], etag: str) -> bool:
+    """Whether an If-None-Match header matches `etag` (weak comparison, RFC 9110)"""
+    if not if_none_match:
+        return False
+    for tag in if_none_match.split(","):
+        tag = tag.strip()
+        if tag == "*" or tag.removeprefix("W/") == etag:
+            return True
+    return False
+
+
+class ToolkitStore:
+    """
+    Generated toolkits by slug: Supabase `user_toolkits` or a local SQLite file
+    
+    TOOLKIT_STORE "auto" uses Supabase when the repository has a client
+    and SQLite otherwise. put() makes a toolkit readable in this process
+    at once (memory cache) and writes it through in the background; get()
+    answers from the cache and falls back to the store. Both backends are
+    blocking, so they run on a small thread pool; SQLite gets a single
+    thread that owns its connection.
+    """
+    
+    def __init__(self):
+        self.backend: Optional[str] = None
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._sqlite: Optional[sqlite3.Connection] = None
+        self._writes: Set[asyncio.Task] = set()
+        
+        self.cache = TTLCache(
+            max_entries=settings.TOOLKIT_STORE_CACHE_MAX_ENTRIES,
+            max_bytes=settings.TOOLKIT_STORE_CACHE_MAX_BYTES,
+            ttl=settings.TOOLKIT_STORE_CACHE_TTL,
+            sizeof=lambda stored: len(stored.body)
+        )
+        self.saves = 0
+        self.save_errors = 0
+        self.store_reads = 0
+        self.not_found = 0
+    
+    async def start(self) -> None:
+        """Pick the backend (after the repository has started) and open it"""
+        backend = settings.TOOLKIT_STORE
+        if backend == "auto":
+            backend = SQLITE if tools_repository.client is None else SUPABASE
+        if backend not in (SUPABASE, SQLITE):
+            logger.warning(f"Unknown TOOLKIT_STORE {backend!r}, toolkits are kept in memory only")
+            return
+        
+        self._executor = ThreadPoolExecutor(
+            max_workers=1 if backend == SQLITE else 4, thread_name_prefix="toolkit-store"
+        )
+        self.backend = backend
+        if backend == SQLITE:
+            await self._run(self._open_sqlite)
+        logger.info(f"🗄️ Toolkit store: {backend}")
+    
+    async def close(self) -> None:
+        """Finish pending writes, then release the backend"""
+        if self._writes:
+            await asyncio.gather(*self._writes, return_exceptions=True)
+        if self._sqlite is not None:
+            await self._run(self._sqlite.close)
+            self._sqlite = None
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+        self.backend = None
+    
+    async def _run(self, fn: Callable[..., T], *args: Any) -> T:
+        return await asyncio.get_running_loop().run_in_executor(self._executor, fn, *args)
+    
+    def put(self, toolkit: Dict[str, Any], hobby: str) -> StoredToolkit:
+        """
+        Serve `toolkit` under its slug from now on; persisted in the background
+        
+        What is stored and hashed is the canonical toolkit, so the returned
+        body is byte for byte what GET /api/toolkit/{slug} serves later.
+        """
+        toolkit = canonical_toolkit(toolkit)
+        stored = encode_toolkit(toolkit)
+        self.cache.set(toolkit["slug"], stored)
+        if self.backend is not None:
+            task = asyncio.ensure_future(self._save(toolkit, hobby, stored))
+            self._writes.add(task)
+            task.add_done_callback(self._writes.discard)
+        return stored
+    
+    async def get(self, slug: str) -> Optional[StoredToolkit]:
+        """The toolkit stored under `slug`, if any"""
+        stored = self.cache.get(slug)
+        if stored is not None:
+            return stored
+        if self.backend is None:
+            self.not_found += 1
+            return None
+        
+        self.store_reads += 1
+        try:
+            if self.backend == SQLITE:
+                body = await self._run(self._sqlite_get, slug)
+                stored = StoredToolkit(body, _etag(body)) if body else None
+            else:
+                payload = await self._supabase_get(slug)
+                stored = encode_toolkit(canonical_toolkit(payload)) if payload else None
+        except Exception as e:
+            logger.error(f"Error loading toolkit {slug}: {e}")
+            return None
+        
+        if stored is None:
+            self.not_found += 1
+            return None
+        self.cache.set(slug, stored)
+        return stored
+    
+    async def _save(self, toolkit: Dict[str, Any], hobby: str, stored: StoredToolkit) -> None:
+        try:
+            if self.backend == SQLITE:
+                await self._run(self._sqlite_put, toolkit, hobby, stored)
+            else:
+                await self._supabase_put(toolkit, hobby)
+            self.saves += 1
+        except Exception as e:
+            self.save_errors += 1
+            logger.error(f"Error saving toolkit {toolkit.get('slug')}: {e}")
+    
+    # =========================================================================
+    # SUPABASE (user_toolkits, database/migrations/003)
+    # =========================================================================
+    
+    async def _supabase_put(self, toolkit: Dict[str, Any], hobby: str) -> None:
+        row = {
+            "id": toolkit["id"],
+            "slug": toolkit["slug"],
+            "user_name": toolkit["userName"],
+            "profession": toolkit["professionSlug"],
+            "hobby": hobby,
+            "work_tools": toolkit["workTools"],
+            "life_tools": toolkit["lifeTools"],
+            "payload": toolkit,
+        }
+        query = tools_repository.client.table("user_toolkits").upsert(row, on_conflict="slug")
+        await self._run(query.execute)
+    
+    async def _supabase_get(self, slug: str) -> Optional[Dict[str, Any]]:
+        query = tools_repository.client.table("user_toolkits").select("payload").eq("slug", slug).limit(1)
+        response = await self._run(query.execute)
+        return response.data[0]["payload"] if response.data else None
+    
+    # =========================================================================
+    # SQLITE (runs on the store's single thread)
+    # =========================================================================
+    
+    def _open_sqlite(self) -> None:
+        path = Path(settings.TOOLKIT_SQLITE_PATH)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._sqlite = sqlite3.connect(path, check_same_thread=False)
+        self._sqlite.execute("PRAGMA journal_mode=WAL")
+        self._sqlite.execute(
+            "CREATE TABLE IF NOT EXISTS toolkits ("
+            " slug TEXT PRIMARY KEY,"
+            " id TEXT NOT NULL,"
+            " profession TEXT NOT NULL,"
+            " hobby TEXT NOT NULL,"
+            " created_at TEXT NOT NULL,"
+            " body TEXT NOT NULL)"
+        )
+        self._sqlite.commit()
+    
+    def _sqlite_put(self, toolkit: Dict[str, Any], hobby: str, stored: StoredToolkit) -> None:
+        self._sqlite.execute(
+            "INSERT INTO toolkits (slug, id, profession, hobby, created_at, body) VALUES (?, ?, ?, ?, ?, ?)"
+            " ON CONFLICT(slug) DO UPDATE SET id = excluded.id, profession = excluded.profession,"
+            " hobby = excluded.hobby, created_at = excluded.created_at, body = excluded.body",
+            (toolkit["slug"], toolkit["id"], toolkit["professionSlug"], hobby, toolkit["createdAt"],
+             stored.body.decode("utf-8"))
+        )
+        self._sqlite.commit()
+    
+    def _sqlite_get(self, slug: str) -> Optional[bytes]:
+        row = self._sqlite.execute("SELECT body FROM toolkits WHERE slug = ?", (slug,)).fetchone()
+        return row[0].encode("utf-8") if row else None
+    
+    @property
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "backend": self.backend,
+            "cache": self.cache.stats,
+            "saves": self.saves,
+            "save_errors": self.save_errors,
+            "pending_writes": len(self._writes),
+            "store_reads": self.store_reads,
+            "not_found": self.not_found,
+        }
+
+
+# Global instance
+toolkit_store = ToolkitStore()
@@ -3,22 +3,100 @@ AI Tools Repository
 Handles all database operations for AI tools
 Falls back to local data if Supabase is not available
 """
+import asyncio
 import logging
-from typing import List, Dict, Any, Optional
+import time
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
+from typing import List, Dict, Any, Mapping, Optional, Set, Tuple
 from functools import lru_cache
 
+from app.config import settings
 from app.database.supabase_client import get_supabase, SupabaseClient
+from app.database.catalog_snapshot import CatalogSnapshot, catalog_digest
+from app.data.catalog_index import CatalogIndex, ROW_FIELDS, row_rank
+from app.data.search_index import ROW_TEXT_FIELDS, SearchIndex
+from app.data.fallback_catalog import FALLBACK_BACKGROUNDS, FALLBACK_REVISION, FALLBACK_TOOLS
 
 logger = logging.getLogger(__name__)
 
+# Columns requested from `ai_tools` per use. Every query names its profile
+# so rows carry only what the caller reads (see ToolkitGenerator formatters).
+COLUMN_PROFILES: Dict[str, Tuple[str, ...]] = {
+    "work_card": (
+        "id", "name", "description", "category_id", "logo_color", "logo_url", "website_url",
+        "rating", "price_monthly", "cta_text", "integration_mode", "api_available",
+    ),
+    "life_card": ("id", "name", "description", "website_url"),
+    "search_hit": (
+        "id", "name", "description", "category_id", "logo_color", "logo_url", "website_url",
+        "rating", "price_monthly", "pricing_type", "tags", "features",
+    ),
+    "full": ("*",),
+}
+
+# The snapshot keeps every card column plus the fields it indexes, so it can
+# answer any profile but "full" (and updated_at, which dates the catalog)
+SNAPSHOT_COLUMNS: Tuple[str, ...] = tuple(dict.fromkeys(
+    COLUMN_PROFILES["work_card"] + COLUMN_PROFILES["life_card"] + COLUMN_PROFILES["search_hit"]
+    + ("tags", "features", "professions", "hobbies", "is_active", "updated_at")
+))
+
+FALLBACK_DIGEST = catalog_digest(FALLBACK_TOOLS, FALLBACK_BACKGROUNDS)
+# None when FALLBACK_REVISION was recorded for other rows (then undated)
+FALLBACK_UPDATED_AT: Optional[datetime] = (
+    FALLBACK_REVISION[1] if FALLBACK_REVISION[0] == FALLBACK_DIGEST else None
+)
+if FALLBACK_UPDATED_AT is None:
+    logger.warning(f"FALLBACK_REVISION is stale: the fallback catalog digest is now {FALLBACK_DIGEST}")
+
+# Error codes for a database function that does not exist (PostgREST
+# schema cache miss, Postgres undefined_function): its migration is missing
+MISSING_FUNCTION_CODES = frozenset({"PGRST202", "42883"})
+
+
+@lru_cache(maxsize=None)
+def select_columns(profile: str) -> str:
+    """PostgREST `select` value for a column profile"""
+    return ",".join(COLUMN_PROFILES[profile])
+
 
 class AIToolsRepository:
-    """Repository for AI tools database operations"""
+    """
+    Repository for AI tools database operations
+    
+    supabase-py only offers a blocking client, so every query runs on a
+    bounded thread pool (SUPABASE_MAX_WORKERS) instead of the event loop.
+    
+    When the catalog snapshot is enabled, the active catalog is loaded at
+    startup and reloaded every CATALOG_REFRESH_INTERVAL seconds; lookups
+    are answered from the snapshot without a round trip. A refresh builds a
+    new snapshot and swaps the reference, so readers never see a partial one.
     
-    def __init__(self):
+    Rows returned by the getters are shared between requests (snapshot rows,
+    or the frozen FALLBACK_TOOLS); callers must copy before mutating.
+    """
+    
+    def __init__(self, max_workers: int = settings.SUPABASE_MAX_WORKERS):
         self._client = None
-        self._cache = {}
+        self._snapshot: Optional[CatalogSnapshot] = None
+        self._refresh_task: Optional[asyncio.Task] = None
         self._use_fallback = False
+        self._fallback_index: Optional[CatalogIndex] = None
+        self._fallback_search_index: Optional[SearchIndex] = None
+        self._missing_rpcs: Set[str] = set()
+        
+        self.max_workers = max_workers
+        self._executor: Optional[ThreadPoolExecutor] = None
+        self._in_flight = 0
+        self.queries = 0
+        self.errors = 0
+        self.max_in_flight = 0
+        self.total_query_time = 0.0
+        self.snapshot_refreshes = 0
+        self.snapshot_unchanged = 0
+        self.snapshot_failures = 0
+        self.rpc_fallbacks = 0
     
     @property
     def client(self):
@@ -29,82 +107,297 @@ class AIToolsRepository:
                 logger.info("Using fallback local data (Supabase not available)")
         return self._client
     
-    async def get_all_tools(self, active_only: bool = True) -> List[Dict[str, Any]]:
+    async def start(self) -> None:
+        """Create the query thread pool and the client, then load the catalog snapshot"""
+        client = await asyncio.get_running_loop().run_in_executor(self._get_executor(), lambda: self.client)
+        if client is None or not settings.CATALOG_SNAPSHOT_ENABLED:
+            return
+        await self.refresh_snapshot()
+        self._refresh_task = asyncio.create_task(self._refresh_loop(settings.CATALOG_REFRESH_INTERVAL))
+    
+    async def close(self) -> None:
+        """Stop the snapshot refresh and shut down the query thread pool"""
+        if self._refresh_task is not None:
+            self._refresh_task.cancel()
+            try:
+                await self._refresh_task
+            except asyncio.CancelledError:
+                pass
+            self._refresh_task = None
+        if self._executor is not None:
+            self._executor.shutdown(wait=False, cancel_futures=True)
+            self._executor = None
+    
+    def _get_executor(self) -> ThreadPoolExecutor:
+        if self._executor is None:
+            self._executor = ThreadPoolExecutor(
+                max_workers=self.max_workers,
+                thread_name_prefix="supabase"
+            )
+        return self._executor
+    
+    async def _execute(self, query) -> Any:
+        """Run a supabase-py query builder's blocking execute() on the thread pool"""
+        self.queries += 1
+        self._in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self._in_flight)
+        start = time.monotonic()
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self._get_executor(), query.execute)
+        except Exception:
+            self.errors += 1
+            raise
+        finally:
+            self._in_flight -= 1
+            self.total_query_time += time.monotonic() - start
+    
+    async def refresh_snapshot(self) -> bool:
+        """
+        Load the active catalog and swap in a new snapshot
+        
+        The rows are hashed first: when they match the current snapshot,
+        it keeps serving and no indexes are rebuilt. On failure the current
+        snapshot (if any) keeps serving too.
+        """
+        try:
+            tools, backgrounds = await asyncio.gather(
+                self._fetch_all("ai_tools", columns=",".join(SNAPSHOT_COLUMNS), active_only=True),
+                self._fetch_all("hobby_backgrounds", columns="hobby,image_url,priority"),
+            )
+            loop = asyncio.get_running_loop()
+            if self._snapshot is not None:
+                digest = await loop.run_in_executor(
+                    self._get_executor(), CatalogSnapshot.digest_of, tools, backgrounds
+                )
+                if digest == self._snapshot.digest:
+                    self.snapshot_unchanged += 1
+                    return True
+            snapshot = await loop.run_in_executor(self._get_executor(), CatalogSnapshot, tools, backgrounds)
+        except Exception as e:
+            self.snapshot_failures += 1
+            logger.error(f"Catalog snapshot refresh failed: {e}")
+            return False
+        
+        self._snapshot = snapshot
+        self.snapshot_refreshes += 1
+        logger.info(f"📦 Catalog snapshot loaded: {len(snapshot)} tools")
+        return True
+    
+    async def _refresh_loop(self, interval: float) -> None:
+        while True:
+            await asyncio.sleep(interval)
+            await self.refresh_snapshot()
+    
+    async def _fetch_all(
+        self,
+        table: str,
+        columns: str = "*",
+        active_only: bool = False
+    ) -> List[Dict[str, Any]]:
+        """Read a whole table, paging past the PostgREST row cap"""
+        page = settings.CATALOG_PAGE_SIZE
+        rows: List[Dict[str, Any]] = []
+        while True:
+            query = self.client.table(table).select(columns)
+            if active_only:
+                query = query.eq("is_active", True)
+            response = await self._execute(query.order("id").range(len(rows), len(rows) + page - 1))
+            batch = response.data or []
+            rows.extend(batch)
+            if len(batch) < page:
+                return rows
+    
+    @property
+    def snapshot(self) -> Optional[CatalogSnapshot]:
+        return self._snapshot
+    
+    @property
+    def catalog_version(self) -> Optional[str]:
+        """
+        Content digest of the catalog served: changes only when the catalog does
+        
+        Refreshes that fetch the same rows keep the version. None when
+        queries go to the database live.
+        """
+        stamp = self.catalog_stamp
+        return stamp[0] if stamp is not None else None
+    
+    @property
+    def catalog_stamp(self) -> Optional[Tuple[str, Optional[datetime]]]:
+        """
+        (content digest, last update) of the catalog served
+        
+        The same catalog gives the same stamp in every worker and across
+        restarts. None when queries go to the database live; the date is
+        None for a fallback catalog whose FALLBACK_REVISION is stale.
+        """
+        if self._use_fallback:
+            return FALLBACK_DIGEST, FALLBACK_UPDATED_AT
+        if self._snapshot is not None:
+            return self._snapshot.digest, self._snapshot.updated_at
+        return None
+    
+    def _snapshot_for(self, profile: str) -> Optional[CatalogSnapshot]:
+        """The snapshot, if its rows cover `profile`"""
+        return self._snapshot if profile != "full" else None
+    
+    @property
+    def stats(self) -> Dict[str, Any]:
+        """Query counters for the database thread pool and snapshot state"""
+        return {
+            "fallback": self._use_fallback,
+            "max_workers": self.max_workers,
+            "queries": self.queries,
+            "errors": self.errors,
+            "in_flight": self._in_flight,
+            "max_in_flight": self.max_in_flight,
+            "avg_query_ms": round(self.total_query_time / self.queries * 1000, 2) if self.queries else 0.0,
+            "snapshot": self._snapshot.stats if self._snapshot is not None else None,
+            "snapshot_refreshes": self.snapshot_refreshes,
+            "snapshot_unchanged": self.snapshot_unchanged,
+            "snapshot_failures": self.snapshot_failures,
+            "rpc_fallbacks": self.rpc_fallbacks,
+            "missing_rpcs": sorted(self._missing_rpcs),
+        }
+    
+    async def get_all_tools(
+        self,
+        active_only: bool = True,
+        profile: str = "full"
+    ) -> List[Dict[str, Any]]:
         """Get all AI tools from database"""
         if self._use_fallback or not self.client:
-            return self._get_fallback_tools()
+            return list(self._get_fallback_tools())
+        
+        snapshot = self._snapshot_for(profile)
+        if snapshot is not None and active_only:
+            return list(snapshot.tools)
         
         try:
-            query = self.client.table("ai_tools").select("*")
+            query = self.client.table("ai_tools").select(select_columns(profile))
             if active_only:
                 query = query.eq("is_active", True)
             
-            response = query.execute()
+            response = await self._execute(query)
             return response.data or []
         except Exception as e:
             logger.error(f"Error fetching tools: {e}")
-            return self._get_fallback_tools()
+            return list(self._get_fallback_tools())
     
     async def get_tools_by_profession(
         self, 
         profession: str, 
-        limit: int = 5
+        limit: int = 5,
+        profile: str = "work_card"
     ) -> List[Dict[str, Any]]:
         """Get tools matching a profession"""
         if self._use_fallback or not self.client:
             return self._filter_fallback_by_profession(profession, limit)
         
+        snapshot = self._snapshot_for(profile)
+        if snapshot is not None:
+            return snapshot.tools_by_profession(profession, limit)
+        
         try:
-            # Query tools where profession is in the professions array
-            response = self.client.table("ai_tools")\
-                .select("*")\
-                .eq("is_active", True)\
-                .contains("professions", [profession])\
-                .order("rating", desc=True)\
-                .limit(limit)\
-                .execute()
+            if self._rpc_enabled("get_profession_tools", settings.SUPABASE_PROFESSION_RPC):
+                # Matching tools with the LLM backfill, ranked server side
+                try:
+                    response = await self._execute(
+                        self.client.rpc(
+                            "get_profession_tools",
+                            {"p_profession": profession, "p_limit": limit}
+                        )
+                        .select(select_columns(profile))
+                    )
+                    return response.data or []
+                except Exception as e:
+                    self._rpc_failed("get_profession_tools", e)
+            
+            # Without the function: tools where profession is in the professions
+            # array, backfilled with the top LLMs when the match is short
+            query = self._execute(
+                self.client.table("ai_tools")
+                .select(select_columns(profile))
+                .eq("is_active", True)
+                .contains("professions", [profession])
+                .order("rating", desc=True)
+                .limit(limit)
+            )
+            if settings.SUPABASE_SPECULATIVE_BACKFILL:
+                # Fetch the backfill alongside, trading a query for a round trip
+                response, llm_response = await asyncio.gather(query, self._execute(self._llm_backfill(profile)))
+            else:
+                response, llm_response = await query, None
             
             tools = response.data or []
             
-            # If not enough tools, get LLMs
+            # If not enough tools, add LLMs
             if len(tools) < limit:
-                llm_response = self.client.table("ai_tools")\
-                    .select("*")\
-                    .eq("category_id", "llm")\
-                    .eq("is_active", True)\
-                    .order("rating", desc=True)\
-                    .limit(2)\
-                    .execute()
-                
+                if llm_response is None:
+                    llm_response = await self._execute(self._llm_backfill(profile))
                 llms = llm_response.data or []
                 tools = llms + [t for t in tools if t.get("category_id") != "llm"]
             
             return tools[:limit]
-            
+        
         except Exception as e:
             logger.error(f"Error fetching tools for profession {profession}: {e}")
             return self._filter_fallback_by_profession(profession, limit)
     
+    def _rpc_enabled(self, name: str, enabled: bool) -> bool:
+        """Whether to call database function `name`: configured on and not found missing"""
+        return enabled and name not in self._missing_rpcs
+    
+    def _rpc_failed(self, name: str, error: Exception) -> None:
+        """
+        Note a failed database function call, which the caller answers
+        with plain table queries instead. A function the database does
+        not have is not called again by this process.
+        """
+        self.rpc_fallbacks += 1
+        if getattr(error, "code", None) in MISSING_FUNCTION_CODES:
+            self._missing_rpcs.add(name)
+            logger.warning(f"Database function {name}() not found (migration not applied?), using table queries")
+        else:
+            logger.warning(f"Database function {name}() failed, using table queries: {error}")
+    
+    def _llm_backfill(self, profile: str):
+        """Query for the top 2 LLMs, which fill short profession results"""
+        return (
+            self.client.table("ai_tools")
+            .select(select_columns(profile))
+            .eq("category_id", "llm")
+            .eq("is_active", True)
+            .order("rating", desc=True)
+            .limit(2)
+        )
+    
     async def get_tools_by_hobby(
         self, 
         hobby: str, 
-        limit: int = 2
+        limit: int = 2,
+        profile: str = "life_card"
     ) -> List[Dict[str, Any]]:
         """Get tools matching a hobby"""
         if self._use_fallback or not self.client:
             return self._filter_fallback_by_hobby(hobby, limit)
         
+        snapshot = self._snapshot_for(profile)
+        if snapshot is not None:
+            return snapshot.tools_by_hobby(hobby, limit)
+        
         try:
-            response = self.client.table("ai_tools")\
-                .select("*")\
-                .eq("is_active", True)\
-                .contains("hobbies", [hobby])\
-                .order("rating", desc=True)\
-                .limit(limit)\
-                .execute()
+            response = await self._execute(
+                self.client.table("ai_tools")
+                .select(select_columns(profile))
+                .eq("is_active", True)
+                .contains("hobbies", [hobby])
+                .order("rating", desc=True)
+                .limit(limit)
+            )
             
             return response.data or []
-            
+        
         except Exception as e:
             logger.error(f"Error fetching tools for hobby {hobby}: {e}")
             return self._filter_fallback_by_hobby(hobby, limit)
@@ -114,17 +407,22 @@ class AIToolsRepository:
         if self._use_fallback or not self.client:
             return self._get_fallback_backgrounds(hobby)
         
+        snapshot = self._snapshot
+        if snapshot is not None:
+            return snapshot.hobby_backgrounds(hobby) or self._get_fallback_backgrounds(hobby)
+        
         try:
-            response = self.client.table("hobby_backgrounds")\
-                .select("image_url")\
-                .eq("hobby", hobby)\
-                .order("priority")\
-                .execute()
+            response = await self._execute(
+                self.client.table("hobby_backgrounds")
+                .select("image_url")
+                .eq("hobby", hobby)
+                .order("priority")
+            )
             
             if response.data:
                 return [r["image_url"] for r in response.data]
             return self._get_fallback_backgrounds(hobby)
-            
+        
         except Exception as e:
             logger.error(f"Error fetching backgrounds for {hobby}: {e}")
             return self._get_fallback_backgrounds(hobby)
@@ -132,327 +430,105 @@ class AIToolsRepository:
     async def search_tools(
         self, 
         query: str, 
-        limit: int = 10
+        limit: int = 10,
+        profile: str = "search_hit"
     ) -> List[Dict[str, Any]]:
-        """Search tools by name or tags"""
+        """
+        Search tools by name, tags, description and features
+        
+        Returns rows best first, each with its relevance "score"
+        """
         if self._use_fallback or not self.client:
             return self._search_fallback(query, limit)
         
+        snapshot = self._snapshot_for(profile)
+        if snapshot is not None:
+            return self._scored(snapshot.search(query, limit))
+        
         try:
-            # Search in name and tags
-            response = self.client.table("ai_tools")\
-                .select("*")\
-                .eq("is_active", True)\
-                .ilike("name", f"%{query}%")\
-                .limit(limit)\
-                .execute()
+            if self._rpc_enabled("search_tools", settings.SUPABASE_SEARCH_RPC):
+                # Full-text + trigram search, ranked server side
+                columns = select_columns(profile)
+                try:
+                    response = await self._execute(
+                        self.client.rpc("search_tools", {"p_query": query, "p_limit": limit})
+                        .select(columns if columns == "*" else columns + ",score")
+                    )
+                    return response.data or []
+                except Exception as e:
+                    self._rpc_failed("search_tools", e)
             
-            return response.data or []
+            # Without the function: name substring only, unranked
+            response = await self._execute(
+                self.client.table("ai_tools")
+                .select(select_columns(profile))
+                .eq("is_active", True)
+                .ilike("name", f"%{query}%")
+                .limit(limit)
+            )
             
+            return response.data or []
+        
         except Exception as e:
             logger.error(f"Error searching tools: {e}")
             return self._search_fallback(query, limit)
     
+    @staticmethod
+    def _scored(hits: List[Tuple[Mapping[str, Any], float]]) -> List[Dict[str, Any]]:
+        """Copies of shared rows with their search score"""
+        return [dict(tool, score=round(score, 4)) for tool, score in hits]
+    
     # =========================================================================
     # FALLBACK DATA (minimal set for when DB is not available)
     # =========================================================================
     
-    def _get_fallback_tools(self) -> List[Dict[str, Any]]:
-        """Return fallback tools when database is not available"""
-        return [
-            # LLMs
-            {
-                "id": "chatgpt",
-                "name": "ChatGPT",
-                "description": "OpenAI's versatile AI assistant for writing, coding, and analysis.",
-                "category_id": "llm",
-                "logo_color": "#10A37F",
-                "logo_url": "https://upload.wikimedia.org/wikipedia/commons/0/04/ChatGPT_logo.svg",
-                "website_url": "https://chat.openai.com",
-                "pricing_type": "freemium",
-                "price_monthly": 20,
-                "rating": 4.9,
-                "tags": ["ai", "writing", "coding"],
-                "professions": ["developer", "designer", "marketer", "writer", "data-scientist", "product-manager"],
-                "hobbies": ["coding", "writing"],
-                "cta_text": "Try Free",
-                "features": ["GPT-4", "Code interpreter", "Plugins"],
-                "integration_mode": "paid_api",
-                "api_available": True,
-                "has_free_tier": True,
-            },
-            {
-                "id": "claude",
-                "name": "Claude",
-                "description": "Anthropic's AI for nuanced analysis and long-form content.",
-                "category_id": "llm",
-                "logo_color": "#D4A574",
-                "logo_url": None,
-                "website_url": "https://claude.ai",
-                "pricing_type": "freemium",
-                "price_monthly": 20,
-                "rating": 4.8,
-                "tags": ["ai", "analysis", "writing"],
-                "professions": ["developer", "writer", "researcher", "consultant"],
-                "hobbies": ["writing", "reading"],
-                "cta_text": "Try Free",
-                "features": ["200K context", "Artifacts"],
-                "integration_mode": "paid_api",
-                "api_available": True,
-                "has_free_tier": True,
-            },
-            # Code tools
-            {
-                "id": "github-copilot",
-                "name": "GitHub Copilot",
-                "description": "AI pair programmer that suggests code in real-time.",
-                "category_id": "code_assistant",
-                "logo_color": "#000000",
-                "logo_url": "https://github.githubassets.com/images/modules/logos_page/GitHub-Mark.png",
-                "website_url": "https://github.com/features/copilot",
-                "pricing_type": "paid",
-                "price_monthly": 10,
-                "rating": 4.9,
-                "tags": ["coding", "ai", "autocomplete"],
-                "professions": ["developer", "software-engineer", "blockchain-engineer"],
-                "hobbies": ["coding"],
-                "cta_text": "Try Free",
-                "features": ["Code suggestions", "Multi-language", "IDE integration"],
-                "integration_mode": "paid_api",
-                "api_available": False,
-                "has_free_tier": False,
-            },
-            {
-                "id": "linear",
-                "name": "Linear",
-                "description": "Streamlined issue tracking built for modern product teams.",
-                "category_id": "project_mgmt",
-                "logo_color": "#5E6AD2",
-                "logo_url": "https://asset.brandfetch.io/idaeNz7NsW/id-dQuXyBh.svg",
-                "website_url": "https://linear.app",
-                "pricing_type": "freemium",
-                "price_monthly": 8,
-                "rating": 4.9,
-                "tags": ["project", "issues", "agile"],
-                "professions": ["product-manager", "developer", "designer"],
-                "hobbies": [],
-                "cta_text": "Start Free",
-                "features": ["Cycles", "Roadmaps", "GitHub sync"],
-                "integration_mode": "free_api",
-                "api_available": True,
-                "has_free_tier": True,
-            },
-            {
-                "id": "raycast",
-                "name": "Raycast",
-                "description": "Productivity launcher with AI commands, snippets, and integrations.",
-                "category_id": "automation",
-                "logo_color": "#FF6363",
-                "logo_url": "https://asset.brandfetch.io/idwCAv24ti/id3LDGCDoT.svg",
-                "website_url": "https://raycast.com",
-                "pricing_type": "freemium",
-                "price_monthly": 8,
-                "rating": 4.9,
-                "tags": ["productivity", "launcher", "automation"],
-                "professions": ["developer", "designer", "product-manager"],
-                "hobbies": ["coding"],
-                "cta_text": "Download Free",
-                "features": ["AI commands", "Snippets", "Extensions"],
-                "integration_mode": "free_api",
-                "api_available": True,
-                "has_free_tier": True,
-            },
-            {
-                "id": "figma",
-                "name": "Figma",
-                "description": "Collaborative design tool for UI/UX with AI-powered features.",
-                "category_id": "design",
-                "logo_color": "#F24E1E",
-                "logo_url": "https://upload.wikimedia.org/wikipedia/commons/3/33/Figma-logo.svg",
-                "website_url": "https://figma.com",
-                "pricing_type": "freemium",
-                "price_monthly": 15,
-                "rating": 4.9,
-                "tags": ["design", "ui", "prototyping"],
-                "professions": ["designer", "product-manager"],
-                "hobbies": ["art"],
-                "cta_text": "Try Free",
-                "features": ["Dev mode", "Prototyping", "Components"],
-                "integration_mode": "free_api",
-                "api_available": True,
-                "has_free_tier": True,
-            },
-            # Gaming tools
-            {
-                "id": "discord",
-                "name": "Discord",
-                "description": "Voice, video, and text chat platform for gamers and communities.",
-                "category_id": "communication",
-                "logo_color": "#5865F2",
-                "logo_url": "https://asset.brandfetch.io/idaSYDn1qQ/id5VXzVct_.svg",
-                "website_url": "https://discord.com",
-                "pricing_type": "freemium",
-                "price_monthly": 0,
-                "rating": 4.8,
-                "tags": ["gaming", "voice", "community"],
-                "professions": ["game-designer"],
-                "hobbies": ["gaming"],
-                "cta_text": "Join Free",
-                "features": ["Voice channels", "Screen share", "Bots"],
-                "integration_mode": "free_api",
-                "api_available": True,
-                "has_free_tier": True,
-            },
-            {
-                "id": "obs-studio",
-                "name": "OBS Studio",
-                "description": "Free streaming and recording software for gamers and creators.",
-                "category_id": "video",
-                "logo_color": "#302E31",
-                "logo_url": None,
-                "website_url": "https://obsproject.com",
-                "pricing_type": "free",
-                "price_monthly": 0,
-                "rating": 4.9,
-                "tags": ["streaming", "recording", "gaming"],
-                "professions": ["game-designer"],
-                "hobbies": ["gaming"],
-                "cta_text": "Download Free",
-                "features": ["Live streaming", "Recording", "Scenes"],
-                "integration_mode": "redirect",
-                "api_available": False,
-                "has_free_tier": True,
-            },
-            # Fitness/Lifestyle tools
-            {
-                "id": "strava",
-                "name": "Strava",
-                "description": "Track runs and rides with AI performance insights.",
-                "category_id": "fitness",
-                "logo_color": "#FC4C02",
-                "logo_url": "https://asset.brandfetch.io/idLhmxXoW9/idMi_Zd03L.svg",
-                "website_url": "https://strava.com",
-                "pricing_type": "freemium",
-                "price_monthly": 12,
-                "rating": 4.7,
-                "tags": ["running", "cycling", "fitness"],
-                "professions": [],
-                "hobbies": ["running", "fitness", "hiking"],
-                "cta_text": "Join Free",
-                "features": ["GPS tracking", "Segments", "Clubs"],
-                "integration_mode": "free_api",
-                "api_available": True,
-                "has_free_tier": True,
-            },
-            {
-                "id": "alltrails",
-                "name": "AllTrails",
-                "description": "Discover hiking trails with AI recommendations and offline maps.",
-                "category_id": "lifestyle",
-                "logo_color": "#428813",
-                "logo_url": "https://asset.brandfetch.io/idFXnIWKeB/idvL-YIW-S.svg",
-                "website_url": "https://alltrails.com",
-                "pricing_type": "freemium",
-                "price_monthly": 3,
-                "rating": 4.8,
-                "tags": ["hiking", "trails", "outdoors"],
-                "professions": [],
-                "hobbies": ["hiking", "running", "fitness"],
-                "cta_text": "Explore Free",
-                "features": ["Trail maps", "Reviews", "Offline"],
-                "integration_mode": "free_api",
-                "api_available": True,
-                "has_free_tier": True,
-            },
-        ]
+    def _get_fallback_tools(self) -> Tuple[Mapping[str, Any], ...]:
+        """Return fallback tools when database is not available (shared, read-only)"""
+        return FALLBACK_TOOLS
+    
+    @property
+    def fallback_index(self) -> CatalogIndex:
+        """Inverted index over the fallback catalog (built on first use)"""
+        if self._fallback_index is None:
+            self._fallback_index = CatalogIndex(self._get_fallback_tools(), ROW_FIELDS, row_rank)
+        return self._fallback_index
     
     def _filter_fallback_by_profession(self, profession: str, limit: int) -> List[Dict]:
-        """Filter fallback tools by profession"""
-        tools = self._get_fallback_tools()
+        """Filter fallback tools by profession (best rated first)"""
+        index = self.fallback_index
         profession = profession.lower().replace(" ", "-")
         
         # Get LLMs first
-        llms = [t for t in tools if t["category_id"] == "llm"][:2]
+        llms = index.top(("category", "llm"), limit=2)
         
         # Get matching vertical tools
-        vertical = [
-            t for t in tools 
-            if t["category_id"] != "llm" and (
-                profession in t.get("professions", []) or
-                any(p in profession for p in t.get("professions", []))
-            )
-        ]
+        vertical = [t for t in index.match(profession, "professions") if t["category_id"] != "llm"]
         
         # If no matches, get high-rated tools
         if not vertical:
-            vertical = sorted(
-                [t for t in tools if t["category_id"] != "llm"],
-                key=lambda x: -x.get("rating", 0)
-            )
+            vertical = [t for t in index.ranked if t["category_id"] != "llm"]
         
         result = llms + vertical
         return result[:limit]
     
     def _filter_fallback_by_hobby(self, hobby: str, limit: int) -> List[Dict]:
-        """Filter fallback tools by hobby"""
-        tools = self._get_fallback_tools()
-        hobby = hobby.lower()
-        
-        matching = [
-            t for t in tools
-            if hobby in t.get("hobbies", []) or
-               any(h in hobby for h in t.get("hobbies", []))
-        ]
-        
-        return matching[:limit]
+        """Filter fallback tools by hobby (best rated first)"""
+        return self.fallback_index.match(hobby.lower(), "hobbies", limit=limit)
     
     def _get_fallback_backgrounds(self, hobby: str) -> List[str]:
         """Get fallback background images"""
-        backgrounds = {
-            "hiking": [
-                "https://images.unsplash.com/photo-1551632811-561732d1e306?w=800&q=80",
-                "https://images.unsplash.com/photo-1464822759023-fed622ff2c3b?w=800&q=80",
-            ],
-            "gaming": [
-                "https://images.unsplash.com/photo-1542751371-adc38448a05e?w=800&q=80",
-                "https://images.unsplash.com/photo-1538481199705-c710c4e965fc?w=800&q=80",
-            ],
-            "fitness": [
-                "https://images.unsplash.com/photo-1571019613454-1cb2f99b2d8b?w=800&q=80",
-                "https://images.unsplash.com/photo-1534368959878-b5cd06801e27?w=800&q=80",
-            ],
-            "running": [
-                "https://images.unsplash.com/photo-1571008887538-b36bb32f4571?w=800&q=80",
-                "https://images.unsplash.com/photo-1476480862126-209bfaa8edc8?w=800&q=80",
-            ],
-            "traveling": [
-                "https://images.unsplash.com/photo-1488646953014-85cb44e25828?w=800&q=80",
-                "https://images.unsplash.com/photo-1436491865332-7a61a109cc05?w=800&q=80",
-            ],
-            "cooking": [
-                "https://images.unsplash.com/photo-1556909114-f6e7ad7d3136?w=800&q=80",
-                "https://images.unsplash.com/photo-1490645935967-10de6ba17061?w=800&q=80",
-            ],
-            "photography": [
-                "https://images.unsplash.com/photo-1502920917128-1aa500764cbd?w=800&q=80",
-                "https://images.unsplash.com/photo-1542038784456-1ea8e935640e?w=800&q=80",
-            ],
-        }
-        return backgrounds.get(hobby, backgrounds.get("fitness", []))
+        return list(FALLBACK_BACKGROUNDS.get(hobby, FALLBACK_BACKGROUNDS["fitness"]))
+    
+    @property
+    def fallback_search_index(self) -> SearchIndex:
+        """Search index over the fallback catalog (built on first use)"""
+        if self._fallback_search_index is None:
+            self._fallback_search_index = SearchIndex(self._get_fallback_tools(), ROW_TEXT_FIELDS, row_rank)
+        return self._fallback_search_index
     
     def _search_fallback(self, query: str, limit: int) -> List[Dict]:
         """Search fallback tools"""
-        tools = self._get_fallback_tools()
-        query = query.lower()
-        
-        matching = [
-            t for t in tools
-            if query in t["name"].lower() or
-               query in t["description"].lower() or
-               any(query in tag for tag in t.get("tags", []))
-        ]
-        
-        return matching[:limit]
+        return self._scored(self.fallback_search_index.search(query, limit))
 
 
 # Global instance
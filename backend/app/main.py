@@ -8,6 +8,10 @@ from fastapi.middleware.cors import CORSMiddleware
 
 from app.config import settings
 from app.api import health, generate
+from app.services.gemini_service import gemini_service
+from app.database.tools_repository import tools_repository
+from app.services.toolkit_generator import toolkit_generator
+from app.database.toolkit_store import toolkit_store
 
 # Configure logging
 logging.basicConfig(
@@ -24,11 +28,18 @@ async def lifespan(app: FastAPI):
     logger.info(f"🚀 Starting {settings.APP_NAME} v{settings.APP_VERSION}")
     logger.info(f"📍 Running on http://{settings.HOST}:{settings.PORT}")
     logger.info(f"🤖 Using Gemini model: {settings.GEMINI_MODEL}")
+    await gemini_service.start()
+    await tools_repository.start()
+    await toolkit_store.start()
+    await toolkit_generator.materialize()
     
     yield
     
     # Shutdown
     logger.info("👋 Shutting down...")
+    await gemini_service.close()
+    await toolkit_store.close()
+    await tools_repository.close()
 
 
 # Create FastAPI app
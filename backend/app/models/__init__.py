@@ -0,0 +1,6 @@
+"""
+API models shared between routes and storage
+"""
+from app.models.toolkit import LifeTool, ToolkitResponse, ToolkitSpecs, WorkTool
+
+__all__ = ["LifeTool", "ToolkitResponse", "ToolkitSpecs", "WorkTool"]
@@ -0,0 +1,53 @@
+"""
+Toolkit Models
+The toolkit payload as the API serves it
+"""
+from typing import List, Optional
+
+from pydantic import BaseModel
+
+
+class WorkTool(BaseModel):
+    """Work mode tool"""
+    name: str
+    logo: str
+    logoUrl: Optional[str] = None  # Actual logo image URL
+    rating: float
+    description: str
+    ctaText: str
+    category: str
+    price: float
+    url: Optional[str] = None  # Tool website URL for redirection
+
+
+class LifeTool(BaseModel):
+    """Life mode tool"""
+    name: str
+    description: str
+    backgroundImage: str
+    url: Optional[str] = None  # Tool website URL for redirection
+
+
+class ToolkitSpecs(BaseModel):
+    """Toolkit specifications"""
+    totalTools: int
+    monthlyCost: float
+    primaryGoal: str
+    freeTools: int
+    paidTools: int
+
+
+class ToolkitResponse(BaseModel):
+    """Complete toolkit response"""
+    id: str
+    slug: str
+    userName: str
+    profession: str
+    professionSlug: str
+    lifeContext: str
+    workTools: List[WorkTool]
+    lifeTools: List[LifeTool]
+    specs: ToolkitSpecs
+    description: str
+    longDescription: str
+    createdAt: str
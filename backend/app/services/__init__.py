@@ -3,6 +3,7 @@ Services
 """
 from app.services.gemini_service import gemini_service
 from app.services.toolkit_generator import toolkit_generator
+from app.services.tool_suggester import tool_suggester
 
-__all__ = ["gemini_service", "toolkit_generator"]
+__all__ = ["gemini_service", "toolkit_generator", "tool_suggester"]
 
@@ -0,0 +1,128 @@
+"""
+Circuit breaker
+Stops calling an unhealthy upstream and lets callers fail over instantly
+"""
+import time
+from collections import deque
+from typing import Any, Deque, Dict
+
+
+class CircuitOpenError(Exception):
+    """Raised when a call is rejected because the circuit is open"""
+
+
+class CircuitBreaker:
+    """
+    Failure-rate circuit breaker with closed / open / half-open states
+    
+    - closed: calls flow; outcomes are recorded in a sliding window of the
+      last `window_size` calls. Once at least `min_calls` are recorded and
+      the failure rate reaches `failure_rate_threshold`, the circuit opens.
+    - open: calls are rejected until `open_duration` seconds have passed.
+    - half_open: up to `half_open_max_calls` probe calls are let through. A
+      successful probe closes the circuit, a failed one re-opens it.
+    """
+    
+    CLOSED = "closed"
+    OPEN = "open"
+    HALF_OPEN = "half_open"
+    
+    def __init__(
+        self,
+        name: str = "upstream",
+        failure_rate_threshold: float = 0.5,
+        window_size: int = 20,
+        min_calls: int = 5,
+        open_duration: float = 30.0,
+        half_open_max_calls: int = 1
+    ):
+        self.name = name
+        self.failure_rate_threshold = failure_rate_threshold
+        self.min_calls = min_calls
+        self.open_duration = open_duration
+        self.half_open_max_calls = half_open_max_calls
+        
+        self._state = self.CLOSED
+        self._window: Deque[bool] = deque(maxlen=window_size)  # True = failure
+        self._opened_at = 0.0
+        self._half_open_in_flight = 0
+        
+        self.rejected = 0
+        self.times_opened = 0
+    
+    @property
+    def state(self) -> str:
+        """Current state (an expired open circuit reports half_open)"""
+        if self._state == self.OPEN and time.monotonic() - self._opened_at >= self.open_duration:
+            self._state = self.HALF_OPEN
+            self._half_open_in_flight = 0
+        return self._state
+    
+    @property
+    def is_open(self) -> bool:
+        return self.state == self.OPEN
+    
+    def before_call(self) -> None:
+        """
+        Admit a call or raise CircuitOpenError
+        
+        Every admitted call must be followed by exactly one of
+        record_success(), record_failure() or release().
+        """
+        state = self.state
+        if state == self.CLOSED:
+            return
+        if state == self.HALF_OPEN and self._half_open_in_flight < self.half_open_max_calls:
+            self._half_open_in_flight += 1
+            return
+        
+        self.rejected += 1
+        retry_in = max(0.0, self.open_duration - (time.monotonic() - self._opened_at))
+        raise CircuitOpenError(f"Circuit '{self.name}' is {state} (retry in {retry_in:.0f}s)")
+    
+    def record_success(self) -> None:
+        if self._state == self.HALF_OPEN:
+            self._close()
+            return
+        self._window.append(False)
+    
+    def record_failure(self) -> None:
+        if self._state == self.HALF_OPEN:
+            self._open()
+            return
+        self._window.append(True)
+        if self._state == self.CLOSED and len(self._window) >= self.min_calls:
+            if self.failure_rate >= self.failure_rate_threshold:
+                self._open()
+    
+    def release(self) -> None:
+        """Give back an admitted call that produced no health signal"""
+        if self._state == self.HALF_OPEN and self._half_open_in_flight > 0:
+            self._half_open_in_flight -= 1
+    
+    @property
+    def failure_rate(self) -> float:
+        if not self._window:
+            return 0.0
+        return sum(self._window) / len(self._window)
+    
+    def _open(self) -> None:
+        self._state = self.OPEN
+        self._opened_at = time.monotonic()
+        self._half_open_in_flight = 0
+        self.times_opened += 1
+    
+    def _close(self) -> None:
+        self._state = self.CLOSED
+        self._window.clear()
+        self._half_open_in_flight = 0
+    
+    @property
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "state": self.state,
+            "failure_rate": round(self.failure_rate, 4),
+            "window_calls": len(self._window),
+            "rejected": self.rejected,
+            "times_opened": self.times_opened,
+        }
@@ -0,0 +1,190 @@
+"""
+Adaptive concurrency limiter (AIMD)
+Bounds in-flight calls to an upstream and adapts the bound to its health
+"""
+import asyncio
+import time
+from collections import deque
+from typing import Any, Deque, Dict, Optional
+
+
+class ConcurrencyLimitTimeout(Exception):
+    """Raised when a call waited in the queue longer than its deadline"""
+
+
+class AdaptiveConcurrencyLimiter:
+    """
+    Additive-increase / multiplicative-decrease concurrency controller
+    
+    - Every successful call grows the limit by 1/limit (about +1 per window
+      of `limit` successes), up to `max_limit`.
+    - An overload signal (429, 5xx, timeout, or latency above
+      `latency_tolerance` x the smoothed baseline) multiplies the limit by
+      `backoff_ratio`, at most once per `decrease_cooldown` seconds, down to
+      `min_limit`.
+    
+    Calls beyond the current limit wait in a FIFO queue until a slot frees
+    up or their deadline passes.
+    """
+    
+    def __init__(
+        self,
+        initial_limit: int = 10,
+        min_limit: int = 1,
+        max_limit: int = 100,
+        backoff_ratio: float = 0.5,
+        latency_tolerance: float = 2.0,
+        decrease_cooldown: float = 1.0,
+        queue_timeout: Optional[float] = 10.0
+    ):
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.backoff_ratio = backoff_ratio
+        self.latency_tolerance = latency_tolerance
+        self.decrease_cooldown = decrease_cooldown
+        self.queue_timeout = queue_timeout
+        
+        self._limit = float(max(min_limit, min(initial_limit, max_limit)))
+        self._in_flight = 0
+        self._waiters: Deque["asyncio.Future[None]"] = deque()
+        self._last_decrease = 0.0
+        
+        # Smoothed latency baseline (EWMA) used to detect rising latency
+        self._baseline_latency: Optional[float] = None
+        self._latency_samples = 0
+        
+        self.acquired = 0
+        self.rejected = 0
+        self.increases = 0
+        self.decreases = 0
+        self.total_wait = 0.0
+        self.max_wait = 0.0
+        self.last_wait = 0.0
+    
+    @property
+    def limit(self) -> int:
+        return max(self.min_limit, int(self._limit))
+    
+    @property
+    def in_flight(self) -> int:
+        return self._in_flight
+    
+    @property
+    def queue_depth(self) -> int:
+        return sum(1 for w in self._waiters if not w.done())
+    
+    async def acquire(self, timeout: Optional[float] = None) -> float:
+        """
+        Wait for a slot
+        
+        Args:
+            timeout: Max seconds to queue (defaults to `queue_timeout`)
+        
+        Returns:
+            Seconds spent waiting
+        
+        Raises:
+            ConcurrencyLimitTimeout: if no slot freed up before the deadline
+        """
+        start = time.monotonic()
+        
+        if self._in_flight < self.limit and not self._waiters:
+            self._in_flight += 1
+        else:
+            fut: "asyncio.Future[None]" = asyncio.get_running_loop().create_future()
+            self._waiters.append(fut)
+            try:
+                await asyncio.wait_for(fut, self.queue_timeout if timeout is None else timeout)
+            except BaseException as e:
+                if fut.done() and not fut.cancelled():
+                    # A slot was handed over just as we gave up: pass it on
+                    self._in_flight -= 1
+                    self._wake()
+                try:
+                    self._waiters.remove(fut)
+                except ValueError:
+                    pass
+                if isinstance(e, asyncio.TimeoutError):
+                    self.rejected += 1
+                    raise ConcurrencyLimitTimeout(
+                        f"Queued {time.monotonic() - start:.2f}s without a free slot "
+                        f"(limit={self.limit}, in_flight={self._in_flight})"
+                    ) from None
+                raise
+        
+        waited = time.monotonic() - start
+        self.acquired += 1
+        self.total_wait += waited
+        self.last_wait = waited
+        self.max_wait = max(self.max_wait, waited)
+        return waited
+    
+    def release_success(self, latency: Optional[float] = None) -> None:
+        """Release a slot after a healthy response"""
+        if latency is not None and self._is_latency_spike(latency):
+            self._decrease()
+        else:
+            if self._limit < self.max_limit:
+                self._limit = min(self.max_limit, self._limit + 1.0 / self._limit)
+                self.increases += 1
+        self._release()
+    
+    def release_overload(self) -> None:
+        """Release a slot after an overload signal (429, 5xx, timeout)"""
+        self._decrease()
+        self._release()
+    
+    def release_ignored(self) -> None:
+        """Release a slot without adjusting the limit (e.g. client errors)"""
+        self._release()
+    
+    def _is_latency_spike(self, latency: float) -> bool:
+        baseline = self._baseline_latency
+        spike = (
+            baseline is not None
+            and self._latency_samples >= 10
+            and latency > baseline * self.latency_tolerance
+        )
+        self._latency_samples += 1
+        self._baseline_latency = latency if baseline is None else 0.95 * baseline + 0.05 * latency
+        return spike
+    
+    def _decrease(self) -> None:
+        now = time.monotonic()
+        if now - self._last_decrease < self.decrease_cooldown:
+            return
+        self._last_decrease = now
+        new_limit = max(float(self.min_limit), self._limit * self.backoff_ratio)
+        if new_limit < self._limit:
+            self._limit = new_limit
+            self.decreases += 1
+    
+    def _release(self) -> None:
+        self._in_flight -= 1
+        self._wake()
+    
+    def _wake(self) -> None:
+        while self._waiters and self._in_flight < self.limit:
+            fut = self._waiters.popleft()
+            if not fut.done():
+                self._in_flight += 1
+                fut.set_result(None)
+    
+    @property
+    def stats(self) -> Dict[str, Any]:
+        """Current limit, queue depth and wait-time metrics"""
+        return {
+            "limit": self.limit,
+            "in_flight": self._in_flight,
+            "queue_depth": self.queue_depth,
+            "acquired": self.acquired,
+            "rejected": self.rejected,
+            "increases": self.increases,
+            "decreases": self.decreases,
+            "avg_wait_ms": round(self.total_wait / self.acquired * 1000, 2) if self.acquired else 0.0,
+            "max_wait_ms": round(self.max_wait * 1000, 2),
+            "last_wait_ms": round(self.last_wait * 1000, 2),
+            "baseline_latency_ms": (
+                round(self._baseline_latency * 1000, 2) if self._baseline_latency is not None else None
+            ),
+        }
@@ -5,14 +5,49 @@ Uses Gemini 2.0 Flash for fast, intelligent toolkit generation
 import asyncio
 import json
 import logging
-from typing import Optional, Dict, Any, List
+import re
+import time
+from typing import Optional, Dict, Any, List, AsyncIterator, Sequence, Tuple
 import aiohttp
 import google.generativeai as genai
 
 from app.config import settings
+from app.services.cache import TTLCache, make_cache_key
+from app.services.single_flight import SingleFlight
+from app.services.concurrency import AdaptiveConcurrencyLimiter, ConcurrencyLimitTimeout
+from app.services.retry import RetryPolicy, parse_retry_after, parse_retry_delay
+from app.services.circuit_breaker import CircuitBreaker, CircuitOpenError
+from app.services.intent_parser import intent_parser
+from app.services.json_extraction import extract_json, extract_string_field
 
 logger = logging.getLogger(__name__)
 
+_SIMPLE_PROFESSION_RE = re.compile(r'PROFESSION:\s*([^,\n]+)', re.IGNORECASE)
+_SIMPLE_HOBBY_RE = re.compile(r'HOBBY:\s*([^,\n]+)', re.IGNORECASE)
+
+# Where a parsed intent came from (its "source" key)
+INTENT_LOCAL = "local"  # Confident local parse, Gemini not asked
+INTENT_LLM = "llm"  # Gemini's answer
+INTENT_FALLBACK = "fallback"  # Gemini failed or unavailable: local parse or the default intent
+
+
+class GeminiAPIError(Exception):
+    """Non-200 response from the Gemini API"""
+    
+    def __init__(self, status: int, message: str, retry_after: Optional[float] = None):
+        super().__init__(f"API error: {status} - {message}")
+        self.status = status
+        self.retry_after = retry_after
+    
+    @property
+    def is_overload(self) -> bool:
+        """Whether the upstream signalled it is overloaded (429 / 5xx)"""
+        return self.status == 429 or self.status >= 500
+
+
+class GeminiTimeoutError(Exception):
+    """Gemini API call exceeded API_TIMEOUT"""
+
 
 class GeminiService:
     """
@@ -25,17 +60,147 @@ class GeminiService:
         self.api_base_url = settings.GEMINI_API_BASE_URL
         self.timeout = settings.API_TIMEOUT
         
+        # Shared HTTP session (created in app lifespan, see start/close)
+        self._session: Optional[aiohttp.ClientSession] = None
+        
+        # Response cache in front of call_api (any object with get/set works)
+        self.cache = TTLCache(
+            max_entries=settings.LLM_CACHE_MAX_ENTRIES,
+            max_bytes=settings.LLM_CACHE_MAX_BYTES,
+            ttl=settings.LLM_CACHE_TTL,
+        ) if settings.LLM_CACHE_ENABLED else None
+        
+        # In-flight deduplication of identical concurrent prompts
+        self.single_flight = SingleFlight() if settings.LLM_SINGLE_FLIGHT_ENABLED else None
+        
+        # Client-side adaptive concurrency limit (AIMD on 429/5xx/latency)
+        self.limiter = AdaptiveConcurrencyLimiter(
+            initial_limit=settings.GEMINI_CONCURRENCY_INITIAL,
+            min_limit=settings.GEMINI_CONCURRENCY_MIN,
+            max_limit=settings.GEMINI_CONCURRENCY_MAX,
+            backoff_ratio=settings.GEMINI_CONCURRENCY_BACKOFF,
+            latency_tolerance=settings.GEMINI_LATENCY_TOLERANCE,
+            queue_timeout=settings.GEMINI_QUEUE_TIMEOUT,
+        )
+        
+        # Circuit breaker: fail fast to local paths while Gemini is unhealthy
+        self.breaker = CircuitBreaker(
+            name="gemini",
+            failure_rate_threshold=settings.GEMINI_BREAKER_FAILURE_RATE,
+            window_size=settings.GEMINI_BREAKER_WINDOW,
+            min_calls=settings.GEMINI_BREAKER_MIN_CALLS,
+            open_duration=settings.GEMINI_BREAKER_OPEN_SECONDS,
+            half_open_max_calls=settings.GEMINI_BREAKER_HALF_OPEN_CALLS,
+        )
+        
+        # Retries for transient failures, bounded by a total time budget
+        self.retry_policy = RetryPolicy(
+            max_retries=settings.MAX_RETRIES,
+            base_delay=settings.RETRY_BASE_DELAY,
+            max_delay=settings.RETRY_MAX_DELAY,
+            budget=settings.RETRY_BUDGET,
+            is_retryable=self._is_retryable,
+        )
+        
         # Configure Gemini SDK
         genai.configure(api_key=self.api_key)
         
         logger.info(f"✅ GeminiService initialized with model: {self.model}")
     
+    async def start(self) -> None:
+        """Open the shared connection pool used by all API calls"""
+        if self._session is not None and not self._session.closed:
+            return
+        
+        connector = aiohttp.TCPConnector(
+            limit=settings.GEMINI_POOL_SIZE,
+            limit_per_host=settings.GEMINI_POOL_PER_HOST,
+            keepalive_timeout=settings.GEMINI_KEEPALIVE_TIMEOUT,
+            ttl_dns_cache=settings.GEMINI_DNS_CACHE_TTL,
+        )
+        self._session = aiohttp.ClientSession(
+            connector=connector,
+            headers={"Content-Type": "application/json"},
+        )
+        logger.info(
+            f"🔌 Gemini connection pool opened "
+            f"(limit={settings.GEMINI_POOL_SIZE}, per_host={settings.GEMINI_POOL_PER_HOST})"
+        )
+    
+    async def close(self) -> None:
+        """Close the shared connection pool"""
+        if self._session is not None and not self._session.closed:
+            await self._session.close()
+            logger.info("🔌 Gemini connection pool closed")
+        self._session = None
+    
+    async def _get_session(self) -> aiohttp.ClientSession:
+        """Return the shared session, opening it lazily outside the app lifespan"""
+        if self._session is None or self._session.closed:
+            await self.start()
+        return self._session
+    
+    def _build_payload(self, prompt: str, temperature: float, max_tokens: int) -> Dict[str, Any]:
+        """Build the generateContent request body"""
+        return {
+            "contents": [
+                {
+                    "role": "user",
+                    "parts": [{"text": prompt}]
+                }
+            ],
+            "generationConfig": {
+                "temperature": temperature,
+                "maxOutputTokens": max_tokens,
+            }
+        }
+    
+    @staticmethod
+    def _extract_chunk_text(chunk: Dict[str, Any]) -> str:
+        """Extract the text of the first candidate from a response chunk"""
+        if "candidates" in chunk and len(chunk["candidates"]) > 0:
+            content = chunk["candidates"][0].get("content", {})
+            parts = content.get("parts", [])
+            if parts:
+                return parts[0].get("text", "")
+        return ""
+    
+    @property
+    def stats(self) -> Dict[str, Any]:
+        """Runtime metrics for the Gemini client"""
+        return {
+            "model": self.model,
+            "cache": self.cache.stats if self.cache is not None else None,
+            "single_flight": self.single_flight.stats if self.single_flight is not None else None,
+            "concurrency": self.limiter.stats,
+            "retry": self.retry_policy.stats,
+            "circuit_breaker": self.breaker.stats,
+        }
+    
+    @property
+    def is_available(self) -> bool:
+        """False while the circuit breaker is open (callers should use local paths)"""
+        return not self.breaker.is_open
+    
+    def _is_cacheable(self, temperature: float, use_cache: Optional[bool]) -> bool:
+        """Decide whether a call may be served from / stored in the cache"""
+        if self.cache is None or use_cache is False:
+            return False
+        if use_cache:
+            return True
+        return temperature == 0.0 or not settings.LLM_CACHE_DETERMINISTIC_ONLY
+    
+    def _cache_key(self, prompt: str, temperature: float, max_tokens: int) -> str:
+        """Cache key for a call: (model, prompt, temperature, max_tokens)"""
+        return make_cache_key(self.model, prompt, temperature, max_tokens)
+    
     async def call_api(
         self,
         prompt: str,
         temperature: float = 0.7,
         max_tokens: int = 4096,
-        response_format: str = "json"
+        response_format: str = "json",
+        use_cache: Optional[bool] = None
     ) -> str:
         """
         Call Gemini API with the given prompt (same logic as class_recorder_demo)
@@ -45,76 +210,268 @@ class GeminiService:
             temperature: Creativity level (0.0 - 1.0)
             max_tokens: Maximum response tokens
             response_format: Expected response format ("json" or "text")
+            use_cache: Force caching on/off (default: only deterministic calls)
         
         Returns:
             API response text
         """
+        key = self._cache_key(prompt, temperature, max_tokens)
+        cacheable = self._is_cacheable(temperature, use_cache)
+        
+        if cacheable:
+            cached = self.cache.get(key)
+            if cached is not None:
+                logger.debug("⚡ Gemini cache hit")
+                return cached
+        
+        async def fetch() -> str:
+            response = await self.retry_policy.run(
+                lambda remaining: self._request(prompt, temperature, max_tokens, remaining)
+            )
+            if cacheable:
+                self.cache.set(key, response)
+            return response
+        
+        if self.single_flight is None:
+            return await fetch()
+        
+        # Concurrent identical prompts share one upstream request
+        return await self.single_flight.do(key, fetch)
+    
+    async def _request(
+        self,
+        prompt: str,
+        temperature: float,
+        max_tokens: int,
+        budget: Optional[float] = None
+    ) -> str:
+        """
+        Send a single generateContent request through the concurrency limiter
+        
+        `budget` caps the queue wait plus request time (defaults to API_TIMEOUT).
+        """
+        deadline = time.monotonic() + (self.timeout if budget is None else budget)
+        self.breaker.before_call()
+        try:
+            await self.limiter.acquire(timeout=min(self.limiter.queue_timeout, max(0.0, deadline - time.monotonic())))
+        except BaseException:
+            self.breaker.release()
+            raise
+        
+        start = time.monotonic()
+        try:
+            timeout = max(0.001, min(self.timeout, deadline - start))
+            response = await self._send(prompt, temperature, max_tokens, timeout)
+        except BaseException as e:
+            self._release_after_error(e)
+            raise
+        
+        self.limiter.release_success(time.monotonic() - start)
+        self.breaker.record_success()
+        return response
+    
+    @staticmethod
+    def _retry_after(response: aiohttp.ClientResponse, error_text: str) -> Optional[float]:
+        """Server-requested delay from the Retry-After header or RetryInfo body"""
+        retry_after = parse_retry_after(response.headers.get("Retry-After"))
+        if retry_after is None:
+            retry_after = parse_retry_delay(error_text)
+        return retry_after
+    
+    @staticmethod
+    def _is_retryable(error: BaseException) -> bool:
+        """Transient errors worth retrying: 408/429/5xx, connection resets, timeouts"""
+        if isinstance(error, GeminiAPIError):
+            return error.status in (408, 429) or error.status >= 500
+        return isinstance(error, (
+            GeminiTimeoutError,
+            asyncio.TimeoutError,
+            aiohttp.ClientConnectionError,
+            aiohttp.ClientPayloadError,
+            ConnectionResetError,
+        ))
+    
+    def _release_after_error(self, error: BaseException) -> None:
+        """Release limiter and breaker slots, recording overload/failure signals"""
+        if isinstance(error, GeminiTimeoutError) or (
+            isinstance(error, GeminiAPIError) and error.is_overload
+        ):
+            self.limiter.release_overload()
+        else:
+            self.limiter.release_ignored()
+        
+        if self._is_retryable(error):
+            # Upstream unhealthy (5xx, 429, timeouts, connection errors)
+            self.breaker.record_failure()
+        elif isinstance(error, Exception):
+            # Upstream answered (e.g. 4xx): it is reachable
+            self.breaker.record_success()
+        else:
+            # Cancelled: no signal either way
+            self.breaker.release()
+    
+    async def _send(
+        self,
+        prompt: str,
+        temperature: float,
+        max_tokens: int,
+        timeout: float
+    ) -> str:
+        """Send a single generateContent request and return the full text"""
         # Use streamGenerateContent endpoint (same as class_recorder_demo)
         url = f"{self.api_base_url}/{self.model}:streamGenerateContent?key={self.api_key}"
+        payload = self._build_payload(prompt, temperature, max_tokens)
         
-        # Build payload
-        payload = {
-            "contents": [
-                {
-                    "role": "user",
-                    "parts": [{"text": prompt}]
-                }
-            ],
-            "generationConfig": {
-                "temperature": temperature,
-                "maxOutputTokens": max_tokens,
-            }
-        }
+        try:
+            session = await self._get_session()
+            proxy = settings.HTTP_PROXY if settings.USE_PROXY else None
+            
+            async with session.post(
+                url,
+                json=payload,
+                timeout=aiohttp.ClientTimeout(total=timeout),
+                proxy=proxy
+            ) as response:
+                if response.status != 200:
+                    error_text = await response.text()
+                    logger.error(f"Gemini API error: {response.status} - {error_text}")
+                    raise GeminiAPIError(
+                        response.status,
+                        error_text,
+                        retry_after=self._retry_after(response, error_text),
+                    )
+                
+                data = await response.json()
+                
+                # Handle streaming response format (list of chunks)
+                if isinstance(data, list):
+                    full_text = "".join(self._extract_chunk_text(chunk) for chunk in data)
+                else:
+                    # Single response format
+                    full_text = self._extract_chunk_text(data)
+                
+                if not full_text:
+                    raise Exception("Empty response from API")
+                
+                return full_text.strip()
+        
+        except asyncio.TimeoutError:
+            logger.error(f"Gemini API timeout after {timeout:.1f}s")
+            raise GeminiTimeoutError("API call timeout")
+        except Exception as e:
+            logger.error(f"Gemini API call failed: {e}")
+            raise
+    
+    async def stream_api(
+        self,
+        prompt: str,
+        temperature: float = 0.7,
+        max_tokens: int = 4096,
+        use_cache: Optional[bool] = None
+    ) -> AsyncIterator[str]:
+        """
+        Call Gemini API in SSE mode and yield text chunks as they arrive
         
+        Shares the response cache with call_api: a hit is yielded as a single
+        chunk, and a completed stream is stored for later calls.
+        
+        Args:
+            prompt: The prompt to send
+            temperature: Creativity level (0.0 - 1.0)
+            max_tokens: Maximum response tokens
+            use_cache: Force caching on/off (default: only deterministic calls)
+        
+        Yields:
+            Text fragments in generation order
+        """
+        cacheable = self._is_cacheable(temperature, use_cache)
+        if cacheable:
+            key = self._cache_key(prompt, temperature, max_tokens)
+            cached = self.cache.get(key)
+            if cached is not None:
+                logger.debug("⚡ Gemini cache hit (stream)")
+                yield cached
+                return
+        
+        chunks: List[str] = []
+        async for text in self._stream_request(prompt, temperature, max_tokens):
+            chunks.append(text)
+            yield text
+        
+        if cacheable:
+            self.cache.set(key, "".join(chunks).strip())
+    
+    async def _stream_request(
+        self,
+        prompt: str,
+        temperature: float,
+        max_tokens: int
+    ) -> AsyncIterator[str]:
+        """Send a single SSE streaming request (through breaker + limiter) and yield text chunks"""
+        self.breaker.before_call()
         try:
-            connector = None
-            if settings.USE_PROXY:
-                connector = aiohttp.TCPConnector()
+            await self.limiter.acquire()
+        except BaseException:
+            self.breaker.release()
+            raise
+        
+        try:
+            async for text in self._send_stream(prompt, temperature, max_tokens):
+                yield text
+        except BaseException as e:
+            self._release_after_error(e)
+            raise
+        self.limiter.release_success()
+        self.breaker.record_success()
+    
+    async def _send_stream(
+        self,
+        prompt: str,
+        temperature: float,
+        max_tokens: int
+    ) -> AsyncIterator[str]:
+        """Send a single SSE streaming request and yield text chunks"""
+        url = f"{self.api_base_url}/{self.model}:streamGenerateContent?alt=sse&key={self.api_key}"
+        payload = self._build_payload(prompt, temperature, max_tokens)
+        
+        try:
+            session = await self._get_session()
+            proxy = settings.HTTP_PROXY if settings.USE_PROXY else None
             
-            async with aiohttp.ClientSession(connector=connector) as session:
-                proxy = settings.HTTP_PROXY if settings.USE_PROXY else None
+            async with session.post(
+                url,
+                json=payload,
+                timeout=aiohttp.ClientTimeout(total=self.timeout),
+                proxy=proxy
+            ) as response:
+                if response.status != 200:
+                    error_text = await response.text()
+                    logger.error(f"Gemini API error: {response.status} - {error_text}")
+                    raise GeminiAPIError(response.status, error_text)
                 
-                async with session.post(
-                    url,
-                    json=payload,
-                    headers={"Content-Type": "application/json"},
-                    timeout=aiohttp.ClientTimeout(total=self.timeout),
-                    proxy=proxy
-                ) as response:
-                    if response.status != 200:
-                        error_text = await response.text()
-                        logger.error(f"Gemini API error: {response.status} - {error_text}")
-                        raise Exception(f"API error: {response.status} - {error_text}")
-                    
-                    data = await response.json()
-                    
-                    # Handle streaming response format (list of chunks)
-                    full_text = ""
-                    if isinstance(data, list):
-                        for chunk in data:
-                            if "candidates" in chunk and len(chunk["candidates"]) > 0:
-                                content = chunk["candidates"][0].get("content", {})
-                                parts = content.get("parts", [])
-                                if parts and len(parts) > 0:
-                                    full_text += parts[0].get("text", "")
-                    else:
-                        # Single response format
-                        if "candidates" in data and len(data["candidates"]) > 0:
-                            content = data["candidates"][0].get("content", {})
-                            parts = content.get("parts", [])
-                            if parts:
-                                full_text = parts[0].get("text", "")
+                received = False
+                async for raw_line in response.content:
+                    line = raw_line.decode("utf-8").strip()
+                    if not line.startswith("data:"):
+                        continue
                     
-                    if not full_text:
-                        raise Exception("Empty response from API")
+                    data = line[len("data:"):].strip()
+                    if not data or data == "[DONE]":
+                        continue
                     
-                    return full_text.strip()
+                    text = self._extract_chunk_text(json.loads(data))
+                    if text:
+                        received = True
+                        yield text
+                
+                if not received:
+                    raise Exception("Empty response from API")
         
         except asyncio.TimeoutError:
-            logger.error(f"Gemini API timeout after {self.timeout}s")
-            raise Exception("API call timeout")
+            logger.error(f"Gemini API stream timeout after {self.timeout}s")
+            raise GeminiTimeoutError("API call timeout")
         except Exception as e:
-            logger.error(f"Gemini API call failed: {e}")
+            logger.error(f"Gemini API stream failed: {e}")
             raise
     
     async def generate_toolkit(
@@ -141,15 +498,15 @@ class GeminiService:
             response = await self.call_api(prompt, temperature=0.3)
             
             # Parse JSON response
-            toolkit_data = json.loads(response)
+            toolkit_data = extract_json(response, expect=dict)
+            if toolkit_data is None:
+                logger.error("Failed to parse toolkit JSON")
+                logger.error(f"Raw response: {response[:500]}")
+                raise Exception("Invalid toolkit format from AI")
             logger.info(f"✅ Toolkit generated successfully")
             
             return toolkit_data
-            
-        except json.JSONDecodeError as e:
-            logger.error(f"Failed to parse toolkit JSON: {e}")
-            logger.error(f"Raw response: {response[:500]}")
-            raise Exception("Invalid toolkit format from AI")
+        
         except Exception as e:
             logger.error(f"Toolkit generation failed: {e}")
             raise
@@ -189,10 +546,86 @@ JSON:"""
             user_input: Natural language like "I am a Product Manager who loves hiking"
         
         Returns:
-            Parsed intent with profession, hobby, and optional name
+            Parsed intent with profession, hobby, optional name, and its
+            "source": INTENT_LOCAL, INTENT_LLM or INTENT_FALLBACK
         """
+        # Fast path: unambiguous matches never reach the LLM
+        local = self._local_parse(user_input)
+        if local is not None and local["confidence"] >= settings.LOCAL_PARSE_MIN_CONFIDENCE:
+            logger.info(f"⚡ Local parse: {local['profession']} + {local['hobby']}")
+            return self._sourced(local, INTENT_LOCAL)
+        
+        if not self.is_available:
+            logger.warning("⚡ Gemini circuit open, using local intent")
+            return self._sourced(local or self._default_intent(), INTENT_FALLBACK)
+        
+        prompt = self._build_intent_prompt(user_input)
+        
+        try:
+            logger.info(f"🔍 Parsing intent: {user_input[:50]}...")
+            # Gemini 2.5 uses tokens for "thinking", so we need more tokens
+            response = await self.call_api(prompt, temperature=0.0, max_tokens=500)
+            return self._sourced(self._parse_intent_response(response, user_input), INTENT_LLM)
+        
+        except Exception as e:
+            logger.error(f"Intent parsing failed: {e}")
+            if self._is_overloaded(e):
+                # Don't pile a second prompt onto an overloaded upstream
+                return self._sourced(local or self._default_intent(), INTENT_FALLBACK)
+            # Final fallback: ask LLM in a simpler way
+            return await self._simple_parse(user_input)
+    
+    async def stream_parse_intent(
+        self,
+        user_input: str
+    ) -> AsyncIterator[Tuple[str, Any]]:
+        """
+        Streaming variant of parse_intent
+        
+        Yields ("delta", text) for every chunk received from Gemini, then a
+        single ("intent", parsed) event once the full response is parsed.
+        """
+        local = self._local_parse(user_input)
+        if local is not None and local["confidence"] >= settings.LOCAL_PARSE_MIN_CONFIDENCE:
+            logger.info(f"⚡ Local parse: {local['profession']} + {local['hobby']}")
+            yield "intent", self._sourced(local, INTENT_LOCAL)
+            return
+        
+        if not self.is_available:
+            logger.warning("⚡ Gemini circuit open, using local intent")
+            yield "intent", self._sourced(local or self._default_intent(), INTENT_FALLBACK)
+            return
+        
+        prompt = self._build_intent_prompt(user_input)
+        chunks: List[str] = []
+        
+        try:
+            logger.info(f"🔍 Streaming intent: {user_input[:50]}...")
+            async for text in self.stream_api(prompt, temperature=0.0, max_tokens=500):
+                chunks.append(text)
+                yield "delta", text
+            parsed = self._sourced(self._parse_intent_response("".join(chunks).strip(), user_input), INTENT_LLM)
+        
+        except Exception as e:
+            logger.error(f"Streaming intent parsing failed: {e}")
+            if self._is_overloaded(e):
+                parsed = self._sourced(local or self._default_intent(), INTENT_FALLBACK)
+            else:
+                parsed = await self._simple_parse(user_input)
+        
+        yield "intent", parsed
+    
+    @staticmethod
+    def _local_parse(user_input: str) -> Optional[Dict[str, Any]]:
+        """Deterministic alias/fuzzy match (None if disabled or nothing matched)"""
+        if not settings.LOCAL_PARSE_ENABLED:
+            return None
+        return intent_parser.parse(user_input)
+    
+    def _build_intent_prompt(self, user_input: str) -> str:
+        """Build the prompt for intent parsing"""
         # Simple, clear prompt for reliable JSON output
-        prompt = f"""Extract profession and hobby from this text. Return JSON only.
+        return f"""Extract profession and hobby from this text. Return JSON only.
 
 Text: "{user_input}"
 
@@ -206,96 +639,33 @@ Example inputs and outputs:
 
 Your JSON (no explanation, no markdown):"""
 
-        try:
-            logger.info(f"🔍 Parsing intent: {user_input[:50]}...")
-            # Gemini 2.5 uses tokens for "thinking", so we need more tokens
-            response = await self.call_api(prompt, temperature=0.0, max_tokens=500)
-            
-            # Clean response
-            parsed = self._extract_json_from_response(response)
-            
-            if parsed:
-                logger.info(f"✅ Parsed: {parsed.get('profession')} + {parsed.get('hobby')}")
-                return parsed
-            else:
-                logger.warning(f"⚠️ Could not extract JSON, trying regex fallback")
-                return self._regex_extract(response, user_input)
-            
-        except Exception as e:
-            logger.error(f"Intent parsing failed: {e}")
-            # Final fallback: ask LLM in a simpler way
-            return await self._simple_parse(user_input)
-    
-    def _extract_json_from_response(self, response: str) -> Optional[Dict[str, Any]]:
-        """Extract and parse JSON from LLM response"""
-        import re
-        
-        original_response = response
-        response = response.strip()
-        
+    def _parse_intent_response(self, response: str, user_input: str) -> Dict[str, Any]:
+        """Turn a raw intent response into a parsed intent dict"""
         logger.debug(f"🔍 Raw LLM response: {response[:200]}...")
+        parsed = extract_json(response, expect=dict, required_keys=("profession",))
         
-        # Try direct parse first
-        try:
-            return json.loads(response)
-        except Exception as e:
-            logger.debug(f"Direct parse failed: {e}")
-        
-        # Remove markdown code blocks
-        if "```" in response:
-            match = re.search(r'```(?:json)?\s*(\{.*?\})\s*```', response, re.DOTALL)
-            if match:
-                try:
-                    return json.loads(match.group(1))
-                except:
-                    pass
-        
-        # Try to find any JSON object with profession key
-        match = re.search(r'\{[^{}]*"profession"[^{}]*\}', response, re.DOTALL)
-        if match:
-            try:
-                return json.loads(match.group(0))
-            except:
-                pass
-        
-        # Try more aggressive JSON extraction - find first { to last }
-        first_brace = response.find('{')
-        last_brace = response.rfind('}')
-        if first_brace != -1 and last_brace != -1 and last_brace > first_brace:
-            json_str = response[first_brace:last_brace + 1]
-            try:
-                return json.loads(json_str)
-            except:
-                # Try to fix common issues
-                json_str = json_str.replace("'", '"')  # Single to double quotes
-                json_str = re.sub(r',\s*}', '}', json_str)  # Remove trailing comma
-                try:
-                    return json.loads(json_str)
-                except:
-                    pass
-        
-        logger.warning(f"⚠️ Could not extract JSON from: {original_response[:100]}...")
-        return None
+        if parsed:
+            logger.info(f"✅ Parsed: {parsed.get('profession')} + {parsed.get('hobby')}")
+            return parsed
+        
+        logger.warning(f"⚠️ Could not extract JSON, trying regex fallback")
+        return self._regex_extract(response, user_input)
     
     def _regex_extract(self, response: str, original_input: str) -> Dict[str, Any]:
         """Extract profession and hobby using regex patterns from LLM response"""
-        import re
-        
         logger.debug(f"🔍 Full response for regex: {response}")
         
         # Try to extract values from malformed JSON
-        profession_match = re.search(r'"profession"\s*:\s*"([^"]+)"', response)
-        profession_label_match = re.search(r'"professionLabel"\s*:\s*"([^"]+)"', response)
-        hobby_match = re.search(r'"hobby"\s*:\s*"([^"]+)"', response)
-        hobby_label_match = re.search(r'"hobbyLabel"\s*:\s*"([^"]+)"', response)
+        profession_value = extract_string_field(response, "profession")
+        hobby_value = extract_string_field(response, "hobby")
         
-        profession = profession_match.group(1) if profession_match else "professional"
-        profession_label = profession_label_match.group(1) if profession_label_match else profession.replace("-", " ").title()
-        hobby = hobby_match.group(1) if hobby_match else "general"
-        hobby_label = hobby_label_match.group(1) if hobby_label_match else hobby.replace("-", " ").title()
+        profession = profession_value or "professional"
+        profession_label = extract_string_field(response, "professionLabel") or profession.replace("-", " ").title()
+        hobby = hobby_value or "general"
+        hobby_label = extract_string_field(response, "hobbyLabel") or hobby.replace("-", " ").title()
         
         # Log what was found
-        logger.info(f"🔧 Regex found - profession: {profession_match is not None}, hobby: {hobby_match is not None}")
+        logger.info(f"🔧 Regex found - profession: {profession_value is not None}, hobby: {hobby_value is not None}")
         logger.info(f"🔧 Regex extracted: {profession} + {hobby}")
         
         return {
@@ -309,18 +679,20 @@ Your JSON (no explanation, no markdown):"""
     
     async def _simple_parse(self, user_input: str) -> Dict[str, Any]:
         """Simpler LLM call as final fallback"""
+        if not self.is_available:
+            return self._sourced(self._local_parse(user_input) or self._default_intent(), INTENT_FALLBACK)
+        
         prompt = f"""From "{user_input}", tell me:
 1. Their job/profession (one or two words)
 2. Their hobby/interest (one word)
 
 Answer in format: PROFESSION: xxx, HOBBY: xxx"""
-        
+
         try:
             response = await self.call_api(prompt, temperature=0.0, max_tokens=50)
             
-            import re
-            prof_match = re.search(r'PROFESSION:\s*([^,\n]+)', response, re.IGNORECASE)
-            hobby_match = re.search(r'HOBBY:\s*([^,\n]+)', response, re.IGNORECASE)
+            prof_match = _SIMPLE_PROFESSION_RE.search(response)
+            hobby_match = _SIMPLE_HOBBY_RE.search(response)
             
             profession = prof_match.group(1).strip().lower().replace(" ", "-") if prof_match else "professional"
             hobby = hobby_match.group(1).strip().lower().replace(" ", "-") if hobby_match else "general"
@@ -333,24 +705,49 @@ Answer in format: PROFESSION: xxx, HOBBY: xxx"""
                 "hobby": hobby,
                 "hobbyLabel": hobby.replace("-", " ").title(),
                 "name": None,
-                "confidence": 0.6
+                "confidence": 0.6,
+                "source": INTENT_LLM,
             }
         except:
             # Ultimate fallback
-            return {
-                "profession": "professional",
-                "professionLabel": "Professional",
-                "hobby": "general",
-                "hobbyLabel": "General",
-                "name": None,
-                "confidence": 0.3
-            }
+            return self._sourced(self._default_intent(), INTENT_FALLBACK)
+    
+    @staticmethod
+    def _sourced(intent: Dict[str, Any], source: str) -> Dict[str, Any]:
+        """The intent with its "source" set"""
+        return {**intent, "source": source}
+    
+    @staticmethod
+    def _default_intent() -> Dict[str, Any]:
+        """Generic intent used when nothing could be parsed"""
+        return {
+            "profession": "professional",
+            "professionLabel": "Professional",
+            "hobby": "general",
+            "hobbyLabel": "General",
+            "name": None,
+            "confidence": 0.3
+        }
+    
+    @classmethod
+    def _is_overloaded(cls, error: BaseException) -> bool:
+        """
+        Whether an error means Gemini (or our queue to it) is saturated or down
+        
+        Queue timeouts and an open circuit, plus every transient upstream
+        error the retry policy already gave up on (429/5xx, timeouts,
+        connection errors): a second prompt would only add load.
+        """
+        if isinstance(error, (ConcurrencyLimitTimeout, CircuitOpenError)):
+            return True
+        return cls._is_retryable(error)
     
     async def suggest_tools(
         self,
         query: str,
         category: Optional[str] = None,
-        limit: int = 5
+        limit: int = 5,
+        exclude: Sequence[str] = ()
     ) -> List[Dict[str, Any]]:
         """
         Suggest AI tools based on a query
@@ -359,14 +756,20 @@ Answer in format: PROFESSION: xxx, HOBBY: xxx"""
             query: Search query or use case description
             category: Optional category filter
             limit: Maximum number of suggestions
+            exclude: Tool names already suggested (from the catalog)
         
         Returns:
             List of tool suggestions
         """
+        if not self.is_available:
+            logger.warning("⚡ Gemini circuit open, skipping tool suggestions")
+            return []
+        
         prompt = f"""Suggest {limit} AI tools for the following use case:
 
 Query: {query}
 {f"Category: {category}" if category else ""}
+{f"Do not include: {', '.join(exclude)}" if exclude else ""}
 
 Return a JSON array of tools:
 [
@@ -384,7 +787,10 @@ Only include real, existing AI tools. Respond with valid JSON only."""
 
         try:
             response = await self.call_api(prompt, temperature=0.2)
-            suggestions = json.loads(response)
+            suggestions = extract_json(response, expect=list)
+            if suggestions is None:
+                logger.error(f"Failed to parse tool suggestions: {response[:200]}")
+                return []
             return suggestions[:limit]
         except Exception as e:
             logger.error(f"Tool suggestion failed: {e}")
@@ -0,0 +1,138 @@
+"""
+Local Intent Parser
+Deterministic profession/hobby extraction that runs before the LLM
+"""
+import difflib
+import logging
+import re
+from typing import Dict, List, Optional, Tuple, Any
+
+from app.data.keyword_matcher import KeywordMatcher
+from app.data.taxonomy import (
+    PROFESSION_ALIASES,
+    HOBBY_ALIASES,
+    PROFESSION_LABELS,
+    HOBBY_LABELS,
+)
+
+logger = logging.getLogger(__name__)
+
+PROFESSION = "profession"
+HOBBY = "hobby"
+
+_TOKEN_RE = re.compile(r"[a-z0-9]+")
+_NAME_RE = re.compile(r"\b(?i:my name is|call me|name's)\s+([A-Z][a-zA-Z'-]{1,30})")
+
+
+class LocalIntentParser:
+    """
+    Match free text against known profession/hobby aliases
+    
+    Alias phrases are found in one pass with a keyword automaton
+    (leftmost-longest, whole words); tokens not covered by an alias get a
+    fuzzy match against single-word aliases to absorb typos.
+    Confidence is high only when exactly one profession and one hobby are
+    found.
+    """
+    
+    def __init__(
+        self,
+        profession_aliases: Dict[str, str] = PROFESSION_ALIASES,
+        hobby_aliases: Dict[str, str] = HOBBY_ALIASES,
+        fuzzy_cutoff: float = 0.86,
+        fuzzy_min_length: int = 5
+    ):
+        self.fuzzy_cutoff = fuzzy_cutoff
+        self.fuzzy_min_length = fuzzy_min_length
+        
+        # normalised alias phrase -> (kind, slug); single-word aliases long
+        # enough to fuzzy match safely also go into the fuzzy vocabulary
+        self._matcher: KeywordMatcher[Tuple[str, str]] = KeywordMatcher()
+        self._fuzzy_vocab: Dict[str, Tuple[str, str]] = {}
+        for kind, aliases in ((PROFESSION, profession_aliases), (HOBBY, hobby_aliases)):
+            for alias, slug in aliases.items():
+                phrase = " ".join(_TOKEN_RE.findall(alias.lower()))
+                if phrase in self._matcher:
+                    continue
+                self._matcher.add(phrase, (kind, slug))
+                if " " not in phrase and len(phrase) >= fuzzy_min_length:
+                    self._fuzzy_vocab[phrase] = (kind, slug)
+        self._fuzzy_memo: Dict[str, Optional[Tuple[str, str]]] = {}
+    
+    def parse(self, text: str) -> Optional[Dict[str, Any]]:
+        """
+        Parse text into an intent dict (same shape as GeminiService.parse_intent)
+        
+        Returns None when neither a profession nor a hobby was recognised.
+        """
+        matches = self._match(_TOKEN_RE.findall(text.lower()))
+        if not matches:
+            return None
+        
+        professions = self._distinct(matches, PROFESSION)
+        hobbies = self._distinct(matches, HOBBY)
+        fuzzy = any(m[2] for m in matches)
+        
+        if len(professions) == 1 and len(hobbies) == 1:
+            confidence = 0.85 if fuzzy else 0.95
+        elif professions and hobbies:
+            confidence = 0.5  # Ambiguous: several candidates for a slot
+        else:
+            confidence = 0.4  # Only one of the two slots found
+        
+        profession = professions[0] if professions else "professional"
+        hobby = hobbies[0] if hobbies else "general"
+        name_match = _NAME_RE.search(text)
+        
+        return {
+            "profession": profession,
+            "professionLabel": PROFESSION_LABELS.get(profession, profession.replace("-", " ").title()),
+            "hobby": hobby,
+            "hobbyLabel": HOBBY_LABELS.get(hobby, hobby.replace("-", " ").title()),
+            "name": name_match.group(1) if name_match else None,
+            "confidence": confidence,
+        }
+    
+    def _match(self, tokens: List[str]) -> List[Tuple[str, str, bool]]:
+        """Return (kind, slug, fuzzy) for every alias found, in text order"""
+        spans = self._matcher.longest_matches(" ".join(tokens), whole_words=True)
+        found = [(start,) + self._matcher.values_for(phrase)[0] + (False,) for start, _, phrase in spans]
+        
+        # Fuzzy-match the tokens no alias covered
+        j = 0
+        offset = 0  # Start of `token` in the space-joined text
+        for token in tokens:
+            while j < len(spans) and spans[j][1] <= offset:
+                j += 1
+            if j == len(spans) or offset < spans[j][0]:
+                target = self._fuzzy(token)
+                if target:
+                    found.append((offset,) + target + (True,))
+            offset += len(token) + 1
+        
+        found.sort()
+        return [(kind, slug, fuzzy) for _, kind, slug, fuzzy in found]
+    
+    def _fuzzy(self, token: str) -> Optional[Tuple[str, str]]:
+        if len(token) < self.fuzzy_min_length:
+            return None
+        if token in self._fuzzy_memo:
+            return self._fuzzy_memo[token]
+        
+        close = difflib.get_close_matches(token, self._fuzzy_vocab.keys(), n=1, cutoff=self.fuzzy_cutoff)
+        target = self._fuzzy_vocab[close[0]] if close else None
+        if len(self._fuzzy_memo) < 4096:
+            self._fuzzy_memo[token] = target
+        return target
+    
+    @staticmethod
+    def _distinct(matches: List[Tuple[str, str, bool]], kind: str) -> List[str]:
+        seen: List[str] = []
+        for match_kind, slug, _ in matches:
+            if match_kind == kind and slug not in seen:
+                seen.append(slug)
+        return seen
+
+
+# Global instance
+intent_parser = LocalIntentParser()
@@ -0,0 +1,218 @@
+"""
+JSON extraction for LLM responses
+Finds and decodes the JSON payload in a model response in one left-to-right scan
+"""
+import json
+import re
+from typing import Any, Dict, Iterable, List, Optional, Pattern, Tuple
+
+# An object opener must be followed by a key or its closer, so "{exactly}"
+# in prose is never tried
+_OPENER_RE = re.compile(r"""\{(?=\s*(?:["'}]|$))|\[""")
+# Tokens the span scanner has to look at: brackets and whole strings
+# (possibly unterminated); everything else is skipped in C
+_SPAN_TOKEN_RE = re.compile(r"""[{}\[\]]|"(?:[^"\\]|\\.)*(")?|'(?:[^'\\]|\\.)*(')?""", re.DOTALL)
+_OPENERS = {"{": "}", "[": "]"}
+_CLOSERS = {"}", "]"}
+
+# One pass over a near-JSON span: strings (kept or re-quoted) and, outside
+# strings, trailing commas and Python literals
+_REPAIR_RE = re.compile(
+    r'"(?:[^"\\]|\\.)*"'
+    r"|'(?:[^'\\]|\\.)*'"
+    r"|,(?=\s*[}\]])"
+    r"|\b(?:True|False|None)\b"
+)
+_PY_LITERALS = {"True": "true", "False": "false", "None": "null", ",": ""}
+# Spans without these decode after closing and comma-dropping alone
+_NEEDS_REPAIR_RE = re.compile(r"'|\b(?:True|False|None)\b")
+_MAX_DROPPED_COMMAS = 16
+
+# A truncated tail that cannot be closed as is: dangling "key":, "key" or ,
+_DANGLING_RE = re.compile(r'(?:,\s*"(?:[^"\\]|\\.)*"\s*:?|:|,)\s*$')
+
+_decoder = json.JSONDecoder()
+_field_patterns: Dict[str, Pattern[str]] = {}
+
+
+def extract_json(
+    text: str,
+    expect: Optional[type] = None,
+    required_keys: Iterable[str] = ()
+) -> Optional[Any]:
+    """
+    Extract the first JSON value from an LLM response
+    
+    Handles prose around the payload, markdown fences, trailing commas,
+    single-quoted strings, Python literals (True/False/None) and output
+    truncated mid-object. The text is scanned left to right: each
+    opening bracket is decoded in place (trailing commas are dropped
+    where the decoder stops at them), and only a span that still fails
+    is bracket-matched and repaired. A rejected span is skipped whole;
+    the nested values recorded while matching it are tried first, so a
+    nested value that meets `expect` / `required_keys` is still found
+    without rescanning.
+    
+    Args:
+        text: Raw model output
+        expect: Required type of the result (dict or list)
+        required_keys: Keys an object result must contain
+    
+    Returns:
+        The decoded value, or None if no acceptable JSON was found
+    """
+    if not text:
+        return None
+    keys = tuple(required_keys)
+    
+    pos = 0
+    while True:
+        match = _OPENER_RE.search(text, pos)
+        if match is None:
+            return None
+        start = match.start()
+        nested = None
+        try:
+            # Valid JSON decodes straight from the opener, prose after it is ignored
+            value, pos = _decode(text, start)
+        except ValueError:
+            span, pos, nested = _scan_span(text, start)
+            value = _repair_decode(span) if span else None
+        if value is not None and _accept(value, expect, keys):
+            return value
+        if not isinstance(value, (dict, list)) or not value:
+            # Nothing decoded: resume just inside the opener
+            pos = start + 1
+            continue
+        if nested is None:
+            nested = _scan_span(text, start)[2]
+        for inner_start, inner_end in nested:
+            value = _decode_span(text, inner_start, inner_end)
+            if value is not None and _accept(value, expect, keys):
+                return value
+
+
+def extract_string_field(text: str, key: str) -> Optional[str]:
+    """Value of `"key": "..."` anywhere in (possibly malformed) JSON text"""
+    pattern = _field_patterns.get(key)
+    if pattern is None:
+        pattern = _field_patterns[key] = re.compile(r'"%s"\s*:\s*"([^"]+)"' % re.escape(key))
+    match = pattern.search(text)
+    return match.group(1) if match else None
+
+
+def _accept(value: Any, expect: Optional[type], keys: Tuple[str, ...]) -> bool:
+    if expect is not None and not isinstance(value, expect):
+        return False
+    if keys:
+        return isinstance(value, dict) and all(k in value for k in keys)
+    return True
+
+
+def _scan_span(text: str, start: int) -> Tuple[Optional[str], int, List[Tuple[int, int]]]:
+    """
+    Find the balanced span opened at `start`
+    
+    Strings (double or single quoted) are skipped whole, so brackets inside
+    them do not count. A span still open at the end of the text is returned
+    with its strings and brackets closed.
+    
+    Returns:
+        (span or None if the brackets do not match, offset scanning may
+        resume from, (start, end) of every nested span closed on the way)
+    """
+    stack: List[str] = []
+    openings: List[int] = []
+    nested: List[Tuple[int, int]] = []
+    for match in _SPAN_TOKEN_RE.finditer(text, start):
+        token = match.group()
+        if token in _OPENERS:
+            stack.append(_OPENERS[token])
+            openings.append(match.start())
+        elif token in _CLOSERS:
+            if token != stack[-1]:
+                return None, match.start(), sorted(nested)
+            stack.pop()
+            opened = openings.pop()
+            if not stack:
+                return text[start:match.end()], match.end(), sorted(nested)
+            nested.append((opened, match.end()))
+        elif not match.group(1) and not match.group(2):
+            # String cut off at the end of the text
+            return _close_truncated(text[start:] + token[0], stack), len(text), sorted(nested)
+    return _close_truncated(text[start:], stack), len(text), sorted(nested)
+
+
+def _close_truncated(fragment: str, stack: List[str]) -> str:
+    """Close a span cut off mid-value (e.g. by max_tokens)"""
+    fragment = _DANGLING_RE.sub("", fragment.rstrip())
+    return fragment + "".join(reversed(stack))
+
+
+def _decode(text: str, start: int) -> Tuple[Any, int]:
+    """
+    raw_decode from `start`, dropping each trailing comma the decoder stops at
+    
+    The decoder reports the offending closer, so only commas outside strings
+    are ever dropped, and valid JSON costs a single decode.
+    
+    Returns:
+        (value, end offset in `text`); raises ValueError otherwise
+    """
+    dropped = 0
+    while True:
+        try:
+            value, end = _decoder.raw_decode(text, start)
+            return value, end + dropped
+        except json.JSONDecodeError as e:
+            comma = _trailing_comma(text, e.pos)
+            if comma < 0 or dropped == _MAX_DROPPED_COMMAS:
+                raise
+            text = text[:comma] + text[comma + 1:]
+            dropped += 1
+
+
+def _trailing_comma(text: str, pos: int) -> int:
+    """Offset of the comma right before the closer at `pos`, or -1"""
+    if pos >= len(text) or text[pos] not in _CLOSERS:
+        return -1
+    pos -= 1
+    while pos >= 0 and text[pos].isspace():
+        pos -= 1
+    return pos if pos >= 0 and text[pos] == "," else -1
+
+
+def _decode_span(text: str, start: int, end: int) -> Optional[Any]:
+    """Decode the balanced span text[start:end], repairing it if needed"""
+    try:
+        value, stop = _decode(text, start)
+        if stop == end:
+            return value
+    except ValueError:
+        pass
+    return _repair_decode(text[start:end])
+
+
+def _repair_decode(span: str) -> Optional[Any]:
+    """Decode a span that is not valid JSON as is, after one repair pass"""
+    if _NEEDS_REPAIR_RE.search(span):
+        span = _REPAIR_RE.sub(_repair_token, span)
+    try:
+        value, end = _decode(span, 0)
+    except ValueError:
+        return None
+    return value if end == len(span) else None
+
+
+def _repair_token(match: "re.Match[str]") -> str:
+    """
+    Single-quoted strings become double-quoted; outside strings, trailing
+    commas are dropped and Python literals mapped to JSON ones
+    """
+    token = match.group()
+    first = token[0]
+    if first == '"':
+        return token
+    if first == "'":
+        return '"' + token[1:-1].replace("\\'", "'").replace('"', '\\"') + '"'
+    return _PY_LITERALS[token]
@@ -0,0 +1,129 @@
+"""
+Retry policy with exponential backoff, full jitter and a total time budget
+"""
+import asyncio
+import logging
+import random
+import re
+import time
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import Any, Awaitable, Callable, Dict, Optional, TypeVar
+
+logger = logging.getLogger(__name__)
+
+T = TypeVar("T")
+
+_RETRY_DELAY_RE = re.compile(r'"retryDelay"\s*:\s*"(\d+(?:\.\d+)?)s"')
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """
+    Parse a Retry-After header value into seconds
+    
+    Accepts delta-seconds ("120") or an HTTP-date. Returns None when absent
+    or unparseable.
+    """
+    if not value:
+        return None
+    value = value.strip()
+    try:
+        return max(0.0, float(value))
+    except ValueError:
+        pass
+    try:
+        when = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if when.tzinfo is None:
+        when = when.replace(tzinfo=timezone.utc)
+    return max(0.0, (when - datetime.now(timezone.utc)).total_seconds())
+
+
+def parse_retry_delay(body: str) -> Optional[float]:
+    """Extract a google.rpc.RetryInfo retryDelay ("12s") from an error body"""
+    match = _RETRY_DELAY_RE.search(body or "")
+    return float(match.group(1)) if match else None
+
+
+class RetryPolicy:
+    """
+    Retry an async operation on transient errors
+    
+    - Delays follow "full jitter": uniform(0, min(max_delay, base_delay * 2^n))
+    - A server-provided retry delay (error.retry_after) is honored as a floor
+    - No attempt starts, and no sleep is scheduled, past the total budget
+    """
+    
+    def __init__(
+        self,
+        max_retries: int = 3,
+        base_delay: float = 0.5,
+        max_delay: float = 8.0,
+        budget: float = 60.0,
+        is_retryable: Optional[Callable[[BaseException], bool]] = None
+    ):
+        self.max_retries = max_retries
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.budget = budget
+        self._is_retryable = is_retryable or (lambda e: False)
+        
+        self.calls = 0
+        self.retries = 0
+        self.giveups = 0
+        self.budget_exhausted = 0
+    
+    def backoff(self, retry: int) -> float:
+        """Full-jitter delay before retry number `retry` (0-based)"""
+        return random.uniform(0, min(self.max_delay, self.base_delay * (2 ** retry)))
+    
+    async def run(self, fn: Callable[[float], Awaitable[T]]) -> T:
+        """
+        Call `fn(remaining_seconds)` until it succeeds or retries run out
+        
+        `fn` receives the time left in the budget so it can bound its own
+        timeouts. The last error is re-raised when giving up.
+        """
+        self.calls += 1
+        deadline = time.monotonic() + self.budget
+        retry = 0
+        
+        while True:
+            remaining = deadline - time.monotonic()
+            try:
+                return await fn(remaining)
+            except Exception as e:
+                if retry >= self.max_retries or not self._is_retryable(e):
+                    if retry:
+                        self.giveups += 1
+                    raise
+                
+                delay = self.backoff(retry)
+                retry_after = getattr(e, "retry_after", None)
+                if retry_after is not None:
+                    delay = max(delay, retry_after)
+                
+                remaining = deadline - time.monotonic()
+                if delay >= remaining:
+                    self.budget_exhausted += 1
+                    logger.warning(
+                        f"Retry budget exhausted ({remaining:.1f}s left, next delay {delay:.1f}s): {e}"
+                    )
+                    raise
+                
+                retry += 1
+                self.retries += 1
+                logger.warning(f"🔁 Retry {retry}/{self.max_retries} in {delay:.2f}s after: {e}")
+                await asyncio.sleep(delay)
+    
+    @property
+    def stats(self) -> Dict[str, Any]:
+        return {
+            "calls": self.calls,
+            "retries": self.retries,
+            "giveups": self.giveups,
+            "budget_exhausted": self.budget_exhausted,
+            "max_retries": self.max_retries,
+            "budget": self.budget,
+        }
@@ -0,0 +1,66 @@
+"""
+Single-flight request coalescing
+Concurrent callers with the same key share one in-flight computation
+"""
+import asyncio
+from typing import Any, Awaitable, Callable, Dict, Hashable, TypeVar
+
+T = TypeVar("T")
+
+
+class SingleFlight:
+    """
+    Deduplicate concurrent async calls by key
+    
+    The first caller for a key starts the computation as a task; callers
+    arriving while it is still running await the same task. The result (or
+    exception) is delivered to every waiter. A waiter being cancelled does
+    not cancel the shared computation for the others.
+    """
+    
+    def __init__(self):
+        self._inflight: Dict[Hashable, "asyncio.Future[Any]"] = {}
+        
+        self.calls = 0
+        self.executions = 0
+        self.coalesced = 0
+        self.errors = 0
+    
+    async def do(self, key: Hashable, fn: Callable[[], Awaitable[T]]) -> T:
+        """Run `fn` for `key`, or join the run already in flight"""
+        self.calls += 1
+        
+        task = self._inflight.get(key)
+        if task is None:
+            self.executions += 1
+            task = asyncio.ensure_future(fn())
+            self._inflight[key] = task
+            task.add_done_callback(lambda t, k=key: self._finish(k, t))
+        else:
+            self.coalesced += 1
+        
+        return await asyncio.shield(task)
+    
+    def _finish(self, key: Hashable, task: "asyncio.Future[Any]") -> None:
+        if self._inflight.get(key) is task:
+            del self._inflight[key]
+        # Retrieving the exception also silences "never retrieved" warnings
+        # when every waiter was cancelled before the task finished
+        if not task.cancelled() and task.exception() is not None:
+            self.errors += 1
+    
+    @property
+    def in_flight(self) -> int:
+        return len(self._inflight)
+    
+    @property
+    def stats(self) -> Dict[str, Any]:
+        """Counters; coalescing_rate is the share of calls that joined an existing flight"""
+        return {
+            "calls": self.calls,
+            "executions": self.executions,
+            "coalesced": self.coalesced,
+            "coalescing_rate": round(self.coalesced / self.calls, 4) if self.calls else 0.0,
+            "errors": self.errors,
+            "in_flight": len(self._inflight),
+        }
@@ -0,0 +1,275 @@
+"""
+Tool Suggester
+Answers /api/suggest from the local catalog, asking the LLM only for gaps
+"""
+import logging
+from collections import Counter, defaultdict
+from typing import Any, Dict, FrozenSet, List, Mapping, Optional, Sequence, Set
+
+from app.config import settings
+from app.services.gemini_service import gemini_service
+from app.database.tools_repository import tools_repository
+from app.data.ai_tools_database import AI_TOOLS_DATABASE, AITool, ToolCategory
+from app.data.catalog_index import tool_rank
+from app.data.search_index import (
+    ROW_TEXT_FIELDS, STOPWORDS, TOOL_TEXT_FIELDS, SearchIndex, tokenize, trigrams
+)
+
+logger = logging.getLogger(__name__)
+
+CATALOG = "catalog"
+LLM = "llm"
+
+
+def normalize_name(name: str) -> str:
+    """Dedup key for a tool name: "Perplexity AI", "perplexity" -> "perplexity" """
+    words = tokenize(name)
+    if len(words) > 1 and words[-1] == "ai":
+        words.pop()
+    return "".join(words)
+
+
+def _normalize_key(value: str) -> str:
+    return "".join(tokenize(value))
+
+
+# Normalised category name, value or id ("image_gen", "Image Generation") -> label
+_CATEGORY_LABELS: Dict[str, str] = {
+    **{_normalize_key(c.name): c.value for c in ToolCategory},
+    **{_normalize_key(c.value): c.value for c in ToolCategory},
+}
+
+
+class ToolSuggester:
+    """
+    Suggest tools for a free-text use case
+    
+    Candidates come from the curated AI_TOOLS_DATABASE and from the
+    `ai_tools` table (via AIToolsRepository.search_tools), merged and
+    deduplicated by normalized name. Each candidate gets a relevance in
+    [0, 1]: the share of query words its text matches (prefix and typo
+    matches count partially), scaled by PARTIAL_QUERY_WEIGHT unless it
+    matches more than half of the words. Gemini is only asked for the tools still
+    missing when fewer than `limit` candidates reach
+    SUGGEST_MIN_RELEVANCE, and its answers are checked against the catalog
+    the same way.
+    """
+    
+    CANDIDATE_FACTOR = 3  # Candidates read per source, per suggestion asked for
+    PARTIAL_QUERY_WEIGHT = 0.5  # Relevance factor for tools matching half the query words or fewer
+    
+    def __init__(self):
+        self.gemini = gemini_service
+        self.repo = tools_repository
+        self._index = SearchIndex(AI_TOOLS_DATABASE, TOOL_TEXT_FIELDS, tool_rank)
+        self._by_name = {normalize_name(t.name): t for t in AI_TOOLS_DATABASE}
+        self._by_category: Dict[str, List[AITool]] = defaultdict(list)
+        for tool in self._index.ranked:
+            self._by_category[_normalize_key(tool.category.value)].append(tool)
+        self.counters: Counter = Counter()
+    
+    async def suggest(
+        self,
+        query: str,
+        category: Optional[str] = None,
+        limit: int = 5
+    ) -> List[Dict[str, Any]]:
+        """
+        Suggestions, most relevant first (same shape as GeminiService.suggest_tools,
+        plus "source": "catalog" or "llm")
+        """
+        self.counters["requests"] += 1
+        words = [w for w in dict.fromkeys(tokenize(query)) if w not in STOPWORDS]
+        candidates = await self._local_candidates(query, words, category, limit)
+        
+        relevant = [c for c in candidates if c["relevanceScore"] >= settings.SUGGEST_MIN_RELEVANCE]
+        weak = candidates[len(relevant):]
+        suggestions = relevant[:limit]
+        
+        missing = limit - len(suggestions)
+        if missing > 0 and settings.SUGGEST_LLM_ENABLED:
+            self.counters["llm_calls"] += 1
+            seen = {normalize_name(s["name"]) for s in candidates}
+            exclude = [s["name"] for s in suggestions]
+            extra = await self._llm_suggestions(query, category, missing, seen, exclude)
+            self.counters["llm_added"] += len(extra)
+            suggestions.extend(extra)
+        else:
+            self.counters["local_only"] += 1
+        
+        suggestions.extend(weak[:limit - len(suggestions)])
+        return suggestions[:limit]
+    
+    async def _local_candidates(
+        self,
+        query: str,
+        words: List[str],
+        category: Optional[str],
+        limit: int
+    ) -> List[Dict[str, Any]]:
+        """Curated and database matches, deduplicated, by relevance (stable)"""
+        pool = limit * self.CANDIDATE_FACTOR
+        categories = self._category_keys(category)
+        
+        candidates: Dict[str, Dict[str, Any]] = {}
+        for tool, _ in self._index.search(query, pool):
+            self._add(candidates, self._from_tool(tool, words), categories)
+        for key in categories or ():
+            # Best rated of the category, for queries its tools don't spell out
+            for tool in self._by_category.get(key, ())[:pool]:
+                self._add(candidates, self._from_tool(tool, words), categories)
+        for row in await self.repo.search_tools(query, pool):
+            self._add(candidates, self._from_row(row, words), categories)
+        
+        return sorted(candidates.values(), key=lambda s: -s["relevanceScore"])
+    
+    @staticmethod
+    def _add(
+        candidates: Dict[str, Dict[str, Any]],
+        suggestion: Dict[str, Any],
+        categories: Optional[FrozenSet[str]]
+    ) -> None:
+        """Keep the first suggestion per normalized name, in the wanted category"""
+        if categories is not None and _normalize_key(suggestion["category"]) not in categories:
+            return
+        candidates.setdefault(normalize_name(suggestion["name"]), suggestion)
+    
+    @staticmethod
+    def _category_keys(category: Optional[str]) -> Optional[FrozenSet[str]]:
+        """Normalised category keys accepted by a filter (None: any)"""
+        if not category:
+            return None
+        key = _normalize_key(category)
+        label = _CATEGORY_LABELS.get(key)
+        return frozenset((key, _normalize_key(label))) if label else frozenset((key,))
+    
+    async def _llm_suggestions(
+        self,
+        query: str,
+        category: Optional[str],
+        limit: int,
+        seen: Set[str],
+        exclude: List[str]
+    ) -> List[Dict[str, Any]]:
+        """Gemini suggestions not already known, catalog data where we have it"""
+        categories = self._category_keys(category)
+        label = _CATEGORY_LABELS.get(_normalize_key(category), category) if category else ""
+        results = []
+        for item in await self.gemini.suggest_tools(query=query, category=category, limit=limit, exclude=exclude):
+            if not isinstance(item, dict) or not isinstance(item.get("name"), str):
+                continue
+            key = normalize_name(item["name"])
+            if not key or key in seen:
+                continue
+            seen.add(key)
+            
+            relevance = self._clamp(item.get("relevanceScore"))
+            tool = self._by_name.get(key)
+            if tool is not None:
+                suggestion = self._from_tool(tool, (), relevance)
+                if categories is not None and _normalize_key(suggestion["category"]) not in categories:
+                    continue
+            else:
+                suggestion = {
+                    "name": item["name"],
+                    "description": str(item.get("description") or ""),
+                    "category": str(item.get("category") or label),
+                    "url": item.get("url"),
+                    "pricing": str(item.get("pricing") or ""),
+                    "relevanceScore": relevance,
+                    "source": LLM,
+                }
+            results.append(suggestion)
+        return results[:limit]
+    
+    def _from_tool(self, tool: AITool, words: Sequence[str], relevance: Optional[float] = None) -> Dict[str, Any]:
+        if relevance is None:
+            relevance = self._relevance(words, f"{self._text(TOOL_TEXT_FIELDS, tool)} {tool.category.value}")
+        return {
+            "name": tool.name,
+            "description": tool.description,
+            "category": tool.category.value,
+            "url": tool.website_url,
+            "pricing": tool.pricing_type.title(),
+            "relevanceScore": relevance,
+            "source": CATALOG,
+        }
+    
+    def _from_row(self, row: Mapping[str, Any], words: Sequence[str]) -> Dict[str, Any]:
+        category = row.get("category_id") or ""
+        category = _CATEGORY_LABELS.get(_normalize_key(category), category)
+        pricing = row.get("pricing_type") or ("free" if not row.get("price_monthly") else "paid")
+        return {
+            "name": row["name"],
+            "description": row.get("description") or "",
+            "category": category,
+            "url": row.get("website_url"),
+            "pricing": pricing.title(),
+            "relevanceScore": self._relevance(words, f"{self._text(ROW_TEXT_FIELDS, row)} {category}"),
+            "source": CATALOG,
+        }
+    
+    @staticmethod
+    def _text(fields, tool) -> str:
+        return " ".join(get(tool) for get, _ in fields.values())
+    
+    @staticmethod
+    def _relevance(words: Sequence[str], text: str) -> float:
+        """
+        Share of query words found in a tool's text (and category), in [0, 1]
+        
+        A word scores 1 when it is one of the tool's words, PREFIX_WEIGHT
+        when it starts one, and its trigram similarity to the closest one
+        when that reaches FUZZY_THRESHOLD (as in SearchIndex). A tool that
+        matches only half of the words or fewer answers a different query
+        ("video" alone for "video editing"), so its share is scaled by
+        PARTIAL_QUERY_WEIGHT, which keeps it below SUGGEST_MIN_RELEVANCE.
+        """
+        if not words:
+            return 0.0
+        vocabulary = set(tokenize(text))
+        
+        total = 0.0
+        matched = 0
+        for word in words:
+            if word in vocabulary:
+                total += 1.0
+                matched += 1
+                continue
+            best = 0.0
+            if len(word) >= SearchIndex.PREFIX_MIN_LENGTH and any(v.startswith(word) for v in vocabulary):
+                best = SearchIndex.PREFIX_WEIGHT
+            elif len(word) >= SearchIndex.FUZZY_MIN_LENGTH:
+                grams = trigrams(word)
+                for v in vocabulary:
+                    other = trigrams(v)
+                    similarity = len(grams & other) / len(grams | other)
+                    if similarity >= SearchIndex.FUZZY_THRESHOLD and similarity > best:
+                        best = similarity
+            total += best
+            matched += best > 0
+        
+        share = total / len(words)
+        if 2 * matched <= len(words):
+            share *= ToolSuggester.PARTIAL_QUERY_WEIGHT
+        return round(share, 3)
+    
+    @staticmethod
+    def _clamp(value: Any) -> float:
+        try:
+            return round(min(max(float(value), 0.0), 1.0), 3)
+        except (TypeError, ValueError):
+            return 0.0
+    
+    @property
+    def stats(self) -> Dict[str, Any]:
+        """Suggestion counters: how often the catalog sufficed"""
+        requests = self.counters["requests"]
+        return {
+            **self.counters,
+            "local_only_rate": round(self.counters["local_only"] / requests, 3) if requests else None,
+        }
+
+
+# Global instance
+tool_suggester = ToolSuggester()
@@ -3,27 +3,81 @@ Toolkit Generator Service
 Orchestrates the generation of personalized AI toolkits
 Uses database-backed AI tools + LLM for personalization
 """
+import asyncio
+import json
 import logging
+import time
 import uuid
-from datetime import datetime
-from typing import Dict, Any, Optional, List
+from collections import Counter
+from datetime import datetime, timezone
+from typing import Awaitable, Dict, Any, Optional, List, Sequence, Set, Tuple, TypeVar
 
-from app.services.gemini_service import gemini_service
+from app.config import settings
+from app.services.cache import TTLCache
+from app.services.gemini_service import INTENT_LLM, gemini_service
+from app.services.intent_parser import intent_parser
+from app.services.single_flight import SingleFlight
 from app.database.tools_repository import tools_repository
+from app.data.fallback_catalog import (
+    DEFAULT_BACKGROUNDS, DEFAULT_WORK_TOOLS, PROFESSION_DISPLAY_NAMES
+)
+from app.data.taxonomy import PROFESSIONS, HOBBIES
 
 logger = logging.getLogger(__name__)
 
+T = TypeVar("T")
+
+# uuid5 namespace of deterministic toolkit ids
+TOOLKIT_ID_NAMESPACE = uuid.uuid5(uuid.NAMESPACE_URL, "aitoolkit:toolkit")
+
 
 class ToolkitGenerator:
     """
     Generates personalized AI toolkits using:
     1. Supabase database (with fallback to local data)
     2. LLM for personalization and ranking
+    
+    A toolkit is a body that depends only on the profession x hobby pair
+    (tools, specs, descriptions) plus a per-user overlay (id, slug, name,
+    timestamps). Bodies for every taxonomy pair are materialized up front
+    and rebuilt when the repository's catalog version (its content digest)
+    changes; other pairs are built on first request (concurrent misses
+    share one build) and cached under that digest, so refreshes that change
+    nothing keep every body. Most requests only apply the overlay.
+    Bodies are shared between responses and must not be mutated.
+    
+    With TOOLKIT_DETERMINISTIC the overlay is a function of the request
+    and the catalog stamp (id hashed from profession, hobby, name and
+    catalog digest; timestamps from the catalog's last update), so equal
+    requests against the same catalog return identical bytes.
     """
     
     def __init__(self):
         self.gemini = gemini_service
         self.repo = tools_repository
+        self.stage_timeouts: Counter = Counter()
+        self.stage_errors: Counter = Counter()
+        
+        self._materialized: Dict[Tuple[str, str], Dict[str, Any]] = {}
+        self._materialized_version: Optional[str] = None
+        self._materialize_task: Optional[asyncio.Task] = None
+        self.materialized_hits = 0
+        self.materialized_misses = 0
+        self.materialize_runs = 0
+        
+        self.cache: Optional[TTLCache] = None
+        if settings.TOOLKIT_CACHE_ENABLED:
+            self.cache = TTLCache(
+                max_entries=settings.TOOLKIT_CACHE_MAX_ENTRIES,
+                max_bytes=settings.TOOLKIT_CACHE_MAX_BYTES,
+                ttl=settings.TOOLKIT_CACHE_TTL,
+                sizeof=lambda body: len(json.dumps(body))
+            )
+        self.single_flight = SingleFlight()
+        self.builds = 0
+        self.build_time = 0.0
+        self.max_build_time = 0.0
+        self.speculation: Counter = Counter()
         logger.info("✅ ToolkitGenerator initialized")
     
     async def generate(
@@ -36,77 +90,371 @@ class ToolkitGenerator:
         """
         Generate a complete personalized toolkit
         
+        Materialized and cached pairs only get the per-user overlay.
+        Otherwise work tools, life tools and hobby backgrounds are looked up
+        concurrently; a stage that times out or fails falls back on its own
+        without discarding the others (and the body is not cached).
+        
         Returns:
             Complete toolkit data with real tools
         """
-        toolkit_id = str(uuid.uuid4())
-        slug = self._generate_slug(name, profession, hobby)
+        try:
+            return self.apply_overlay(await self.get_body(profession, hobby), hobby, name)
+        
+        except Exception as e:
+            logger.error(f"❌ Toolkit generation error: {e}")
+            return self._create_fallback_toolkit(profession, hobby, name)
+    
+    async def get_body(self, profession: str, hobby: str) -> Dict[str, Any]:
+        """The shared body for a pair: materialized, cached, or built once for concurrent callers"""
+        body = self._materialized_body(profession, hobby)
+        if body is not None:
+            return body
+        
+        # Catalog content digest: entries outlive refreshes that change nothing
+        key = (profession, hobby, self.repo.catalog_version)
+        body = self.cache.get(key) if self.cache is not None else None
+        if body is None:
+            body = await self.single_flight.do(key, lambda: self._build_and_cache(key))
+        return body
+    
+    async def generate_from_input(self, user_input: str) -> Tuple[Dict[str, Any], Dict[str, Any]]:
+        """
+        Parse free text and generate its toolkit: (parsed intent, toolkit)
+        
+        When the local intent parser has a plausible guess that still goes
+        to the LLM (confidence from SPECULATIVE_MIN_CONFIDENCE up to
+        LOCAL_PARSE_MIN_CONFIDENCE: ambiguous and one-slot parses), the
+        guessed pair's body is assembled while Gemini parses. If the parse
+        agrees, that body is used; otherwise the speculation is cancelled
+        and the parsed pair is generated. Only parses Gemini produced count
+        as hits or misses: a fallback parse says nothing about the guess.
+        """
+        guess = self._speculative_guess(user_input)
+        speculative = None
+        if guess is not None:
+            self.speculation["attempts"] += 1
+            speculative = asyncio.ensure_future(self._speculative_body(*guess))
         
         try:
-            # Get work tools (4 tools: 1-2 LLMs + 2-3 vertical)
-            work_tools_raw = await self.repo.get_tools_by_profession(profession, limit=4)
+            parsed = await self.gemini.parse_intent(user_input)
+            profession = parsed.get("profession", "product-manager")
+            hobby = parsed.get("hobby", "general")
+            name = parsed.get("name")
             
-            # Get life tools (2 lifestyle tools)
-            life_tools_raw = await self.repo.get_tools_by_hobby(hobby, limit=2)
-            
-            # Get backgrounds for hobby
-            backgrounds = await self.repo.get_hobby_backgrounds(hobby)
-            
-            # Format for frontend
-            work_tools = [self._format_work_tool(t) for t in work_tools_raw]
-            life_tools = [
-                self._format_life_tool(t, backgrounds[i] if i < len(backgrounds) else None)
-                for i, t in enumerate(life_tools_raw)
-            ]
-            
-            # If no life tools, create generic ones
-            if not life_tools:
-                life_tools = self._create_generic_life_tools(hobby, backgrounds)
-            
-            # Ensure we have enough work tools
-            if len(work_tools) < 4:
-                work_tools = self._ensure_minimum_work_tools(work_tools, profession)
-            
-            toolkit = {
-                "workTools": work_tools[:4],
-                "lifeTools": life_tools[:2],
-            }
-            
-            # Add metadata
-            profession_display = self._format_profession(profession)
-            hobby_display = self._format_hobby(hobby)
-            user_name = name or "User"
-            
-            toolkit.update({
-                "id": toolkit_id,
-                "slug": slug,
-                "userName": user_name,
-                "profession": profession_display,
-                "professionSlug": profession,
-                "lifeContext": hobby_display,
-                "createdAt": datetime.now().isoformat(),
-                # Required fields for API response
-                "specs": {
-                    "totalTools": len(work_tools) + len(life_tools),
-                    "freeTools": len([t for t in work_tools if t.get("price", 0) == 0]),
-                    "paidTools": len([t for t in work_tools if t.get("price", 0) > 0]),
-                    "monthlyCost": sum(t.get("price", 0) for t in work_tools),
-                    "primaryGoal": f"Boost {profession_display} productivity",
-                    "lastUpdated": datetime.now().strftime("%B %Y"),
-                },
-                "description": f"AI-powered toolkit for {profession_display}s who love {hobby_display}",
-                "longDescription": f"This personalized AI toolkit combines the best productivity tools for {profession_display}s with lifestyle apps perfect for {hobby_display} enthusiasts. Curated specifically for {user_name}.",
-            })
-            
-            logger.info(f"✅ Generated toolkit: {len(work_tools)} work + {len(life_tools)} life tools")
-            return toolkit
+            if speculative is not None:
+                agrees = (profession, hobby) == guess
+                if parsed.get("source") == INTENT_LLM:
+                    self.speculation["hits" if agrees else "misses"] += 1
+                else:
+                    self.speculation["unscored"] += 1
+                if agrees:
+                    if speculative.done():
+                        self.speculation["ready_on_parse"] += 1
+                    body = await speculative
+                    if body is not None:
+                        return parsed, self.apply_overlay(body, hobby, name)
             
+            return parsed, await self.generate(profession, hobby, name)
+        
+        finally:
+            if speculative is not None:
+                speculative.cancel()
+    
+    def _speculative_guess(self, user_input: str) -> Optional[Tuple[str, str]]:
+        """(profession, hobby) worth assembling before the LLM parse returns"""
+        if not settings.SPECULATIVE_GENERATE_ENABLED:
+            return None
+        local = intent_parser.parse(user_input)
+        if local is None:
+            return None
+        if not settings.SPECULATIVE_MIN_CONFIDENCE <= local["confidence"] < settings.LOCAL_PARSE_MIN_CONFIDENCE:
+            return None  # Too weak to bet on, or parse_intent answers locally anyway
+        return local["profession"], local["hobby"]
+    
+    async def _speculative_body(self, profession: str, hobby: str) -> Optional[Dict[str, Any]]:
+        """get_body, with errors left to the regular path (None)"""
+        try:
+            return await self.get_body(profession, hobby)
         except Exception as e:
-            logger.error(f"❌ Toolkit generation error: {e}")
-            return self._create_fallback_toolkit(profession, hobby, name)
+            logger.warning(f"Speculative toolkit build failed: {e}")
+            return None
+    
+    async def _build_and_cache(self, key: Tuple[str, str, Optional[str]]) -> Dict[str, Any]:
+        """Look up and build the body for a pair; cached unless a stage fell back"""
+        profession, hobby, _ = key
+        failed: Set[str] = set()
+        start = time.perf_counter()
+        
+        # Work tools (4 tools: 1-2 LLMs + 2-3 vertical) and life tools
+        # (2 lifestyle tools with hobby backgrounds)
+        work_tools, life_tools = await asyncio.gather(
+            self.get_work_tools(profession, failed),
+            self.get_life_tools(hobby, failed),
+        )
+        body = self.build_body(profession, hobby, work_tools, life_tools)
+        
+        elapsed = time.perf_counter() - start
+        self.builds += 1
+        self.build_time += elapsed
+        self.max_build_time = max(self.max_build_time, elapsed)
+        if self.cache is not None and not failed:
+            self.cache.set(key, body)
+        
+        logger.info(f"✅ Generated toolkit: {len(work_tools)} work + {len(life_tools)} life tools")
+        return body
+    
+    async def get_work_tools(self, profession: str, failed: Optional[Set[str]] = None) -> List[Dict[str, Any]]:
+        """Fetch and format the work tools for a profession (at least 4)"""
+        work_tools_raw = await self._stage(
+            "work_tools",
+            self.repo.get_tools_by_profession(profession, limit=4, profile="work_card"),
+            settings.TOOLKIT_WORK_TOOLS_TIMEOUT,
+            fallback=[],
+            failed=failed
+        )
+        work_tools = [self._format_work_tool(t) for t in work_tools_raw]
+        
+        # Ensure we have enough work tools
+        if len(work_tools) < 4:
+            work_tools = self._ensure_minimum_work_tools(work_tools, profession)
+        
+        return work_tools[:4]
+    
+    async def get_life_tools(self, hobby: str, failed: Optional[Set[str]] = None) -> List[Dict[str, Any]]:
+        """Fetch and format the life tools for a hobby, with background images"""
+        life_tools_raw, backgrounds = await asyncio.gather(
+            self._stage(
+                "life_tools",
+                self.repo.get_tools_by_hobby(hobby, limit=2, profile="life_card"),
+                settings.TOOLKIT_LIFE_TOOLS_TIMEOUT,
+                fallback=[],
+                failed=failed
+            ),
+            self._stage(
+                "backgrounds",
+                self.repo.get_hobby_backgrounds(hobby),
+                settings.TOOLKIT_BACKGROUNDS_TIMEOUT,
+                fallback=DEFAULT_BACKGROUNDS,
+                failed=failed
+            ),
+        )
+        
+        life_tools = [
+            self._format_life_tool(t, backgrounds[i] if i < len(backgrounds) else None)
+            for i, t in enumerate(life_tools_raw)
+        ]
+        
+        # If no life tools, create generic ones
+        if not life_tools:
+            life_tools = self._create_generic_life_tools(hobby, backgrounds)
+        
+        return life_tools[:2]
+    
+    async def _stage(
+        self,
+        name: str,
+        aw: Awaitable[T],
+        timeout: float,
+        fallback: T,
+        failed: Optional[Set[str]] = None
+    ) -> T:
+        """
+        Await one lookup stage, returning `fallback` on timeout or error
+        
+        A stage that falls back is counted globally and, when the caller
+        passes its own `failed` set, added to it, so a build only sees its
+        own failures and not those of concurrent requests.
+        """
+        try:
+            return await asyncio.wait_for(aw, timeout)
+        except asyncio.TimeoutError:
+            self.stage_timeouts[name] += 1
+            logger.warning(f"⏱️ Toolkit stage '{name}' timed out after {timeout}s, using fallback")
+        except Exception as e:
+            self.stage_errors[name] += 1
+            logger.error(f"❌ Toolkit stage '{name}' failed: {e}, using fallback")
+        if failed is not None:
+            failed.add(name)
+        return fallback
+    
+    @property
+    def stats(self) -> Dict[str, Any]:
+        """Per-stage timeout and error counts, materialized toolkit, cache and speculation usage"""
+        return {
+            "stage_timeouts": dict(self.stage_timeouts),
+            "stage_errors": dict(self.stage_errors),
+            "materialized": {
+                "pairs": len(self._materialized),
+                "catalog_version": self._materialized_version,
+                "hits": self.materialized_hits,
+                "misses": self.materialized_misses,
+                "runs": self.materialize_runs,
+            },
+            "cache": self.cache.stats if self.cache is not None else None,
+            "single_flight": self.single_flight.stats,
+            "builds": {
+                "count": self.builds,
+                "avg_ms": round(self.build_time / self.builds * 1000, 2) if self.builds else 0.0,
+                "max_ms": round(self.max_build_time * 1000, 2),
+            },
+            "speculation": self._speculation_stats(),
+        }
+    
+    def _speculation_stats(self) -> Dict[str, Any]:
+        """Speculative smart-generate counters; hit_rate is hits per Gemini-parsed attempt"""
+        hits, misses = self.speculation["hits"], self.speculation["misses"]
+        return {
+            "attempts": self.speculation["attempts"],
+            "hits": hits,
+            "misses": misses,
+            "unscored": self.speculation["unscored"],
+            "ready_on_parse": self.speculation["ready_on_parse"],
+            "hit_rate": round(hits / (hits + misses), 4) if hits + misses else 0.0,
+        }
+    
+    # =========================================================================
+    # MATERIALIZED TOOLKITS
+    # =========================================================================
+    
+    async def materialize(self) -> int:
+        """
+        Build the toolkit body of every taxonomy pair against the current catalog
+        
+        Work and life tools are looked up once per profession and per hobby.
+        The set is replaced only if every lookup succeeded and the catalog
+        did not change meanwhile; otherwise the previous set stays (and is
+        ignored while its version is stale).
+        
+        Returns:
+            Number of pairs materialized (0 when skipped)
+        """
+        version = self.repo.catalog_version
+        if not settings.TOOLKIT_MATERIALIZE_ENABLED or version is None:
+            return 0
+        
+        professions = [p["id"] for p in PROFESSIONS]
+        hobbies = [h["id"] for h in HOBBIES]
+        pairs = [(p, h) for p in professions for h in hobbies]
+        
+        failed: Set[str] = set()
+        start = time.perf_counter()
+        work, life = await asyncio.gather(
+            asyncio.gather(*(self.get_work_tools(p, failed) for p in professions)),
+            asyncio.gather(*(self.get_life_tools(h, failed) for h in hobbies)),
+        )
+        if failed:
+            logger.warning(f"Toolkit materialization skipped: lookup stages failed ({', '.join(sorted(failed))})")
+            return 0
+        if self.repo.catalog_version != version:
+            return 0
+        
+        work_by_profession = dict(zip(professions, work))
+        life_by_hobby = dict(zip(hobbies, life))
+        self._materialized = {
+            (p, h): self.build_body(p, h, work_by_profession[p], life_by_hobby[h]) for p, h in pairs
+        }
+        self._materialized_version = version
+        self.materialize_runs += 1
+        logger.info(f"🧊 Materialized {len(pairs)} toolkits in {(time.perf_counter() - start) * 1000:.0f}ms")
+        return len(pairs)
+    
+    def _materialized_body(self, profession: str, hobby: str) -> Optional[Dict[str, Any]]:
+        """The pair's materialized body, if current; schedules a rebuild when stale"""
+        if not settings.TOOLKIT_MATERIALIZE_ENABLED:
+            return None
+        if self._materialized_version != self.repo.catalog_version:
+            if self._materialize_task is None or self._materialize_task.done():
+                self._materialize_task = asyncio.ensure_future(self.materialize())
+            self.materialized_misses += 1
+            return None
+        body = self._materialized.get((profession, hobby))
+        if body is None:
+            self.materialized_misses += 1
+        else:
+            self.materialized_hits += 1
+        return body
+    
+    # =========================================================================
+    # TOOLKIT ASSEMBLY
+    # =========================================================================
+    
+    def build_toolkit(
+        self,
+        profession: str,
+        hobby: str,
+        name: Optional[str],
+        work_tools: List[Dict[str, Any]],
+        life_tools: List[Dict[str, Any]],
+        fallback: bool = False
+    ) -> Dict[str, Any]:
+        """Assemble the toolkit response from already formatted tools (see apply_overlay for `fallback`)"""
+        return self.apply_overlay(self.build_body(profession, hobby, work_tools, life_tools), hobby, name, fallback)
+    
+    def build_body(
+        self,
+        profession: str,
+        hobby: str,
+        work_tools: List[Dict[str, Any]],
+        life_tools: List[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """The part of a toolkit that depends only on the profession x hobby pair"""
+        profession_display = self._format_profession(profession)
+        hobby_display = self._format_hobby(hobby)
+        
+        return {
+            "workTools": work_tools,
+            "lifeTools": life_tools,
+            "profession": profession_display,
+            "professionSlug": profession,
+            "lifeContext": hobby_display,
+            # Required fields for API response
+            "specs": {
+                "totalTools": len(work_tools) + len(life_tools),
+                "freeTools": len([t for t in work_tools if t.get("price", 0) == 0]),
+                "paidTools": len([t for t in work_tools if t.get("price", 0) > 0]),
+                "monthlyCost": sum(t.get("price", 0) for t in work_tools),
+                "primaryGoal": f"Boost {profession_display} productivity",
+            },
+            "description": f"AI-powered toolkit for {profession_display}s who love {hobby_display}",
+        }
+    
+    def apply_overlay(
+        self,
+        body: Dict[str, Any],
+        hobby: str,
+        name: Optional[str],
+        fallback: bool = False
+    ) -> Dict[str, Any]:
+        """
+        A user's toolkit from a (shared, unmodified) body
+        
+        `fallback` marks a body built from default tools instead of the
+        catalog, which must not share the catalog toolkit's id.
+        """
+        user_name = name or "User"
+        toolkit_id, created = self._identity(body["professionSlug"], hobby, user_name, fallback)
+        return {
+            **body,
+            "id": toolkit_id,
+            "slug": self._generate_slug(name, body["professionSlug"], hobby),
+            "userName": user_name,
+            "createdAt": created.isoformat(),
+            "specs": {**body["specs"], "lastUpdated": created.strftime("%B %Y")},
+            "longDescription": f"This personalized AI toolkit combines the best productivity tools for {body['profession']}s with lifestyle apps perfect for {body['lifeContext']} enthusiasts. Curated specifically for {user_name}.",
+        }
+    
+    def _identity(self, profession: str, hobby: str, user_name: str, fallback: bool) -> Tuple[str, datetime]:
+        """Toolkit id and creation time (UTC): content-addressed when deterministic"""
+        stamp = self.repo.catalog_stamp if settings.TOOLKIT_DETERMINISTIC else None
+        if stamp is None:
+            return str(uuid.uuid4()), datetime.now(timezone.utc)
+        digest, updated_at = stamp
+        key = "\x1f".join((profession, hobby, user_name, digest) + (("fallback",) if fallback else ()))
+        return str(uuid.uuid5(TOOLKIT_ID_NAMESPACE, key)), updated_at or datetime.now(timezone.utc)
     
     def _format_work_tool(self, tool: Dict) -> Dict[str, Any]:
-        """Format database tool for frontend (work mode)"""
+        """Format database tool for frontend (work mode); reads the work_card columns"""
         return {
             "name": tool.get("name", "Unknown Tool"),
             "logo": tool.get("logo_color", "#6366F1"),
@@ -122,7 +470,7 @@ class ToolkitGenerator:
         }
     
     def _format_life_tool(self, tool: Dict, background: Optional[str] = None) -> Dict[str, Any]:
-        """Format database tool for frontend (life mode)"""
+        """Format database tool for frontend (life mode); reads the life_card columns"""
         return {
             "name": tool.get("name", "Unknown Tool"),
             "description": tool.get("description", ""),
@@ -130,7 +478,7 @@ class ToolkitGenerator:
             "url": tool.get("website_url", "#"),
         }
     
-    def _create_generic_life_tools(self, hobby: str, backgrounds: List[str]) -> List[Dict]:
+    def _create_generic_life_tools(self, hobby: str, backgrounds: Sequence[str]) -> List[Dict]:
         """Create generic life tools when no specific tools match"""
         hobby_title = hobby.replace("-", " ").title()
         return [
@@ -153,67 +501,12 @@ class ToolkitGenerator:
         if len(tools) >= 4:
             return tools
         
-        # Default tools to fill in
-        defaults = [
-            {
-                "name": "ChatGPT",
-                "logo": "#10A37F",
-                "logoUrl": "https://upload.wikimedia.org/wikipedia/commons/0/04/ChatGPT_logo.svg",
-                "rating": 4.9,
-                "description": "OpenAI's versatile AI assistant for writing, coding, and analysis.",
-                "ctaText": "Try Free",
-                "category": "LLM",
-                "price": 20,
-                "url": "https://chat.openai.com",
-                "integrationMode": "paid_api",
-                "apiAvailable": True,
-            },
-            {
-                "name": "Linear",
-                "logo": "#5E6AD2",
-                "logoUrl": "https://asset.brandfetch.io/idaeNz7NsW/id-dQuXyBh.svg",
-                "rating": 4.9,
-                "description": "Streamlined issue tracking built for modern product teams.",
-                "ctaText": "Start Free",
-                "category": "Project Management",
-                "price": 8,
-                "url": "https://linear.app",
-                "integrationMode": "free_api",
-                "apiAvailable": True,
-            },
-            {
-                "name": "Raycast",
-                "logo": "#FF6363",
-                "logoUrl": "https://asset.brandfetch.io/idwCAv24ti/id3LDGCDoT.svg",
-                "rating": 4.9,
-                "description": "Productivity launcher with AI commands and integrations.",
-                "ctaText": "Download Free",
-                "category": "Automation",
-                "price": 8,
-                "url": "https://raycast.com",
-                "integrationMode": "free_api",
-                "apiAvailable": True,
-            },
-            {
-                "name": "Notion",
-                "logo": "#000000",
-                "logoUrl": "https://upload.wikimedia.org/wikipedia/commons/e/e9/Notion-logo.svg",
-                "rating": 4.8,
-                "description": "All-in-one workspace for notes, docs, and project management.",
-                "ctaText": "Start Free",
-                "category": "Writing",
-                "price": 10,
-                "url": "https://notion.so",
-                "integrationMode": "free_api",
-                "apiAvailable": True,
-            },
-        ]
-        
         # Add defaults that aren't already in the list
         existing_names = {t["name"].lower() for t in tools}
-        for default in defaults:
+        for default in DEFAULT_WORK_TOOLS:
             if default["name"].lower() not in existing_names:
-                tools.append(default)
+                # Response dicts are mutable; the shared defaults are not
+                tools.append(default.copy())
             if len(tools) >= 4:
                 break
         
@@ -226,23 +519,7 @@ class ToolkitGenerator:
     
     def _format_profession(self, profession: str) -> str:
         """Format profession for display"""
-        professions = {
-            "product-manager": "Product Manager",
-            "developer": "Developer",
-            "designer": "Designer",
-            "marketer": "Marketer",
-            "data-scientist": "Data Scientist",
-            "writer": "Writer",
-            "entrepreneur": "Entrepreneur",
-            "hr-manager": "HR Manager",
-            "consultant": "Consultant",
-            "student": "Student",
-            "game-designer": "Game Designer",
-            "software-engineer": "Software Engineer",
-            "blockchain-engineer": "Blockchain Engineer",
-            "agent-engineer": "AI Agent Engineer",
-        }
-        return professions.get(profession.lower(), profession.replace("-", " ").title())
+        return PROFESSION_DISPLAY_NAMES.get(profession.lower(), profession.replace("-", " ").title())
     
     def _format_hobby(self, hobby: str) -> str:
         """Format hobby for display"""
@@ -257,38 +534,10 @@ class ToolkitGenerator:
         """Create fallback toolkit when generation fails"""
         logger.warning("Using fallback toolkit generation")
         
-        backgrounds = [
-            "https://images.unsplash.com/photo-1488646953014-85cb44e25828?w=800&q=80",
-            "https://images.unsplash.com/photo-1436491865332-7a61a109cc05?w=800&q=80",
-        ]
-        
-        profession_display = self._format_profession(profession)
-        hobby_display = self._format_hobby(hobby)
-        user_name = name or "User"
         work_tools = self._ensure_minimum_work_tools([], profession)[:4]
-        life_tools = self._create_generic_life_tools(hobby, backgrounds)
+        life_tools = self._create_generic_life_tools(hobby, DEFAULT_BACKGROUNDS)
         
-        return {
-            "id": str(uuid.uuid4()),
-            "slug": self._generate_slug(name, profession, hobby),
-            "userName": user_name,
-            "profession": profession_display,
-            "professionSlug": profession,
-            "lifeContext": hobby_display,
-            "createdAt": datetime.now().isoformat(),
-            "workTools": work_tools,
-            "lifeTools": life_tools,
-            "specs": {
-                "totalTools": len(work_tools) + len(life_tools),
-                "freeTools": len([t for t in work_tools if t.get("price", 0) == 0]),
-                "paidTools": len([t for t in work_tools if t.get("price", 0) > 0]),
-                "monthlyCost": sum(t.get("price", 0) for t in work_tools),
-                "primaryGoal": f"Boost {profession_display} productivity",
-                "lastUpdated": datetime.now().strftime("%B %Y"),
-            },
-            "description": f"AI-powered toolkit for {profession_display}s who love {hobby_display}",
-            "longDescription": f"This personalized AI toolkit combines the best productivity tools for {profession_display}s with lifestyle apps perfect for {hobby_display} enthusiasts. Curated specifically for {user_name}.",
-        }
+        return self.build_toolkit(profession, hobby, name, work_tools, life_tools, fallback=True)
 
 
 # Global instance
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""
+Benchmark: AIToolsService lookups, k-way merge vs NumPy matrix product
+
+Runs profession and hobby recommendations, and deeper catalog queries
+(large limits, all matches), over the real catalog (42 tools) and
+synthetic ones of 10k and 100k tools. Each query runs on the k-way merge
+alone and with the index's NumPy vectors, which top() uses when it
+estimates them cheaper; results are checked to be identical.
+
+Usage:
+    python scripts/bench_catalog_scoring.py [--sizes 42,10000,100000]
+"""
+import argparse
+import random
+import sys
+import time
+from dataclasses import replace
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.data.ai_tools_database import AI_TOOLS_DATABASE, AIToolsService
+from app.data.catalog_index import NUMPY_AVAILABLE
+
+PROFESSIONS = ["developer", "product-manager", "software engineer", "chef"]
+HOBBIES = ["gaming", "photography", "hiking"]
+
+
+def synthetic_catalog(count: int, rng: random.Random) -> list:
+    """Copies of the real tools with shuffled ratings and professions"""
+    professions = sorted({p for t in AI_TOOLS_DATABASE for p in t.professions})
+    hobbies = sorted({h for t in AI_TOOLS_DATABASE for h in t.hobbies})
+    niche = [f"role-{i}" for i in range(count // 50)]  # Long tail of rare professions
+    return [
+        replace(
+            base,
+            id=f"{base.id}-{i}",
+            rating=rng.choice([4.1, 4.5, 4.7, 4.8, 4.9]),
+            professions=rng.sample(professions, 2) + rng.sample(niche, 2),
+            hobbies=rng.sample(hobbies, rng.randint(0, 2)),
+        )
+        for i, base in ((i, AI_TOOLS_DATABASE[i % len(AI_TOOLS_DATABASE)]) for i in range(count))
+    ]
+
+
+def timed(fn, budget: float = 0.3) -> tuple:
+    """(result, mean seconds per call) over about `budget` seconds"""
+    result = fn()
+    calls, start = 0, time.perf_counter()
+    while True:
+        fn()
+        calls += 1
+        elapsed = time.perf_counter() - start
+        if elapsed > budget:
+            return result, elapsed / calls
+
+
+def workload(service: AIToolsService) -> dict:
+    index = service._vertical_index
+    terms = [service._profession_terms(p.lower().replace(" ", "-")) for p in PROFESSIONS]
+    return {
+        "profession top 5": lambda: [service.get_tools_for_profession(p) for p in PROFESSIONS],
+        "hobby top 2": lambda: [service.get_tools_for_hobby(h) for h in HOBBIES],
+        "profession top 100": lambda: [index.top(*t, limit=100) for t in terms],
+        "profession top 1000": lambda: [index.top(*t, limit=1000) for t in terms],
+        "profession all": lambda: [index.top(*t) for t in terms],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", default="42,10000,100000")
+    args = parser.parse_args()
+
+    if not NUMPY_AVAILABLE:
+        sys.exit("numpy is required: pip install numpy")
+
+    rng = random.Random(42)
+    print(f"{'tools':>7} {'query':<20} {'merge us':>10} {'numpy us':>10} {'top() us':>10}")
+    for size in (int(s) for s in args.sizes.split(",")):
+        tools = AI_TOOLS_DATABASE if size == len(AI_TOOLS_DATABASE) else synthetic_catalog(size, rng)
+        service = AIToolsService(tools)
+        index = service._vertical_index
+        vectors = index._vectors
+
+        for label, fn in workload(service).items():
+            index._vectors = {}
+            merged, merge_time = timed(fn)
+
+            # Force the product wherever vectors exist, then let top() choose
+            index._vectors = vectors
+            choose = index._product_is_cheaper
+            index._product_is_cheaper = lambda lists, limit: True
+            product, product_time = timed(fn)
+            del index._product_is_cheaper
+            chosen, chosen_time = timed(fn)
+
+            ids = lambda batch: [[t.id for t in result] for result in batch]
+            assert ids(merged) == ids(product) == ids(chosen), (size, label)
+            assert index._product_is_cheaper == choose
+            print(f"{len(tools):>7} {label:<20} {merge_time * 1e6:>10.1f} {product_time * 1e6:>10.1f} "
+                  f"{chosen_time * 1e6:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Benchmark: memory allocated per toolkit request in fallback mode
+
+Forces the repository onto its local fallback catalog and measures, with
+tracemalloc, the transient memory (peak above the steady state) and the
+time of toolkit generation and fallback search, then of each constant
+table lookup on its own.
+
+Usage:
+    python scripts/bench_fallback_alloc.py [--requests 500]
+"""
+import argparse
+import asyncio
+import sys
+import time
+import tracemalloc
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.database.tools_repository import tools_repository
+from app.services.toolkit_generator import toolkit_generator
+
+PAIRS = [
+    ("developer", "gaming"),
+    ("designer", "photography"),
+    ("product-manager", "hiking"),
+    ("chef", "knitting"),  # No catalog match: exercises the defaults
+]
+
+
+def measure(label: str, fn, requests: int) -> None:
+    """Print the mean transient allocation and time of fn()"""
+    for _ in range(10):
+        fn()  # Warm up lazily built structures
+
+    peaks = []
+    tracemalloc.start()
+    for _ in range(requests):
+        tracemalloc.reset_peak()
+        base = tracemalloc.get_traced_memory()[0]
+        fn()
+        peaks.append(tracemalloc.get_traced_memory()[1] - base)
+    tracemalloc.stop()
+
+    start = time.perf_counter()
+    for _ in range(requests):
+        fn()
+    elapsed = (time.perf_counter() - start) / requests
+
+    print(f"{label:<34} {sum(peaks) / len(peaks) / 1024:8.1f} KiB peak {elapsed * 1e6:9.1f} us")
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--requests", type=int, default=500)
+    args = parser.parse_args()
+
+    tools_repository._use_fallback = True
+    loop = asyncio.new_event_loop()
+
+    def generate():
+        for profession, hobby in PAIRS:
+            loop.run_until_complete(toolkit_generator.generate(profession, hobby, "Alex"))
+
+    def fallback_toolkit():
+        for profession, hobby in PAIRS:
+            toolkit_generator._create_fallback_toolkit(profession, hobby, "Alex")
+
+    def search():
+        for profession, _ in PAIRS:
+            loop.run_until_complete(tools_repository.search_tools(profession[:4]))
+
+    print(f"{len(PAIRS)} profession/hobby pairs per iteration, {args.requests} iterations")
+    measure("generate() x4", generate, args.requests)
+    measure("_create_fallback_toolkit() x4", fallback_toolkit, args.requests)
+    measure("search_tools() x4", search, args.requests)
+
+    # The constant tables on their own, one call each
+    measure("_get_fallback_tools()", tools_repository._get_fallback_tools, args.requests)
+    measure("_get_fallback_backgrounds()", lambda: tools_repository._get_fallback_backgrounds("gaming"), args.requests)
+    measure("_ensure_minimum_work_tools()", lambda: toolkit_generator._ensure_minimum_work_tools([], "chef"), args.requests)
+    measure("_format_profession()", lambda: toolkit_generator._format_profession("developer"), args.requests)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,159 @@
+#!/usr/bin/env python3
+"""
+Benchmark: per-call aiohttp sessions vs the shared Gemini connection pool
+
+Starts a local TLS stub that mimics the streamGenerateContent endpoint and
+times N sequential calls with both strategies. The per-call strategy pays a
+TCP connect + TLS handshake on every request; the pooled strategy reuses
+keep-alive connections.
+
+Usage:
+    python scripts/bench_gemini_session.py [--calls 200] [--concurrency 1] [--no-tls]
+"""
+import argparse
+import asyncio
+import datetime
+import ssl
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+import aiohttp
+from aiohttp import web
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.config import settings
+
+STUB_RESPONSE = [
+    {"candidates": [{"content": {"parts": [{"text": '{"profession":"product-manager",'}]}}]},
+    {"candidates": [{"content": {"parts": [{"text": '"hobby":"hiking"}'}]}}]},
+]
+
+
+def build_tls_contexts():
+    """Create a self-signed certificate and matching server/client SSL contexts"""
+    from cryptography import x509
+    from cryptography.hazmat.primitives import hashes, serialization
+    from cryptography.hazmat.primitives.asymmetric import ec
+    from cryptography.x509.oid import NameOID
+
+    key = ec.generate_private_key(ec.SECP256R1())
+    name = x509.Name([x509.NameAttribute(NameOID.COMMON_NAME, "localhost")])
+    now = datetime.datetime.now(datetime.timezone.utc)
+    cert = (
+        x509.CertificateBuilder()
+        .subject_name(name)
+        .issuer_name(name)
+        .public_key(key.public_key())
+        .serial_number(x509.random_serial_number())
+        .not_valid_before(now - datetime.timedelta(minutes=1))
+        .not_valid_after(now + datetime.timedelta(hours=1))
+        .add_extension(x509.SubjectAlternativeName([x509.DNSName("localhost")]), critical=False)
+        .sign(key, hashes.SHA256())
+    )
+
+    tmp = Path(tempfile.mkdtemp())
+    cert_path = tmp / "cert.pem"
+    key_path = tmp / "key.pem"
+    cert_path.write_bytes(cert.public_bytes(serialization.Encoding.PEM))
+    key_path.write_bytes(key.private_bytes(
+        serialization.Encoding.PEM,
+        serialization.PrivateFormat.PKCS8,
+        serialization.NoEncryption(),
+    ))
+
+    server_ctx = ssl.create_default_context(ssl.Purpose.CLIENT_AUTH)
+    server_ctx.load_cert_chain(cert_path, key_path)
+    client_ctx = ssl.create_default_context(cafile=str(cert_path))
+    return server_ctx, client_ctx
+
+
+async def start_stub(port: int, server_ssl):
+    """Start the stub Gemini server and return (runner, set of seen transports)"""
+    transports = set()
+
+    async def handler(request: web.Request) -> web.Response:
+        transports.add(request.transport)
+        await request.read()
+        return web.json_response(STUB_RESPONSE)
+
+    app = web.Application()
+    app.router.add_post("/v1beta/models/{model}", handler)
+    runner = web.AppRunner(app, access_log=None)
+    await runner.setup()
+    site = web.TCPSite(runner, "localhost", port, ssl_context=server_ssl)
+    await site.start()
+    return runner, transports
+
+
+async def run_calls(call, calls: int, concurrency: int) -> float:
+    """Run `calls` requests with bounded concurrency, return elapsed seconds"""
+    semaphore = asyncio.Semaphore(concurrency)
+
+    async def one():
+        async with semaphore:
+            await call()
+
+    start = time.perf_counter()
+    await asyncio.gather(*(one() for _ in range(calls)))
+    return time.perf_counter() - start
+
+
+async def main(args):
+    server_ssl, client_ssl = build_tls_contexts() if args.tls else (None, False)
+    scheme = "https" if args.tls else "http"
+    url = f"{scheme}://localhost:{args.port}/v1beta/models/{settings.GEMINI_MODEL}:streamGenerateContent"
+    payload = {"contents": [{"role": "user", "parts": [{"text": "ping"}]}]}
+
+    runner, transports = await start_stub(args.port, server_ssl)
+
+    try:
+        # Legacy strategy: new session (and connector) for every call
+        async def per_call():
+            async with aiohttp.ClientSession() as session:
+                async with session.post(url, json=payload, ssl=client_ssl) as response:
+                    await response.json()
+
+        transports.clear()
+        legacy = await run_calls(per_call, args.calls, args.concurrency)
+        legacy_conns = len(transports)
+
+        # Pooled strategy: one shared connector configured like GeminiService.start()
+        connector = aiohttp.TCPConnector(
+            limit=settings.GEMINI_POOL_SIZE,
+            limit_per_host=settings.GEMINI_POOL_PER_HOST,
+            keepalive_timeout=settings.GEMINI_KEEPALIVE_TIMEOUT,
+            ttl_dns_cache=settings.GEMINI_DNS_CACHE_TTL,
+            ssl=client_ssl,
+        )
+        async with aiohttp.ClientSession(connector=connector) as shared:
+            async def pooled():
+                async with shared.post(url, json=payload) as response:
+                    await response.json()
+
+            transports.clear()
+            pooled_elapsed = await run_calls(pooled, args.calls, args.concurrency)
+            pooled_conns = len(transports)
+    finally:
+        await runner.cleanup()
+
+    print(f"Stub: {url} ({args.calls} calls, concurrency={args.concurrency})")
+    print(f"{'strategy':<12}{'total ms':>12}{'per call ms':>14}{'connections':>14}")
+    for label, elapsed, conns in (
+        ("per-call", legacy, legacy_conns),
+        ("pooled", pooled_elapsed, pooled_conns),
+    ):
+        print(f"{label:<12}{elapsed * 1000:>12.1f}{elapsed * 1000 / args.calls:>14.3f}{conns:>14}")
+    print(f"Speedup: {legacy / pooled_elapsed:.2f}x")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--calls", type=int, default=200)
+    parser.add_argument("--concurrency", type=int, default=1)
+    parser.add_argument("--port", type=int, default=18599)
+    parser.add_argument("--no-tls", dest="tls", action="store_false")
+    asyncio.run(main(parser.parse_args()))
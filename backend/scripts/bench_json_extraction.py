@@ -0,0 +1,128 @@
+#!/usr/bin/env python3
+"""
+Benchmark: LLM JSON extraction, previous multi-strategy parser vs json_extraction
+
+Runs both extractors over a corpus of response shapes seen from Gemini
+(clean JSON, markdown fences, prose around the payload, trailing commas,
+single quotes, Python literals, truncated output) and reports how many
+each one recovers and the time per call.
+
+Usage:
+    python scripts/bench_json_extraction.py [--iterations 2000]
+"""
+import argparse
+import json
+import re
+import sys
+import time
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.services.json_extraction import extract_json
+
+INTENT = '{"profession":"product-manager","professionLabel":"Product Manager","hobby":"hiking","hobbyLabel":"Hiking","name":null,"confidence":0.9}'
+
+TOOLKIT = json.dumps({
+    "workTools": [
+        {"name": f"Tool {i}", "logo": "#10A37F", "rating": 4.8, "description": "Drafts specs and summarises meetings.",
+         "ctaText": "Try Free", "category": "Productivity", "price": 20}
+        for i in range(4)
+    ],
+    "lifeTools": [
+        {"name": "AllTrails", "description": "Trail maps with AI route suggestions.",
+         "backgroundImage": "https://images.unsplash.com/photo-1551632811-561732d1e306?w=800&q=80"}
+        for _ in range(2)
+    ],
+    "specs": {"totalTools": 6, "monthlyCost": 40, "primaryGoal": "Productivity", "freeTools": 4, "paidTools": 2},
+    "description": "A toolkit for a PM who's into the outdoors.",
+    "longDescription": "Work tools for roadmaps and specs, life tools for planning hikes.",
+}, indent=2)
+
+CORPUS = {
+    "clean_intent": INTENT,
+    "clean_toolkit": TOOLKIT,
+    "fenced": f"```json\n{INTENT}\n```",
+    "fenced_toolkit": f"Here's your toolkit:\n```json\n{TOOLKIT}\n```\nLet me know if you'd like changes!",
+    "prose_around": f"Sure! Based on the text, here is the result: {INTENT} Hope that helps.",
+    "trailing_comma": INTENT[:-1] + ",}",
+    "trailing_comma_toolkit": TOOLKIT.replace("}\n  ]", "},\n  ]"),
+    "single_quotes": INTENT.replace('"', "'").replace("null", "None"),
+    "python_literals": '{"profession": "developer", "hobby": "gaming", "name": None, "verified": True}',
+    "apostrophe_prose": f"The user's profession isn't stated {{exactly}}, but: {INTENT}",
+    "truncated": INTENT[:70],
+    "truncated_toolkit": TOOLKIT[:len(TOOLKIT) // 2],
+    "nested_profession": '{"result": {"profession": "designer", "hobby": "art"}, "note": "ok"}',
+    "no_json": "PROFESSION: designer, HOBBY: photography",
+}
+
+
+def legacy_extract(response: str) -> Optional[Dict[str, Any]]:
+    """The multi-strategy extractor previously in GeminiService"""
+    response = response.strip()
+    try:
+        return json.loads(response)
+    except Exception:
+        pass
+    if "```" in response:
+        match = re.search(r'```(?:json)?\s*(\{.*?\})\s*```', response, re.DOTALL)
+        if match:
+            try:
+                return json.loads(match.group(1))
+            except Exception:
+                pass
+    match = re.search(r'\{[^{}]*"profession"[^{}]*\}', response, re.DOTALL)
+    if match:
+        try:
+            return json.loads(match.group(0))
+        except Exception:
+            pass
+    first_brace = response.find('{')
+    last_brace = response.rfind('}')
+    if first_brace != -1 and last_brace != -1 and last_brace > first_brace:
+        json_str = response[first_brace:last_brace + 1]
+        try:
+            return json.loads(json_str)
+        except Exception:
+            json_str = json_str.replace("'", '"')
+            json_str = re.sub(r',\s*}', '}', json_str)
+            try:
+                return json.loads(json_str)
+            except Exception:
+                pass
+    return None
+
+
+def time_per_call(fn, text: str, iterations: int) -> float:
+    start = time.perf_counter()
+    for _ in range(iterations):
+        fn(text)
+    return (time.perf_counter() - start) / iterations * 1e6
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--iterations", type=int, default=2000)
+    args = parser.parse_args()
+
+    print(f"{'case':<24} {'legacy':>14} {'new':>14}")
+    totals = {"legacy": [0, 0.0], "new": [0, 0.0]}
+    for case, text in CORPUS.items():
+        row = [f"{case:<24}"]
+        for label, fn in (("legacy", legacy_extract), ("new", extract_json)):
+            ok = fn(text) is not None
+            us = time_per_call(fn, text, args.iterations)
+            totals[label][0] += ok
+            totals[label][1] += us
+            row.append(f"{'ok' if ok else '--':>3} {us:8.1f}us")
+        print(" ".join(row))
+
+    print()
+    for label, (ok, us) in totals.items():
+        print(f"{label:<8} recovered {ok}/{len(CORPUS)}  total {us:8.1f}us per corpus pass")
+
+
+if __name__ == "__main__":
+    main()
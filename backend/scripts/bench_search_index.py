@@ -0,0 +1,136 @@
+#!/usr/bin/env python3
+"""
+Benchmark: in-process tool search (BM25 + prefix + trigram) at catalog scale
+
+Builds a SearchIndex over a synthetic catalog (Zipf-distributed vocabulary,
+like real descriptions), checks its top-k against exhaustive BM25 scoring,
+and reports per-query latency by query kind next to the substring scan it
+replaces.
+
+Usage:
+    python scripts/bench_search_index.py [--tools 100000] [--queries 300]
+"""
+import argparse
+import itertools
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.data.catalog_index import row_rank
+from app.data.search_index import ROW_TEXT_FIELDS, SearchIndex
+
+# English letter frequencies (%), so the words share trigrams the way real ones do
+LETTERS = "etaoinshrdlcumwfgypbvkjxqz"
+LETTER_WEIGHTS = [12.7, 9.1, 8.2, 7.5, 7.0, 6.7, 6.3, 6.1, 6.0, 4.3, 4.0, 2.8, 2.8, 2.4, 2.4, 2.2,
+                  2.0, 2.0, 1.9, 1.5, 1.0, 0.8, 0.2, 0.2, 0.1, 0.1]
+LETTER_CUM_WEIGHTS = list(itertools.accumulate(LETTER_WEIGHTS))
+
+
+def vocabulary(size: int, rng: random.Random) -> list:
+    """Distinct pseudo-words, in random order (rank = Zipf frequency rank)"""
+    words = {}
+    while len(words) < size:
+        words["".join(rng.choices(LETTERS, cum_weights=LETTER_CUM_WEIGHTS, k=rng.randint(3, 10)))] = None
+    return list(words)
+
+
+def synthetic_catalog(count: int, rng: random.Random) -> tuple:
+    words = vocabulary(20000, rng)
+    cum_weights = list(itertools.accumulate(1 / (rank + 1) for rank in range(len(words))))  # Zipf
+
+    def text(n):
+        return " ".join(rng.choices(words, cum_weights=cum_weights, k=n))
+
+    tools = [
+        {
+            "id": f"tool-{i}",
+            "name": text(rng.randint(1, 2)).title(),
+            "description": text(rng.randint(8, 20)),
+            "tags": rng.choices(words[:2000], k=rng.randint(2, 5)),
+            "features": [text(2) for _ in range(rng.randint(0, 4))],
+            "rating": rng.choice([4.2, 4.5, 4.7, 4.8, 4.9]),
+            "price_monthly": rng.choice([0, 8, 20]),
+        }
+        for i in range(count)
+    ]
+    return tools, words
+
+
+def typo(word: str, rng: random.Random) -> str:
+    i = rng.randrange(len(word) - 1)
+    return word[:i] + word[i + 1] + word[i] + word[i + 2:]
+
+
+def queries(words: list, count: int, rng: random.Random) -> dict:
+    common, rare = words[:200], words[2000:]
+    return {
+        "one common word": [rng.choice(common) for _ in range(count)],
+        "one rare word": [rng.choice(rare) for _ in range(count)],
+        "two words": [f"{rng.choice(common)} {rng.choice(rare)}" for _ in range(count)],
+        "three words": [" ".join(rng.choice(words[:5000]) for _ in range(3)) for _ in range(count)],
+        "prefix (typing)": [rng.choice(words[:5000])[:4] for _ in range(count)],
+        "typo": [typo(rng.choice([w for w in rare if len(w) >= 6]), rng) for _ in range(count)],
+    }
+
+
+def exhaustive(index: SearchIndex, query: str, limit: int) -> list:
+    """Reference: score every document with the same query expansion"""
+    groups = index._expand(query)
+    scores = sorted((index._score(doc, groups) for doc in range(len(index))), reverse=True)
+    return [s for s in scores[:limit] if s > 0]
+
+
+def percentile(samples: list, q: float) -> float:
+    return sorted(samples)[min(len(samples) - 1, int(q * len(samples)))]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--tools", type=int, default=100000)
+    parser.add_argument("--queries", type=int, default=300)
+    parser.add_argument("--limit", type=int, default=10)
+    parser.add_argument("--verify", type=int, default=5, help="Queries per kind checked exhaustively")
+    args = parser.parse_args()
+
+    rng = random.Random(42)
+    tools, words = synthetic_catalog(args.tools, rng)
+
+    start = time.perf_counter()
+    index = SearchIndex(tools, ROW_TEXT_FIELDS, row_rank)
+    print(f"{len(index)} tools, {index.vocabulary_size} terms, built in {time.perf_counter() - start:.1f}s")
+
+    workload = queries(words, args.queries, rng)
+
+    for kind, batch in workload.items():
+        for query in batch[:args.verify]:
+            got = [score for _, score in index.search(query, args.limit)]
+            expected = exhaustive(index, query, args.limit)
+            assert [round(s, 4) for s in got] == [round(s, 4) for s in expected], (kind, query, got, expected)
+    print(f"top-{args.limit} matches exhaustive scoring on {args.verify} queries per kind\n")
+
+    names = [t["name"].lower() for t in tools]
+    print(f"{'query kind':<18} {'p50 ms':>8} {'p95 ms':>8} {'max ms':>8} {'scan p50 ms':>12}")
+    for kind, batch in workload.items():
+        samples = []
+        for query in batch:
+            start = time.perf_counter()
+            index.search(query, args.limit)
+            samples.append((time.perf_counter() - start) * 1000)
+
+        scans = []
+        for query in batch[:20]:
+            start = time.perf_counter()
+            [n for n in names if query in n][:args.limit]
+            scans.append((time.perf_counter() - start) * 1000)
+
+        print(f"{kind:<18} {statistics.median(samples):>8.3f} {percentile(samples, 0.95):>8.3f} "
+              f"{max(samples):>8.3f} {statistics.median(scans):>12.3f}")
+
+
+if __name__ == "__main__":
+    main()
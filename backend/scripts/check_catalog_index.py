@@ -0,0 +1,102 @@
+#!/usr/bin/env python3
+"""
+Check CatalogIndex.top() against a brute-force reference, NumPy path included
+
+The production catalog is far below VECTOR_MIN_POSTINGS, so the vector
+product in catalog_index.py is only reached by large catalogs. This builds
+synthetic ones (see bench_catalog_scoring.py), runs random multi-term
+queries at every kind of limit, and compares three ways of answering them
+with a sort of the matching tools: top() as it chooses, the k-way merge
+alone, and the product forced. It fails unless the product actually ran,
+both forced and by top()'s own choice.
+
+Usage:
+    python scripts/check_catalog_index.py [--sizes 10000,100000] [--queries 200]
+"""
+import argparse
+import random
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.data.catalog_index import NUMPY_AVAILABLE, TOOL_FIELDS, CatalogIndex, tool_rank
+from bench_catalog_scoring import synthetic_catalog
+
+FIELDS = ("professions", "hobbies", "tags", "profession_tokens")
+
+
+def tool_keys(tool) -> frozenset:
+    """Every (field, key) a tool is indexed under, lowered as in CatalogIndex"""
+    professions = [p.lower() for p in tool.professions]
+    return frozenset(
+        [("professions", p) for p in professions]
+        + [("hobbies", h.lower()) for h in tool.hobbies]
+        + [("tags", g.lower()) for g in tool.tags]
+        + [("profession_tokens", w) for p in professions for w in p.split("-")]
+    )
+
+
+def reference(ranked_keys: list, terms: list, limit) -> list:
+    """Matching tool ids in rank order, by scanning the whole catalog"""
+    terms = set(terms)
+    return [tool_id for tool_id, keys in ranked_keys if not keys.isdisjoint(terms)][:limit]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--sizes", default="10000,100000")
+    parser.add_argument("--queries", type=int, default=200)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    if not NUMPY_AVAILABLE:
+        sys.exit("numpy is required: pip install numpy")
+
+    rng = random.Random(args.seed)
+    for size in (int(s) for s in args.sizes.split(",")):
+        index = CatalogIndex(synthetic_catalog(size, rng), TOOL_FIELDS, tool_rank)
+        if not index._vectors:
+            sys.exit(f"FAIL {size} tools: no posting list reaches VECTOR_MIN_POSTINGS")
+
+        products = 0
+        product = index._product
+
+        def counted(terms, limit):
+            nonlocal products
+            products += 1
+            return product(terms, limit)
+
+        index._product = counted
+        vocabulary = [(field, key) for field in FIELDS for key in index.keys(field)]
+        ranked_keys = [(tool.id, tool_keys(tool)) for tool in index.ranked]
+        chosen = 0
+        for _ in range(args.queries):
+            terms = rng.sample(vocabulary, rng.randint(2, 5))
+            limit = rng.choice([None, 1, 10, 100, 1000, size])
+            expected = reference(ranked_keys, terms, limit)
+            ids = lambda tools: [t.id for t in tools]
+
+            before = products
+            got = ids(index.top(*terms, limit=limit))
+            chosen += products > before
+            vectors = index._vectors
+            index._vectors = {}
+            merged = ids(index.top(*terms, limit=limit))
+            index._vectors = vectors
+            index._product_is_cheaper = lambda lists, limit: True
+            forced = ids(index.top(*terms, limit=limit))
+            del index._product_is_cheaper
+
+            if not got == merged == forced == expected:
+                sys.exit(f"MISMATCH {size} tools, terms={terms} limit={limit}")
+
+        if not chosen:
+            sys.exit(f"FAIL {size} tools: top() never chose the vector product")
+        print(f"OK: {args.queries} queries over {size} tools, {len(index._vectors)} vectors, "
+              f"product chosen by top() {chosen} times")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Check the get_profession_tools SQL function against a local Postgres
+
+Applies schema.sql and the migrations to a scratch schema, seeds a random
+catalog, and compares the function's result for every profession and
+limit with CatalogSnapshot.tools_by_profession (the in-process reference
+for the same ordering). The scratch schema is dropped afterwards.
+
+Requires psycopg (pip install "psycopg[binary]") and a Postgres you can
+create schemas in.
+
+Usage:
+    python scripts/check_profession_rpc.py --dsn postgresql://localhost/postgres [--tools 500]
+"""
+import argparse
+import os
+import random
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+try:
+    import psycopg
+    from psycopg.rows import dict_row
+except ImportError:
+    sys.exit('psycopg is required: pip install "psycopg[binary]"')
+
+from app.database.catalog_snapshot import CatalogSnapshot
+
+DATABASE_DIR = Path(__file__).parent.parent / "app" / "database"
+SCHEMA = "rpc_check"
+
+PROFESSIONS = ["developer", "designer", "marketer", "writer", "student"]
+# A handful of tools (short result, LLM backfill) and none at all
+RARE_PROFESSION = "nurse"
+UNKNOWN_PROFESSION = "astronaut"
+CATEGORIES = ["llm", "code_assistant", "design", "marketing", "writing"]
+
+
+def random_tools(count: int, rng: random.Random) -> list:
+    """Catalog with rating/price ties, inactive rows and LLMs tagged with professions"""
+    return [
+        {
+            "id": f"tool-{i:05d}",
+            "name": f"Tool {i}",
+            "description": "Seeded by check_profession_rpc",
+            "website_url": "https://example.com",
+            "category_id": rng.choice(CATEGORIES),
+            "rating": rng.choice([3.9, 4.5, 4.7, 4.8, 4.9]),
+            "price_monthly": rng.choice([0, 8, 20]),
+            "professions": rng.sample(PROFESSIONS, rng.randint(0, 2))
+            + ([RARE_PROFESSION] if rng.random() < 0.02 else []),
+            "is_active": rng.random() > 0.1,
+        }
+        for i in range(count)
+    ]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--dsn", default=os.getenv("DATABASE_URL", "postgresql://localhost/postgres"))
+    parser.add_argument("--tools", type=int, default=500)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    tools = random_tools(args.tools, random.Random(args.seed))
+    migrations = sorted((DATABASE_DIR / "migrations").glob("*.sql"))
+
+    with psycopg.connect(args.dsn, autocommit=True, row_factory=dict_row) as conn:
+        conn.execute(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE")
+        conn.execute(f"CREATE SCHEMA {SCHEMA}")
+        conn.execute(f"SET search_path TO {SCHEMA}, public")
+        try:
+            conn.execute((DATABASE_DIR / "schema.sql").read_text())
+            for migration in migrations:
+                conn.execute(migration.read_text())
+
+            with conn.cursor() as cur:
+                cur.executemany(
+                    "INSERT INTO ai_tools (id, name, description, website_url, category_id,"
+                    " rating, price_monthly, professions, is_active)"
+                    " VALUES (%(id)s, %(name)s, %(description)s, %(website_url)s, %(category_id)s,"
+                    " %(rating)s, %(price_monthly)s, %(professions)s, %(is_active)s)",
+                    tools
+                )
+
+            snapshot = CatalogSnapshot(tools, [])
+            checked = 0
+            for profession in PROFESSIONS + [RARE_PROFESSION, UNKNOWN_PROFESSION]:
+                for limit in (1, 2, 4, 5, 10, 50):
+                    rows = conn.execute(
+                        "SELECT id FROM get_profession_tools(%s, %s)", (profession, limit)
+                    ).fetchall()
+                    got = [r["id"] for r in rows]
+                    expected = [t["id"] for t in snapshot.tools_by_profession(profession, limit)]
+                    if got != expected:
+                        sys.exit(f"MISMATCH {profession} limit={limit}\n  sql:      {got}\n  expected: {expected}")
+                    checked += 1
+        finally:
+            conn.execute(f"DROP SCHEMA IF EXISTS {SCHEMA} CASCADE")
+
+    print(f"OK: {checked} profession/limit combinations match over {len(tools)} tools "
+          f"({', '.join(m.name for m in migrations)})")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,66 @@
+#!/usr/bin/env python3
+"""
+Check which /api/suggest queries the catalog answers on its own
+
+Runs ToolSuggester against the local fallback catalog (no Supabase) with
+Gemini replaced by a recorder, and pins, per query, the tools that must
+or must not reach SUGGEST_MIN_RELEVANCE and whether Gemini is asked for
+the rest. A tool matching one word of a two-word query ("video" of
+"video editing") must not count as relevant.
+
+Usage:
+    python scripts/check_suggest_relevance.py
+"""
+import asyncio
+import sys
+from pathlib import Path
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from app.config import settings
+from app.database.tools_repository import tools_repository
+from app.services.tool_suggester import tool_suggester
+
+# query: (limit, tools that must be relevant, tools that must not be, Gemini asked)
+EXPECTED = {
+    "video editing": (5, (), ("Hemingway Editor", "Loom", "Discord"), True),
+    "photo editing": (5, (), ("Hemingway Editor",), True),
+    "write emails": (5, (), ("TripIt", "Semrush"), True),
+    "coding assistant": (5, ("ChatGPT", "GitHub Copilot"), ("Grammarly", "Buffer"), True),
+    "data analysis": (5, (), ("Streamlit", "Kaggle", "Hex", "Amplitude"), True),
+    "meeting notes": (1, ("Otter.ai",), ("Notion",), False),
+    "social media scheduling": (1, ("Buffer",), (), False),
+    "code": (2, ("GitHub Copilot", "ChatGPT"), (), False),
+}
+
+
+async def main():
+    tools_repository._use_fallback = True
+    asked = []
+
+    async def suggest_tools(query, category=None, limit=5, exclude=None):
+        asked.append(query)
+        return []
+
+    tool_suggester.gemini.suggest_tools = suggest_tools
+    failures = []
+    for query, (limit, must, must_not, llm) in EXPECTED.items():
+        del asked[:]
+        suggestions = await tool_suggester.suggest(query, limit=limit)
+        relevant = {s["name"] for s in suggestions if s["relevanceScore"] >= settings.SUGGEST_MIN_RELEVANCE}
+        problems = [f"{name} not relevant" for name in must if name not in relevant]
+        problems += [f"{name} relevant" for name in must_not if name in relevant]
+        if bool(asked) != llm:
+            problems.append("Gemini asked" if asked else "Gemini not asked")
+        status = "FAIL" if problems else "ok"
+        print(f"{status:<5} {query!r}: relevant {sorted(relevant)}, Gemini {'asked' if asked else 'not asked'}")
+        failures += [f"{query!r}: {p}" for p in problems]
+
+    if failures:
+        sys.exit("\n".join(["FAILED:"] + failures))
+    print(f"OK: {len(EXPECTED)} queries")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,121 @@
+#!/usr/bin/env python3
+"""
+Load test: AIToolsRepository with blocking vs thread-pool supabase queries
+
+Starts a local PostgREST stand-in (in its own thread and event loop) that
+answers every table query after a fixed latency, points a real supabase-py
+client at it, and drives get_tools_by_hobby() at increasing concurrency.
+
+- blocking: execute() called directly on the event loop (previous behaviour)
+- offload:  execute() run on the repository's bounded thread pool
+
+With blocking calls throughput stays flat at ~1/latency whatever the
+concurrency; with the offload it scales until the pool is saturated.
+
+Usage:
+    python scripts/load_test_repository.py [--latency-ms 50] [--requests 200] [--workers 16]
+"""
+import argparse
+import asyncio
+import socket
+import sys
+import threading
+import time
+from pathlib import Path
+
+from aiohttp import web
+
+# Add parent directory to path
+sys.path.insert(0, str(Path(__file__).parent.parent))
+
+from supabase import create_client
+
+from app.database.tools_repository import AIToolsRepository
+
+# Any JWT-shaped string passes supabase-py's client-side key check
+STUB_KEY = "eyJhbGciOiJIUzI1NiJ9.eyJyb2xlIjoiYW5vbiJ9.c3R1Yg"
+
+STUB_ROWS = [
+    {"id": "strava", "name": "Strava", "hobbies": ["hiking"], "rating": 4.8, "category_id": "fitness"},
+    {"id": "alltrails", "name": "AllTrails", "hobbies": ["hiking"], "rating": 4.7, "category_id": "fitness"},
+]
+
+
+class BlockingRepository(AIToolsRepository):
+    """The repository as it was: execute() blocks the event loop"""
+
+    async def _execute(self, query):
+        self.queries += 1
+        return query.execute()
+
+
+def start_postgrest_stub(latency: float) -> str:
+    """Serve /rest/v1/<table> with a fixed latency; returns the base URL"""
+    with socket.socket() as sock:
+        sock.bind(("127.0.0.1", 0))
+        port = sock.getsockname()[1]
+
+    async def table(request: web.Request) -> web.Response:
+        await asyncio.sleep(latency)
+        return web.json_response(STUB_ROWS)
+
+    ready = threading.Event()
+
+    def serve():
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+        app = web.Application()
+        app.router.add_get("/rest/v1/{table}", table)
+        runner = web.AppRunner(app, access_log=None)
+        loop.run_until_complete(runner.setup())
+        loop.run_until_complete(web.TCPSite(runner, "127.0.0.1", port).start())
+        ready.set()
+        loop.run_forever()
+
+    threading.Thread(target=serve, daemon=True).start()
+    ready.wait()
+    return f"http://127.0.0.1:{port}"
+
+
+async def run(repo: AIToolsRepository, requests: int, concurrency: int) -> float:
+    """Issue `requests` lookups with `concurrency` workers; returns req/s"""
+    remaining = requests
+
+    async def worker():
+        nonlocal remaining
+        while remaining > 0:
+            remaining -= 1
+            tools = await repo.get_tools_by_hobby("hiking")
+            assert tools, "stub returned no rows"
+
+    start = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return requests / (time.perf_counter() - start)
+
+
+async def main():
+    parser = argparse.ArgumentParser(description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter)
+    parser.add_argument("--latency-ms", type=float, default=50.0)
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--workers", type=int, default=16, help="Repository thread pool size")
+    parser.add_argument("--concurrency", type=int, nargs="+", default=[1, 4, 16, 32])
+    args = parser.parse_args()
+
+    url = start_postgrest_stub(args.latency_ms / 1000)
+    client = create_client(url, STUB_KEY)
+
+    print(f"PostgREST stand-in at {url}, latency {args.latency_ms:.0f}ms, pool {args.workers} threads")
+    print(f"{'concurrency':>11} {'blocking req/s':>15} {'offload req/s':>14}")
+    for concurrency in args.concurrency:
+        rates = []
+        for cls in (BlockingRepository, AIToolsRepository):
+            repo = cls(max_workers=args.workers)
+            repo._client = client
+            await run(repo, min(args.requests, 20), concurrency)  # Warm up connections
+            rates.append(await run(repo, args.requests, concurrency))
+            await repo.close()
+        print(f"{concurrency:>11} {rates[0]:>15.1f} {rates[1]:>14.1f}")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())